@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for clean_text() over the descriptions in a Jira XML export.
+
+Compares the single-pass converter in parse_jira_xml.py against the previous
+chain of ``re.sub`` passes, which is kept here as the baseline.
+"""
+
+import argparse
+import html
+import re
+import timeit
+from pathlib import Path
+from xml.etree import ElementTree as ET
+
+from parse_jira_xml import clean_text
+
+
+def legacy_clean_text(text: str) -> str:
+    """Previous multi-pass regex implementation of clean_text()."""
+    if not text:
+        return ""
+
+    text = html.unescape(text)
+
+    text = text.replace("&amp;", "&")
+    text = text.replace("&lt;", "<")
+    text = text.replace("&gt;", ">")
+    text = text.replace("&quot;", '"')
+    text = text.replace("&#39;", "'")
+
+    text = re.sub(r"<p[^>]*>", "\n\n", text)
+    text = re.sub(r"</p>", "", text)
+    text = re.sub(r"<br\s*/?>", "\n", text)
+    text = re.sub(
+        r"<(b|strong)[^>]*>(.*?)</(b|strong)>", r"**\2**", text, flags=re.DOTALL
+    )
+    text = re.sub(r"<(i|em)[^>]*>(.*?)</(i|em)>", r"*\2*", text, flags=re.DOTALL)
+    text = re.sub(r"<ul[^>]*>", "", text)
+    text = re.sub(r"</ul>", "", text)
+    text = re.sub(r"<li[^>]*>", "- ", text)
+    text = re.sub(r"</li>", "", text)
+    text = re.sub(r"<ol[^>]*>", "", text)
+    text = re.sub(r"</ol>", "", text)
+    text = re.sub(r"<[^>]+>", "", text)
+
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = re.sub(r"[ \t]+", " ", text)
+    return text.strip()
+
+
+def load_descriptions(xml_path: Path) -> list[str]:
+    """Collect the raw summary and description text of every issue."""
+    root = ET.parse(xml_path).getroot()
+    return [
+        elem.text
+        for elem in root.iter()
+        if elem.tag in ("summary", "description") and elem.text
+    ]
+
+
+def main():
+    """Time both implementations and print the speedup."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark clean_text() against the legacy regex chain",
+    )
+    parser.add_argument(
+        "xml_file",
+        type=str,
+        nargs="?",
+        default=str(Path(__file__).parent.parent / "Jira (1).xml"),
+        help="Path to Jira XML export file (default: bundled 'Jira (1).xml')",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Timing repetitions; the best run is reported (default: 5)",
+    )
+    parser.add_argument(
+        "--number",
+        type=int,
+        default=20,
+        help="Passes over all texts per repetition (default: 20)",
+    )
+    args = parser.parse_args()
+
+    texts = load_descriptions(Path(args.xml_file))
+    total_chars = sum(len(t) for t in texts)
+    print(f"Loaded {len(texts)} texts ({total_chars:,} characters)")
+
+    def run(func):
+        for text in texts:
+            func(text)
+
+    results = {}
+    for name, func in (("legacy", legacy_clean_text), ("single-pass", clean_text)):
+        best = min(
+            timeit.repeat(lambda f=func: run(f), repeat=args.repeat, number=args.number)
+        )
+        per_pass = best / args.number
+        results[name] = per_pass
+        print(
+            f"  {name:<12} {per_pass * 1000:8.2f} ms/pass "
+            f"({total_chars / per_pass / 1e6:6.1f} MB/s)"
+        )
+
+    print(f"\nSpeedup: {results['legacy'] / results['single-pass']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
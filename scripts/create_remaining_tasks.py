@@ -5,30 +5,32 @@ This provides the batch JSON for batch_create_issues tool
 """
 
 import json
-from pathlib import Path
 
-json_path = Path(__file__).parent.parent / "docs" / "pm" / "farmacias-macross-jira-import.json"
+from import_to_jira import DEFAULT_PLAN, KeyMap, default_key_map_path, load_project_key
+from jira_import_journal import ImportJournal, default_journal_path
+
+json_path = DEFAULT_PLAN
 
 with open(json_path, 'r', encoding='utf-8') as f:
     data = json.load(f)
 
-# Story mapping: JSON story key -> Jira story key
-story_mapping = {
-    "FM-1-1": "FM-5", "FM-1-2": "FM-6", "FM-1-3": "FM-7", "FM-1-4": "FM-8",
-    "FM-2-1": "FM-9", "FM-2-2": "FM-10", "FM-2-3": "FM-11", "FM-2-4": "FM-12",
-    "FM-3-1": "FM-13", "FM-3-2": "FM-14", "FM-3-3": "FM-15", "FM-3-4": "FM-16", "FM-3-5": "FM-17",
-    "FM-4-1": "FM-18", "FM-4-2": "FM-19", "FM-4-3": "FM-20", "FM-4-4": "FM-21"
-}
-
-# Tasks already created (first 13)
-created_tasks = [
-    "FM-1-1-1", "FM-1-1-2", "FM-1-1-3",  # FM-22, FM-23, FM-24
-    "FM-1-2-1", "FM-1-2-2", "FM-1-2-3", "FM-1-2-4", "FM-1-2-5", 
-    "FM-1-2-6", "FM-1-2-7", "FM-1-2-8", "FM-1-2-9", "FM-1-2-10"  # FM-25 to FM-34
-]
+# Planning key -> Jira key of every issue created so far: the key map written
+# by import_to_jira.py with its journal replayed over it
+key_map_path = default_key_map_path(json_path)
+key_map = KeyMap(key_map_path, ImportJournal(default_journal_path(key_map_path)))
+project_key = load_project_key(json_path)
+
+print(f"Key map {key_map.path}: {len(key_map)} issues already created")
+in_doubt = [t['key'] for t in data['tasks'] if t['key'] in key_map.in_doubt]
+if in_doubt:
+    # They may exist in Jira; import_to_jira.py checks them before creating
+    print(f"Skipping {len(in_doubt)} tasks from unanswered requests: {', '.join(in_doubt)}")
+    print("  Run scripts/import_to_jira.py to settle them first")
 
 # Get remaining tasks
-remaining_tasks = [t for t in data['tasks'] if t['key'] not in created_tasks]
+remaining_tasks = [
+    t for t in data['tasks'] if t['key'] not in key_map and t['key'] not in key_map.in_doubt
+]
 
 print(f"Remaining tasks to create: {len(remaining_tasks)}")
 print("\nGrouped by story:\n")
@@ -43,13 +45,13 @@ for task in remaining_tasks:
 
 # Print batches for easy copy-paste
 for story_key, tasks in sorted(by_story.items()):
-    jira_story = story_mapping[story_key]
+    jira_story = key_map.get(story_key) or "story not created yet"
     print(f"\n{story_key} ({jira_story}) - {len(tasks)} tasks:")
     print(f"  Batch JSON for batch_create_issues:")
     batch = []
     for task in tasks:
         batch.append({
-            "project_key": "FM",
+            "project_key": project_key,
             "summary": task['summary'],
             "issue_type": "Task",
             "description": task['description']
@@ -57,7 +59,5 @@ for story_key, tasks in sorted(by_story.items()):
     print(json.dumps(batch, indent=2, ensure_ascii=False))
     print(f"\n  Then link all to {jira_story} using create_issue_link")
 
-
-
-
-
+print("\nOr create every link at once from a fresh export:")
+print('  python scripts/jira_links.py "Jira (1).xml"')
@@ -1,28 +1,793 @@
 #!/usr/bin/env python3
 """
-Script to import all Epics, Stories, and Tasks from JSON to Jira
-Uses Jira REST API via MCP or direct API calls
+Import the Epics, Stories and Tasks of a planning JSON file into Jira.
+
+Reads ``docs/pm/farmacias-macross-jira-import.json`` (``epics``, ``stories``
+with their ``epic``, ``tasks`` with their ``story``) and creates epics,
+stories linked to their epic and tasks as subtasks of their story. The plan
+is scheduled as a dependency graph: each issue is sent as soon as its parent
+has a Jira key, through the bulk-create endpoint in batches of up to 50
+issues, with several batches in flight under a shared rate limit. The
+critical path (the dependency chain that finished last) is reported with its
+queueing and request times.
+
+Every created issue is recorded in a key map (planning key -> Jira key)
+persisted next to the plan, so a rerun only creates what is still missing
+and children always find their parent's Jira key. Each create request and
+its outcome are appended to a journal (see ``jira_import_journal``) as they
+happen, so an interrupted import resumes exactly where it stopped: only the
+issues of requests that never got an answer are looked up in Jira (one JQL
+search) before the rest of the plan is sent. The plan's dependencies (and
+story links of tasks created outside this script) are created afterwards by
+jira_links.py.
+
+Usage:
+    python scripts/import_to_jira.py --dry-run
+    JIRA_URL=... JIRA_USERNAME=... JIRA_API_TOKEN=... \\
+        python scripts/import_to_jira.py --concurrency 4 --rate 5
 """
 
+import argparse
 import json
+import os
 import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Any
+
+from jira_client import BULK_CREATE_LIMIT, JiraClient, JiraError
+from jira_import_journal import ImportJournal, default_journal_path
+
+PM_DIR = Path(__file__).parent.parent / "docs" / "pm"
+DEFAULT_PLAN = PM_DIR / "farmacias-macross-jira-import.json"
+
+# Planning levels; each level's parent is in the level before it
+LEVELS = ("epic", "story", "task")
+
+
+@dataclass(slots=True)
+class PlannedIssue:
+    """An epic, story or task from the planning JSON."""
+
+    key: str
+    level: str
+    summary: str
+    description: str = ""
+    priority: str = ""
+    labels: list[str] = field(default_factory=list)
+    story_points: float | None = None
+    # Planning key of the epic (for stories) or story (for tasks)
+    parent: str | None = None
+
+
+@dataclass(slots=True)
+class FieldConfig:
+    """Issue type names and custom field ids of the target Jira project."""
+
+    epic_type: str = "Epic"
+    story_type: str = "Story"
+    subtask_type: str = "Subtask"
+    # Required on Server/DC and older company-managed projects
+    epic_name_field: str | None = None
+    # Without it, stories are attached to their epic through ``parent``
+    epic_link_field: str | None = None
+    story_points_field: str | None = None
+
+
+def load_plan(path: Path) -> list[PlannedIssue]:
+    """Read the planning JSON into issues ordered epics, stories, tasks.
+
+    Args:
+        path: Planning JSON file
+
+    Returns:
+        Planned issues
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    plan = []
+    for epic in data.get("epics", []):
+        plan.append(
+            PlannedIssue(
+                key=epic["key"],
+                level="epic",
+                summary=epic["summary"],
+                description=epic.get("description", ""),
+                priority=epic.get("priority", ""),
+                labels=list(epic.get("labels", [])),
+            )
+        )
+    for story in data.get("stories", []):
+        plan.append(
+            PlannedIssue(
+                key=story["key"],
+                level="story",
+                summary=story["summary"],
+                description=story.get("description", ""),
+                priority=story.get("priority", ""),
+                labels=list(story.get("labels", [])),
+                story_points=story.get("storyPoints"),
+                parent=story.get("epic"),
+            )
+        )
+    for task in data.get("tasks", []):
+        plan.append(
+            PlannedIssue(
+                key=task["key"],
+                level="task",
+                summary=task["summary"],
+                description=task.get("description", ""),
+                priority=task.get("priority", ""),
+                labels=list(task.get("labels", [])),
+                story_points=task.get("storyPoints"),
+                parent=task.get("story"),
+            )
+        )
+    return plan
+
+
+def load_project_key(path: Path) -> str:
+    """Return the ``project.key`` of a planning JSON file."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["project"]["key"]
+
+
+class KeyMap:
+    """Planning key -> Jira key map persisted as JSON, safe across threads.
+
+    With a journal, created keys are appended to it as they arrive and the
+    JSON snapshot is only rewritten by ``save()``; loading replays the
+    journal over the snapshot.
+    """
+
+    def __init__(self, path: Path, journal: ImportJournal | None = None):
+        """
+        Load the map, starting empty if the file does not exist.
+
+        Args:
+            path: JSON file holding the map
+            journal: Journal recording create requests and their outcomes
+        """
+        self.path = path
+        self.journal = journal
+        self._keys: dict[str, str] = {}
+        self._lock = threading.Lock()
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                self._keys = json.load(f)
+        # Planning key -> when its unanswered create request was sent
+        self.in_doubt: dict[str, datetime] = {}
+        if journal is not None:
+            state = journal.replay()
+            self._keys.update(state.created)
+            self.in_doubt = {
+                key: sent
+                for key, sent in state.in_doubt.items()
+                if key not in self._keys
+            }
+
+    def __contains__(self, local_key: object) -> bool:
+        return local_key in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def get(self, local_key: str) -> str | None:
+        """Return the Jira key of a planning key, if it was created."""
+        return self._keys.get(local_key)
+
+    def remote_keys(self) -> set[str]:
+        """Return the Jira keys of every mapped issue."""
+        with self._lock:
+            return set(self._keys.values())
+
+    def update(self, created: dict[str, str], batch: str | None = None) -> None:
+        """Record created issues in the journal, or else on disk.
+
+        Args:
+            created: Planning key -> Jira key
+            batch: Journal id of the request that created them
+        """
+        with self._lock:
+            self._keys.update(created)
+            for key in created:
+                self.in_doubt.pop(key, None)
+        if self.journal is not None:
+            self.journal.created(batch, created)
+        else:
+            self.save()
+
+    def doubt(self, keys: list[str]) -> None:
+        """Record issues whose create request got no answer in this run.
+
+        Their journaled request has no outcome, so the next run checks them
+        in Jira (see ``recover_in_doubt()``).
+
+        Args:
+            keys: Planning keys
+        """
+        sent = datetime.now(timezone.utc)
+        with self._lock:
+            for key in keys:
+                if key not in self._keys:
+                    self.in_doubt.setdefault(key, sent)
+
+    def release(self, missing: dict[str, str]) -> None:
+        """Record in-doubt issues found not to exist, so they are created again.
+
+        Args:
+            missing: Planning key -> reason
+        """
+        with self._lock:
+            for key in missing:
+                self.in_doubt.pop(key, None)
+        if self.journal is not None:
+            self.journal.failed(None, missing)
+
+    def save(self) -> None:
+        """Write the map to disk atomically."""
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._keys, f, indent=2, ensure_ascii=False)
+                f.write("\n")
+            os.replace(tmp, self.path)
+
+
+def default_key_map_path(plan_path: Path) -> Path:
+    """Return the key map location next to a planning JSON file."""
+    stem = plan_path.stem.removesuffix("-import")
+    return plan_path.with_name(f"{stem}-keymap.json")
+
+
+def build_fields(
+    issue: PlannedIssue,
+    project_key: str,
+    parent_key: str | None,
+    config: FieldConfig,
+) -> dict[str, Any]:
+    """Build the Jira ``fields`` of a planned issue.
+
+    Args:
+        issue: Planned issue
+        project_key: Target project key
+        parent_key: Jira key of the issue's epic or story, if any
+        config: Target project configuration
+
+    Returns:
+        Fields for the create request
+    """
+    issue_type = {
+        "epic": config.epic_type,
+        "story": config.story_type,
+        "task": config.subtask_type,
+    }[issue.level]
+    fields: dict[str, Any] = {
+        "project": {"key": project_key},
+        "summary": issue.summary,
+        "issuetype": {"name": issue_type},
+    }
+    if issue.description:
+        fields["description"] = issue.description
+    if issue.priority:
+        fields["priority"] = {"name": issue.priority}
+    if issue.labels:
+        fields["labels"] = issue.labels
+    if issue.story_points is not None and config.story_points_field:
+        fields[config.story_points_field] = issue.story_points
+
+    if issue.level == "epic" and config.epic_name_field:
+        fields[config.epic_name_field] = issue.summary
+    elif parent_key:
+        if issue.level == "story" and config.epic_link_field:
+            fields[config.epic_link_field] = parent_key
+        else:
+            fields["parent"] = {"key": parent_key}
+    return fields
+
+
+@dataclass(slots=True)
+class IssueTiming:
+    """Seconds since the start of the import at each step of an issue."""
+
+    ready: float
+    sent: float = 0.0
+    done: float = 0.0
+
+
+@dataclass(slots=True)
+class ImportReport:
+    """Outcome of an import run."""
+
+    created: dict[str, str] = field(default_factory=dict)
+    skipped: int = 0
+    # Planning key -> reason
+    failed: dict[str, str] = field(default_factory=dict)
+    requests: int = 0
+    seconds: float = 0.0
+    # Planning key -> when it became ready, was sent and was answered
+    timings: dict[str, "IssueTiming"] = field(default_factory=dict)
+    # Dependency chain (root first) that finished last
+    critical_path: list[str] = field(default_factory=list)
+
+
+class BulkImporter:
+    """Creates planned issues through bulk-create requests, parents first."""
+
+    def __init__(
+        self,
+        client: JiraClient,
+        key_map: KeyMap,
+        project_key: str,
+        config: FieldConfig | None = None,
+        batch_size: int = BULK_CREATE_LIMIT,
+        concurrency: int = 4,
+    ):
+        """
+        Configure the importer.
+
+        Args:
+            client: Jira client (shared by the worker threads)
+            key_map: Persisted planning -> Jira key map
+            project_key: Target project key
+            config: Target project configuration
+            batch_size: Issues per bulk-create request (at most 50)
+            concurrency: Bulk-create requests in flight at once
+        """
+        self.client = client
+        self.key_map = key_map
+        self.project_key = project_key
+        self.config = config or FieldConfig()
+        self.batch_size = min(batch_size, BULK_CREATE_LIMIT)
+        self.concurrency = concurrency
+
+    def _create_batch(self, batch: list[PlannedIssue]) -> dict[str, Any]:
+        """Create one batch, journaling the request before it is sent.
+
+        Created keys and definite failures are journaled as soon as the
+        response arrives. Without a response (connection error, 5xx) Jira may
+        or may not have created the issues, so the request is left in doubt
+        and resolved by ``recover_in_doubt()`` on the next run.
+        """
+        journal = self.key_map.journal
+        updates = [
+            {
+                "fields": build_fields(
+                    issue,
+                    self.project_key,
+                    self.key_map.get(issue.parent) if issue.parent else None,
+                    self.config,
+                )
+            }
+            for issue in batch
+        ]
+        batch_id = journal.request([issue.key for issue in batch]) if journal else None
+        try:
+            results = self.client.bulk_create(updates)
+        except JiraError as e:
+            if e.status is None or e.status >= 500:
+                self.key_map.doubt([issue.key for issue in batch])
+                e = JiraError(f"{e} (outcome unknown, checked on the next run)")
+            elif journal is not None:
+                journal.failed(batch_id, {issue.key: str(e) for issue in batch})
+            return {issue.key: e for issue in batch}
+
+        outcome = dict(zip((issue.key for issue in batch), results, strict=True))
+        self.key_map.update(
+            {key: result for key, result in outcome.items() if isinstance(result, str)},
+            batch_id,
+        )
+        if journal is not None:
+            journal.failed(
+                batch_id,
+                {
+                    key: str(result)
+                    for key, result in outcome.items()
+                    if not isinstance(result, str)
+                },
+            )
+        return outcome
+
+    def run(self, plan: list[PlannedIssue]) -> ImportReport:
+        """Create every planned issue not yet in the key map.
+
+        The plan is scheduled as a dependency graph rather than level by
+        level: an issue becomes ready as soon as its own parent has a Jira
+        key, and ready issues are sent in batches whenever a worker is free.
+        With few ready issues the batches are split across the free workers,
+        so independent branches (e.g. the stories of different epics)
+        proceed in parallel.
+
+        Args:
+            plan: Planned issues (see ``load_plan()``)
+
+        Returns:
+            ImportReport, including per-issue timings and the critical path
+        """
+        report = ImportReport()
+        started = time.perf_counter()
+        planned = {issue.key: issue for issue in plan}
+
+        # Parent planning key -> children waiting for its Jira key
+        waiting: dict[str, list[PlannedIssue]] = {}
+        ready: deque[PlannedIssue] = deque()
+        orphans = []
+        for issue in plan:
+            if issue.key in self.key_map:
+                report.skipped += 1
+            elif not issue.parent or issue.parent in self.key_map:
+                ready.append(issue)
+                report.timings[issue.key] = IssueTiming(ready=0.0)
+            elif issue.parent in planned:
+                waiting.setdefault(issue.parent, []).append(issue)
+            else:
+                report.failed[issue.key] = f"parent {issue.parent} is not in the plan"
+                orphans.append(issue.key)
+        # Children come after their parent in the plan, so fail them afterwards
+        for key in orphans:
+            self._fail_descendants(key, waiting, report)
+
+        in_flight: dict[Future, list[PlannedIssue]] = {}
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            while ready or in_flight:
+                free = self.concurrency - len(in_flight)
+                while ready and free > 0:
+                    # Spread what is ready over the free workers
+                    size = min(self.batch_size, -(-len(ready) // free))
+                    batch = [ready.popleft() for _ in range(min(size, len(ready)))]
+                    sent = time.perf_counter() - started
+                    for issue in batch:
+                        report.timings[issue.key].sent = sent
+                    in_flight[executor.submit(self._create_batch, batch)] = batch
+                    free -= 1
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    batch = in_flight.pop(future)
+                    try:
+                        outcome = future.result()
+                    except (JiraError, OSError) as e:
+                        # E.g. the journal could not be written: the request
+                        # may have been sent, so the batch is left in doubt
+                        self.key_map.doubt([issue.key for issue in batch])
+                        error = JiraError(
+                            f"{e} (outcome unknown, checked on the next run)"
+                        )
+                        outcome = {issue.key: error for issue in batch}
+                    finished = time.perf_counter() - started
+                    report.requests += 1
+                    for issue in batch:
+                        report.timings[issue.key].done = finished
+                        result = outcome[issue.key]
+                        if isinstance(result, str):
+                            report.created[issue.key] = result
+                            for child in waiting.pop(issue.key, ()):
+                                ready.append(child)
+                                report.timings[child.key] = IssueTiming(ready=finished)
+                        else:
+                            report.failed[issue.key] = str(result)
+                            self._fail_descendants(issue.key, waiting, report)
+
+        # Anything still waiting hangs off a parent that was never scheduled
+        for parent in list(waiting):
+            self._fail_descendants(parent, waiting, report)
+
+        report.seconds = time.perf_counter() - started
+        report.critical_path = _critical_path(report, planned)
+        return report
+
+    @staticmethod
+    def _fail_descendants(
+        key: str, waiting: dict[str, list[PlannedIssue]], report: ImportReport
+    ) -> None:
+        """Mark everything below a failed issue as failed."""
+        stack = [key]
+        while stack:
+            parent = stack.pop()
+            for child in waiting.pop(parent, ()):
+                report.failed[child.key] = f"parent {parent} was not created"
+                stack.append(child.key)
+
+
+def recover_in_doubt(
+    client: JiraClient,
+    key_map: KeyMap,
+    plan: list[PlannedIssue],
+    project_key: str,
+    config: FieldConfig,
+) -> tuple[int, int]:
+    """Settle the issues of create requests that never got an answer.
+
+    Runs one JQL search for the project's issues created since the earliest
+    unanswered request and matches them to in-doubt issues by summary, issue
+    type and parent, ignoring Jira keys already in the key map. Matches are
+    recorded as created; the rest are released to be created again.
+
+    Args:
+        client: Jira client
+        key_map: Key map loaded with the import journal
+        plan: Planned issues
+        project_key: Target project key
+        config: Target project configuration
+
+    Returns:
+        (issues found in Jira, issues to create again)
+    """
+    in_doubt = dict(key_map.in_doubt)
+    if not in_doubt:
+        return 0, 0
+
+    # JQL dates are in the Jira user's time zone; a day of margin covers it
+    since = min(in_doubt.values()) - timedelta(days=1)
+    jql = (
+        f'project = "{project_key}" AND created >= "{since:%Y-%m-%d}" '
+        f"ORDER BY created ASC"
+    )
+    fields = ["summary", "issuetype", "parent"]
+    if config.epic_link_field:
+        fields.append(config.epic_link_field)
+
+    # (summary, issue type) -> [(Jira key, Jira parent key)] not yet mapped
+    known = key_map.remote_keys()
+    candidates: dict[tuple[str, str], list[tuple[str, str | None]]] = {}
+    for remote in client.search(jql, fields):
+        if remote["key"] in known:
+            continue
+        remote_fields = remote.get("fields") or {}
+        parent = (remote_fields.get("parent") or {}).get("key")
+        if config.epic_link_field and not parent:
+            parent = remote_fields.get(config.epic_link_field)
+        issue_type = (remote_fields.get("issuetype") or {}).get("name", "")
+        candidates.setdefault(
+            (remote_fields.get("summary", ""), issue_type), []
+        ).append((remote["key"], parent))
+
+    issue_types = {
+        "epic": config.epic_type,
+        "story": config.story_type,
+        "task": config.subtask_type,
+    }
+    planned = {issue.key: issue for issue in plan}
+    found: dict[str, str] = {}
+    missing: dict[str, str] = {}
+    # Parents first, so children can match against their parent's Jira key
+    for key in sorted(
+        in_doubt, key=lambda k: LEVELS.index(planned[k].level) if k in planned else 0
+    ):
+        issue = planned.get(key)
+        if issue is None:
+            missing[key] = "no longer in the plan"
+            continue
+        parent_remote = key_map.get(issue.parent) if issue.parent else None
+        parent_remote = found.get(issue.parent or "", parent_remote)
+        matches = candidates.get((issue.summary, issue_types[issue.level]), [])
+        for index, (remote_key, remote_parent) in enumerate(matches):
+            if remote_parent is None or remote_parent == parent_remote:
+                found[key] = remote_key
+                del matches[index]
+                break
+        else:
+            missing[key] = "not found in Jira after an interrupted request"
+
+    key_map.update(found)
+    key_map.release(missing)
+    return len(found), len(missing)
+
+
+def _critical_path(report: ImportReport, planned: dict[str, PlannedIssue]) -> list[str]:
+    """Return the parent chain ending at the last issue created, root first."""
+    created = [key for key in report.created if key in report.timings]
+    if not created:
+        return []
+    key: str | None = max(created, key=lambda k: report.timings[k].done)
+    path = []
+    while key is not None and key in report.timings:
+        path.append(key)
+        key = planned[key].parent
+    path.reverse()
+    return path
+
+
+def print_critical_path(report: ImportReport) -> None:
+    """Print where the time of the longest dependency chain went."""
+    if not report.critical_path:
+        return
+    print(f"\nCritical path ({report.seconds:.2f}s wall):")
+    requesting = queued = 0.0
+    for key in report.critical_path:
+        timing = report.timings[key]
+        queued += timing.sent - timing.ready
+        requesting += timing.done - timing.sent
+        print(
+            f"  {key}: ready at {timing.ready:.2f}s, "
+            f"queued {timing.sent - timing.ready:.2f}s, "
+            f"request {timing.done - timing.sent:.2f}s"
+        )
+    print(
+        f"  Total: {requesting:.2f}s in requests, "
+        f"{queued:.2f}s queued for a worker"
+    )
+
+
+def main():
+    """Import the planning JSON into Jira."""
+    parser = argparse.ArgumentParser(
+        description="Create the epics, stories and tasks of a planning JSON in Jira",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "plan",
+        type=str,
+        nargs="?",
+        default=str(DEFAULT_PLAN),
+        help="Planning JSON file (default: docs/pm/farmacias-macross-jira-import.json)",
+    )
+    parser.add_argument(
+        "--key-map",
+        type=str,
+        default=None,
+        help="Planning key -> Jira key map, read and updated by every run "
+        "(default: <plan>-keymap.json next to the plan)",
+    )
+    parser.add_argument(
+        "--journal",
+        type=str,
+        default=None,
+        help="Append-only log of create requests used to resume interrupted "
+        "imports (default: <plan>-journal.jsonl next to the key map)",
+    )
+    parser.add_argument(
+        "--project",
+        type=str,
+        default=None,
+        help="Target project key (default: project.key of the plan)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BULK_CREATE_LIMIT,
+        help=f"Issues per bulk-create request (default: {BULK_CREATE_LIMIT})",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Bulk-create requests in flight at once (default: 4)",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=5.0,
+        help="Maximum requests per second to Jira (default: 5)",
+    )
+    parser.add_argument(
+        "--subtask-type",
+        type=str,
+        default="Subtask",
+        help="Issue type name used for tasks (default: Subtask)",
+    )
+    parser.add_argument(
+        "--epic-name-field",
+        type=str,
+        default=None,
+        help="Custom field id of Epic Name, if the project requires it",
+    )
+    parser.add_argument(
+        "--epic-link-field",
+        type=str,
+        default=None,
+        help="Custom field id of Epic Link; without it stories use 'parent'",
+    )
+    parser.add_argument(
+        "--story-points-field",
+        type=str,
+        default=None,
+        help="Custom field id of Story Points (default: story points not sent)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only print what would be created",
+    )
+
+    args = parser.parse_args()
+
+    plan_path = Path(args.plan)
+    plan = load_plan(plan_path)
+    project_key = args.project or load_project_key(plan_path)
+    key_map_path = (
+        Path(args.key_map) if args.key_map else default_key_map_path(plan_path)
+    )
+    journal = ImportJournal(
+        Path(args.journal) if args.journal else default_journal_path(key_map_path)
+    )
+    key_map = KeyMap(key_map_path, journal)
+
+    counts = {level: sum(1 for i in plan if i.level == level) for level in LEVELS}
+    print(
+        f"Loaded {counts['epic']} epics, {counts['story']} stories, "
+        f"{counts['task']} tasks for project {project_key}"
+    )
+    print(f"Key map {key_map.path}: {len(key_map)} already created")
+    if key_map.in_doubt:
+        print(
+            f"Journal {journal.path}: {len(key_map.in_doubt)} issues from "
+            f"unanswered requests, checked in Jira before importing"
+        )
 
-# Read the JSON file
-json_path = Path(__file__).parent.parent / "docs" / "pm" / "farmacias-macross-jira-import.json"
+    if args.dry_run:
+        missing = [i for i in plan if i.key not in key_map]
+        for level in LEVELS:
+            pending = sum(1 for i in missing if i.level == level)
+            batches = -(-pending // min(args.batch_size, BULK_CREATE_LIMIT))
+            print(f"  Would create {pending} {level} issues in {batches} requests")
+        return
 
-with open(json_path, 'r', encoding='utf-8') as f:
-    data = json.load(f)
+    config = FieldConfig(
+        subtask_type=args.subtask_type,
+        epic_name_field=args.epic_name_field,
+        epic_link_field=args.epic_link_field,
+        story_points_field=args.story_points_field,
+    )
+    if not key_map.in_doubt and all(i.key in key_map for i in plan):
+        key_map.save()
+        print("\nNothing to create")
+        return
 
-print(f"Loaded {len(data['epics'])} epics, {len(data['stories'])} stories, {len(data['tasks'])} tasks")
-print("\nThis script would create:")
-print(f"- {len(data['epics'])} Epics")
-print(f"- {len(data['stories'])} Stories") 
-print(f"- {len(data['tasks'])} Tasks")
-print("\nTotal: {len(data['epics']) + len(data['stories']) + len(data['tasks'])} issues")
-print("\nNote: This requires manual execution via Jira MCP tools or Jira API")
+    try:
+        client = JiraClient.from_env(rate=args.rate)
+    except JiraError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
 
+    with journal:
+        if key_map.in_doubt:
+            try:
+                found, retry = recover_in_doubt(
+                    client, key_map, plan, project_key, config
+                )
+            except JiraError as e:
+                print(f"Error: could not check unanswered requests: {e}")
+                sys.exit(1)
+            print(f"Recovered {found} issues from Jira, {retry} to create again")
 
+        importer = BulkImporter(
+            client,
+            key_map,
+            project_key,
+            config,
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+        )
+        try:
+            report = importer.run(plan)
+        finally:
+            key_map.save()
 
+    print(
+        f"\nCreated {len(report.created)} issues in {report.requests} bulk requests "
+        f"({report.seconds:.1f}s), {report.skipped} already existed"
+    )
+    print_critical_path(report)
+    if key_map.in_doubt:
+        print(
+            f"{len(key_map.in_doubt)} issues from unanswered requests are checked "
+            f"in Jira on the next run"
+        )
+    if report.failed:
+        print(f"{len(report.failed)} issues failed:")
+        for key, reason in report.failed.items():
+            print(f"  {key}: {reason}")
+        sys.exit(1)
 
 
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""Time-tracking and cycle-time analytics over parsed Jira issues.
+
+Works on the columnar representation from ``jira_columnar``, so every
+statistic is a handful of NumPy operations (masks, ``bincount`` and
+``percentile``) instead of a Python loop over issues. It can run on columns
+built in memory or memory-mapped from a ``--columnar-dir`` export.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from jira_columnar import HAS_NUMPY, IssueColumns
+
+if HAS_NUMPY:
+    import numpy as np
+
+if TYPE_CHECKING:
+    from parse_jira_xml import Issue
+
+# Cycle-time percentiles reported in the index markdown
+CYCLE_TIME_PERCENTILES = (50, 75, 90, 95)
+
+
+@dataclass(slots=True)
+class Rollup:
+    """Time tracking totals of a group of issues (an epic or an assignee)."""
+
+    name: str
+    issues: int
+    resolved: int
+    estimate_seconds: int
+    spent_seconds: int
+    # Time spent / original estimate over issues that have both
+    ratio: float | None
+
+
+@dataclass(slots=True)
+class TimeTrackingReport:
+    """Estimate-vs-actual, rollups and cycle times of an export."""
+
+    issues: int = 0
+    estimated: int = 0
+    tracked: int = 0
+    estimate_seconds: int = 0
+    remaining_seconds: int = 0
+    spent_seconds: int = 0
+    # Over issues with both an original estimate and time spent
+    compared: int = 0
+    ratio: float | None = None
+    median_ratio: float | None = None
+    # Percentile -> created→resolved hours
+    cycle_times: dict[int, float] = field(default_factory=dict)
+    resolved: int = 0
+    by_epic: list[Rollup] = field(default_factory=list)
+    by_assignee: list[Rollup] = field(default_factory=list)
+
+
+def _rollups(
+    columns: IssueColumns,
+    group: str,
+    resolved: "np.ndarray",
+    estimate: "np.ndarray",
+    spent: "np.ndarray",
+    compared: "np.ndarray",
+) -> list[Rollup]:
+    """Aggregate per category of a categorical column with ``bincount``."""
+    names = columns.categories[group]
+    if not names:
+        return []
+    codes = columns[group]
+    grouped = codes >= 0
+    codes = codes[grouped]
+    size = len(names)
+
+    def total(weights: "np.ndarray") -> "np.ndarray":
+        return np.bincount(codes, weights=weights[grouped], minlength=size)
+
+    issues = np.bincount(codes, minlength=size)
+    resolved_counts = total(resolved)
+    estimate_totals = total(estimate)
+    spent_totals = total(spent)
+    compared_estimate = total(np.where(compared, estimate, 0))
+    compared_spent = total(np.where(compared, spent, 0))
+
+    return [
+        Rollup(
+            name=names[code],
+            issues=int(issues[code]),
+            resolved=int(resolved_counts[code]),
+            estimate_seconds=int(estimate_totals[code]),
+            spent_seconds=int(spent_totals[code]),
+            ratio=(
+                float(compared_spent[code] / compared_estimate[code])
+                if compared_estimate[code] > 0
+                else None
+            ),
+        )
+        for code in range(size)
+        if issues[code]
+    ]
+
+
+def analyze_time_tracking(columns: IssueColumns) -> TimeTrackingReport:
+    """Compute the time-tracking report of a set of issues.
+
+    Args:
+        columns: Issue columns (see ``IssueColumns.from_issues()``)
+
+    Returns:
+        TimeTrackingReport
+    """
+    report = TimeTrackingReport(issues=len(columns))
+    if not report.issues:
+        return report
+
+    # Missing seconds are stored as -1
+    original = columns["time_original_estimate"]
+    remaining = columns["time_estimate"]
+    spent = columns["time_spent"]
+    estimate = np.maximum(original, 0)
+    spent_known = np.maximum(spent, 0)
+
+    report.estimated = int(np.count_nonzero(original > 0))
+    report.tracked = int(np.count_nonzero(spent >= 0))
+    report.estimate_seconds = int(estimate.sum())
+    report.remaining_seconds = int(np.maximum(remaining, 0).sum())
+    report.spent_seconds = int(spent_known.sum())
+
+    compared = (original > 0) & (spent >= 0)
+    report.compared = int(np.count_nonzero(compared))
+    if report.compared:
+        report.ratio = float(spent[compared].sum() / original[compared].sum())
+        report.median_ratio = float(np.median(spent[compared] / original[compared]))
+
+    created = columns["created"]
+    resolved_at = columns["resolved"]
+    resolved = ~np.isnat(resolved_at)
+    report.resolved = int(np.count_nonzero(resolved))
+    cycle = resolved & ~np.isnat(created)
+    if cycle.any():
+        hours = (resolved_at[cycle] - created[cycle]).astype("int64") / 3600.0
+        values = np.percentile(hours, CYCLE_TIME_PERCENTILES)
+        report.cycle_times = {
+            p: float(v) for p, v in zip(CYCLE_TIME_PERCENTILES, values, strict=True)
+        }
+
+    report.by_epic = _rollups(
+        columns, "epic", resolved, estimate, spent_known, compared
+    )
+    report.by_assignee = _rollups(
+        columns, "assignee", resolved, estimate, spent_known, compared
+    )
+    return report
+
+
+def format_seconds(seconds: int) -> str:
+    """Format a duration as hours and minutes, e.g. ``2h 30m``."""
+    hours, rest = divmod(int(seconds), 3600)
+    minutes = rest // 60
+    if hours and minutes:
+        return f"{hours}h {minutes}m"
+    if hours:
+        return f"{hours}h"
+    return f"{minutes}m"
+
+
+def _format_hours(hours: float) -> str:
+    """Format a cycle time, switching to days past two days."""
+    if hours >= 48:
+        return f"{hours / 24:.1f} days"
+    return f"{hours:.1f} h"
+
+
+def _format_ratio(ratio: float | None) -> str:
+    return f"{ratio:.2f}x" if ratio is not None else "-"
+
+
+def _rollup_table(title: str, label: str, rollups: list[Rollup]) -> list[str]:
+    """Render the rollups that have any estimate or time spent as a table."""
+    rollups = [r for r in rollups if r.estimate_seconds or r.spent_seconds]
+    if not rollups:
+        return []
+    lines = [f"### {title}", ""]
+    lines.append(
+        f"| {label} | Issues | Resolved | Estimated | Spent | Spent/Estimate |"
+    )
+    lines.append("|---|---|---|---|---|---|")
+    for rollup in rollups:
+        lines.append(
+            f"| {rollup.name} | {rollup.issues} | {rollup.resolved} | "
+            f"{format_seconds(rollup.estimate_seconds)} | "
+            f"{format_seconds(rollup.spent_seconds)} | "
+            f"{_format_ratio(rollup.ratio)} |"
+        )
+    lines.append("")
+    return lines
+
+
+def generate_time_tracking_markdown(report: TimeTrackingReport) -> list[str]:
+    """Render a time-tracking report as a markdown section.
+
+    Args:
+        report: Report from ``analyze_time_tracking()``
+
+    Returns:
+        Markdown lines (empty if there is nothing to report)
+    """
+    if not report.issues or not (
+        report.estimated or report.tracked or report.cycle_times
+    ):
+        return []
+
+    lines = []
+    lines.append("## Time Tracking")
+    lines.append("")
+    lines.append(
+        f"- **Original estimate**: {format_seconds(report.estimate_seconds)} "
+        f"across {report.estimated} issues"
+    )
+    lines.append(
+        f"- **Remaining estimate**: {format_seconds(report.remaining_seconds)}"
+    )
+    lines.append(
+        f"- **Time spent**: {format_seconds(report.spent_seconds)} "
+        f"across {report.tracked} issues"
+    )
+    if report.compared:
+        lines.append(
+            f"- **Spent vs. estimate**: {_format_ratio(report.ratio)} overall, "
+            f"{_format_ratio(report.median_ratio)} median "
+            f"({report.compared} issues with both)"
+        )
+    lines.append("")
+
+    if report.cycle_times:
+        lines.append("### Cycle Time (created → resolved)")
+        lines.append("")
+        lines.append(f"Over {report.resolved} resolved issues:")
+        lines.append("")
+        for percentile, hours in report.cycle_times.items():
+            lines.append(f"- **p{percentile}**: {_format_hours(hours)}")
+        lines.append("")
+
+    lines.extend(_rollup_table("By Epic", "Epic", report.by_epic))
+    lines.extend(_rollup_table("By Assignee", "Assignee", report.by_assignee))
+
+    return lines
+
+
+def time_tracking_section(
+    issues: Iterable["Issue"], epic_of: dict[str, str] | None = None
+) -> list[str]:
+    """Build the time-tracking markdown section for parsed issues.
+
+    Args:
+        issues: Parsed issues (``Issue`` objects)
+        epic_of: Issue key -> epic key, for the per-epic rollup
+
+    Returns:
+        Markdown lines, or an empty list if numpy is not installed
+    """
+    if not HAS_NUMPY:
+        return []
+    columns = IssueColumns.from_issues(issues, epic_of)
+    return generate_time_tracking_markdown(analyze_time_tracking(columns))
@@ -0,0 +1,295 @@
+"""Minimal Jira REST API client for the import scripts.
+
+Built on ``urllib`` so the scripts run without the package environment. A
+single client is shared by the worker threads of an import: requests are
+paced by a token-bucket ``RateLimiter`` and rate-limited responses (429) are
+retried after ``Retry-After``. Other transient failures (5xx, dropped or
+reset connections, truncated bodies) are only retried for idempotent
+requests, so a create that may have gone through is never sent twice.
+
+Credentials come from the same environment variables as the MCP server:
+``JIRA_URL`` plus either ``JIRA_USERNAME``/``JIRA_API_TOKEN`` (Cloud, or
+Server/DC basic auth) or ``JIRA_PERSONAL_TOKEN`` (Server/DC).
+"""
+
+import base64
+import http.client
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+from typing import Any
+
+API_PREFIX = "/rest/api/2"
+
+# Jira rejects bulk-create requests with more issues than this
+BULK_CREATE_LIMIT = 50
+
+_RETRY_STATUSES = frozenset({502, 503, 504})
+
+
+class JiraError(Exception):
+    """A Jira REST call failed."""
+
+    def __init__(self, message: str, status: int | None = None, body: Any = None):
+        super().__init__(message)
+        self.status = status
+        self.body = body
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing ``rate`` requests per second."""
+
+    def __init__(self, rate: float, burst: int | None = None):
+        """
+        Create a full bucket.
+
+        Args:
+            rate: Sustained requests per second (0 disables limiting)
+            burst: Bucket size (default: ``max(1, rate)``)
+        """
+        self.rate = rate
+        self.capacity = float(burst if burst is not None else max(1, int(rate)))
+        self._tokens = self.capacity
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._stamp) * self.rate
+                )
+                self._stamp = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class JiraClient:
+    """Jira REST client shared across import worker threads."""
+
+    def __init__(
+        self,
+        base_url: str,
+        username: str | None = None,
+        api_token: str | None = None,
+        personal_token: str | None = None,
+        rate: float = 10.0,
+        timeout: float = 30.0,
+        retries: int = 4,
+    ):
+        """
+        Configure the client.
+
+        Args:
+            base_url: Jira site URL, e.g. ``https://example.atlassian.net``
+            username: Username or e-mail for basic auth
+            api_token: API token (or Server/DC password) for basic auth
+            personal_token: Personal access token (bearer auth)
+            rate: Maximum requests per second across all threads
+            timeout: Socket timeout per request, in seconds
+            retries: Retries for rate-limited or transient failures
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.retries = retries
+        self.limiter = RateLimiter(rate)
+        self._headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
+        if personal_token:
+            self._headers["Authorization"] = f"Bearer {personal_token}"
+        elif username and api_token:
+            credentials = base64.b64encode(f"{username}:{api_token}".encode()).decode()
+            self._headers["Authorization"] = f"Basic {credentials}"
+
+    @classmethod
+    def from_env(cls, **kwargs: Any) -> "JiraClient":
+        """Build a client from ``JIRA_URL`` and the Jira credential variables.
+
+        Raises:
+            JiraError: If ``JIRA_URL`` is not set
+        """
+        base_url = os.getenv("JIRA_URL")
+        if not base_url:
+            raise JiraError("JIRA_URL is not set")
+        return cls(
+            base_url,
+            username=os.getenv("JIRA_USERNAME"),
+            api_token=os.getenv("JIRA_API_TOKEN"),
+            personal_token=os.getenv("JIRA_PERSONAL_TOKEN"),
+            **kwargs,
+        )
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        payload: Any = None,
+        idempotent: bool | None = None,
+    ) -> Any:
+        """Send a request to the REST API and decode the JSON response.
+
+        Args:
+            method: HTTP method
+            path: Path below ``/rest/api/2`` (e.g. ``/issue/bulk``)
+            payload: JSON body (optional)
+            idempotent: Whether 5xx and connection errors may be retried
+                (default: True for GET, False otherwise)
+
+        Returns:
+            Decoded JSON body, or None for empty responses
+
+        Raises:
+            JiraError: On a non-2xx response, or a transport failure (status
+                None) once retries are exhausted or for a non-idempotent request
+        """
+        if idempotent is None:
+            idempotent = method == "GET"
+        url = f"{self.base_url}{API_PREFIX}{path}"
+        data = json.dumps(payload).encode("utf-8") if payload is not None else None
+
+        for attempt in range(self.retries + 1):
+            self.limiter.acquire()
+            req = urllib.request.Request(
+                url, data=data, headers=self._headers, method=method
+            )
+            try:
+                with urllib.request.urlopen(req, timeout=self.timeout) as response:
+                    body = response.read()
+                return json.loads(body) if body else None
+            except urllib.error.HTTPError as e:
+                body = _decode_error(e)
+                retryable = e.code == 429 or (idempotent and e.code in _RETRY_STATUSES)
+                if not retryable or attempt == self.retries:
+                    raise JiraError(
+                        f"{method} {path} failed with HTTP {e.code}: {body}",
+                        status=e.code,
+                        body=body,
+                    ) from None
+                delay = _retry_after(e) or 2**attempt * 0.5
+            except (OSError, http.client.HTTPException, ValueError) as e:
+                # Connection refused, reset or dropped (URLError, RemoteDisconnected,
+                # ConnectionResetError), timeouts, and truncated or undecodable
+                # bodies. The request may have been processed: status None.
+                if not idempotent or attempt == self.retries:
+                    raise JiraError(
+                        f"{method} {path} failed: {type(e).__name__}: {e}"
+                    ) from None
+                delay = 2**attempt * 0.5
+            time.sleep(delay)
+        raise AssertionError("unreachable")
+
+    def bulk_create(self, issue_updates: list[dict[str, Any]]) -> list[Any]:
+        """Create up to ``BULK_CREATE_LIMIT`` issues in one request.
+
+        Args:
+            issue_updates: ``{"fields": {...}}`` entries
+
+        Returns:
+            One entry per input, in order: the created issue key, or a
+            ``JiraError`` describing why that element was rejected
+        """
+        if len(issue_updates) > BULK_CREATE_LIMIT:
+            raise ValueError(
+                f"At most {BULK_CREATE_LIMIT} issues per bulk request, "
+                f"got {len(issue_updates)}"
+            )
+        try:
+            response = self.request(
+                "POST", "/issue/bulk", {"issueUpdates": issue_updates}
+            )
+        except JiraError as e:
+            # Jira answers 400 when every element failed; errors are per element
+            if e.status != 400 or not isinstance(e.body, dict):
+                raise
+            response = e.body
+
+        failed: dict[int, JiraError] = {}
+        for error in response.get("errors", []):
+            index = error.get("failedElementNumber")
+            if index is not None:
+                failed[index] = JiraError(
+                    json.dumps(error.get("elementErrors", error), ensure_ascii=False),
+                    status=error.get("status"),
+                    body=error,
+                )
+
+        # Created issues are listed in request order, skipping failed elements
+        created = iter(response.get("issues", []))
+        results: list[Any] = []
+        for index in range(len(issue_updates)):
+            if index in failed:
+                results.append(failed[index])
+            else:
+                issue = next(created, None)
+                results.append(
+                    issue["key"]
+                    if issue is not None
+                    else JiraError("Missing from bulk-create response")
+                )
+        return results
+
+    def search(
+        self, jql: str, fields: list[str], page_size: int = 100
+    ) -> Iterator[dict[str, Any]]:
+        """Yield every issue matching a JQL query, paging through results.
+
+        Args:
+            jql: JQL query
+            fields: Issue fields to return
+            page_size: Issues per request
+
+        Yields:
+            Issues as ``{"key": ..., "fields": {...}}``
+        """
+        start = 0
+        while True:
+            page = self.request(
+                "POST",
+                "/search",
+                {
+                    "jql": jql,
+                    "fields": fields,
+                    "startAt": start,
+                    "maxResults": page_size,
+                },
+                idempotent=True,
+            )
+            issues = page.get("issues", [])
+            yield from issues
+            start += len(issues)
+            if not issues or start >= page.get("total", 0):
+                return
+
+
+def _decode_error(error: urllib.error.HTTPError) -> Any:
+    """Return the JSON (or text) body of an HTTP error response."""
+    try:
+        raw = error.read()
+    except (OSError, http.client.HTTPException):
+        return ""
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return raw.decode("utf-8", "replace")
+
+
+def _retry_after(error: urllib.error.HTTPError) -> float | None:
+    """Return the ``Retry-After`` delay of a response, in seconds."""
+    value = error.headers.get("Retry-After") if error.headers else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
@@ -0,0 +1,260 @@
+"""Columnar export of parsed Jira issues for vectorized analytics.
+
+Issues are stored as a directory of NumPy ``.npy`` files, one per column,
+plus a ``columns.json`` manifest holding the row count and the categories of
+every categorical column. Each column can be memory-mapped back with
+``np.load(mmap_mode="r")``, so aggregations over millions of historical
+issues never materialize Python objects per issue.
+
+Column layout:
+
+- ``key``: fixed-width unicode issue keys
+- categorical columns (``CATEGORICAL_COLUMNS`` plus ``epic``, the epic each
+  issue rolls up to): int32 codes into the sorted categories listed in the
+  manifest, -1 when the value is missing
+- date columns (``DATE_COLUMNS``): ``datetime64[s]`` in UTC, NaT when missing
+- time tracking columns (``SECONDS_COLUMNS``): int64 seconds, -1 when missing
+- labels: int32 ``label_codes`` into the ``labels`` categories, split per
+  issue by the int64 ``label_offsets`` (issue ``i`` owns
+  ``label_codes[label_offsets[i]:label_offsets[i + 1]]``)
+"""
+
+import json
+from collections.abc import Iterable
+from operator import attrgetter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+if TYPE_CHECKING:
+    from parse_jira_xml import Issue
+
+COLUMNAR_VERSION = 2
+MANIFEST_FILENAME = "columns.json"
+
+# Column name -> Issue attribute
+CATEGORICAL_COLUMNS = {
+    "issue_type": "issue_type",
+    "status": "status",
+    "priority": "priority",
+    "assignee": "assignee",
+    "project": "project_key",
+    "parent": "parent_key",
+    "epic_link": "epic_link",
+}
+DATE_COLUMNS = {
+    "created": "created_at",
+    "updated": "updated_at",
+    "resolved": "resolved_at",
+    "due": "due_at",
+}
+SECONDS_COLUMNS = {
+    "time_original_estimate": "time_original_estimate_seconds",
+    "time_estimate": "time_estimate_seconds",
+    "time_spent": "time_spent_seconds",
+}
+
+# Sentinels for missing values
+MISSING_CODE = -1
+MISSING_SECONDS = -1
+_NAT = -(2**63)
+
+
+def _require_numpy() -> None:
+    if not HAS_NUMPY:
+        raise RuntimeError(
+            "The columnar export requires numpy; install it with 'pip install numpy'"
+        )
+
+
+def _encode(values: list[str | None]) -> tuple["np.ndarray", list[str]]:
+    """Encode values as int32 codes into their sorted distinct categories."""
+    categories = sorted({v for v in values if v})
+    index = {value: code for code, value in enumerate(categories)}
+    codes = np.fromiter(
+        (index[v] if v else MISSING_CODE for v in values),
+        dtype=np.int32,
+        count=len(values),
+    )
+    return codes, categories
+
+
+class IssueColumns:
+    """Column arrays of a set of issues plus their categorical dictionaries."""
+
+    __slots__ = ("columns", "categories")
+
+    def __init__(
+        self, columns: dict[str, "np.ndarray"], categories: dict[str, list[str]]
+    ):
+        """
+        Wrap already-built columns.
+
+        Args:
+            columns: Column name -> array, all of the same length except the
+                ``label_codes``/``label_offsets`` pair
+            categories: Categorical column name -> categories
+        """
+        self.columns = columns
+        self.categories = categories
+
+    def __len__(self) -> int:
+        return len(self.columns["key"])
+
+    def __getitem__(self, name: str) -> "np.ndarray":
+        return self.columns[name]
+
+    @classmethod
+    def from_issues(
+        cls, issues: Iterable["Issue"], epic_of: dict[str, str] | None = None
+    ) -> "IssueColumns":
+        """Build the columns from parsed issues.
+
+        Args:
+            issues: Parsed issues (``Issue`` objects)
+            epic_of: Issue key -> key of the epic it rolls up to (see
+                ``IssueGraph.epic_by_issue()``); the ``epic`` column is left
+                empty without it
+
+        Returns:
+            IssueColumns with one row per issue, in input order
+        """
+        _require_numpy()
+        issues = list(issues)
+        count = len(issues)
+        columns: dict[str, np.ndarray] = {}
+        categories: dict[str, list[str]] = {}
+
+        columns["key"] = np.array([i.key for i in issues], dtype=np.str_)
+
+        for name, attr in CATEGORICAL_COLUMNS.items():
+            columns[name], categories[name] = _encode(
+                list(map(attrgetter(attr), issues))
+            )
+        epic_of = epic_of or {}
+        columns["epic"], categories["epic"] = _encode(
+            [epic_of.get(i.key) for i in issues]
+        )
+
+        for name, attr in DATE_COLUMNS.items():
+            stamps = np.fromiter(
+                (
+                    _NAT if dt is None else int(dt.timestamp())
+                    for dt in map(attrgetter(attr), issues)
+                ),
+                dtype=np.int64,
+                count=count,
+            )
+            columns[name] = stamps.view("datetime64[s]")
+
+        for name, attr in SECONDS_COLUMNS.items():
+            columns[name] = np.fromiter(
+                (
+                    MISSING_SECONDS if s is None else s
+                    for s in map(attrgetter(attr), issues)
+                ),
+                dtype=np.int64,
+                count=count,
+            )
+
+        flat_labels = [label for i in issues for label in i.labels]
+        columns["label_codes"], categories["labels"] = _encode(flat_labels)
+        offsets = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum([len(i.labels) for i in issues], out=offsets[1:])
+        columns["label_offsets"] = offsets
+
+        return cls(columns, categories)
+
+    def decode(self, name: str) -> "np.ndarray":
+        """Return a categorical column as an object array of strings.
+
+        Missing values decode to None.
+        """
+        lookup = np.array([*self.categories[name], None], dtype=object)
+        # Code -1 indexes the trailing None
+        return lookup[self.columns[name]]
+
+    def labels_of(self, row: int) -> list[str]:
+        """Return the labels of the issue in ``row``."""
+        offsets = self.columns["label_offsets"]
+        codes = self.columns["label_codes"][offsets[row] : offsets[row + 1]]
+        names = self.categories["labels"]
+        return [names[code] for code in codes]
+
+    def save(self, out_dir: Path) -> Path:
+        """Write the columns to a directory of ``.npy`` files.
+
+        Args:
+            out_dir: Directory to write; created if missing
+
+        Returns:
+            Path of the manifest file
+        """
+        out_dir.mkdir(parents=True, exist_ok=True)
+        for name, array in self.columns.items():
+            np.save(out_dir / f"{name}.npy", array, allow_pickle=False)
+
+        manifest: dict[str, Any] = {
+            "version": COLUMNAR_VERSION,
+            "rows": len(self),
+            "columns": sorted(self.columns),
+            "categories": self.categories,
+        }
+        manifest_file = out_dir / MANIFEST_FILENAME
+        manifest_file.write_text(
+            json.dumps(manifest, indent=2, ensure_ascii=False) + "\n",
+            encoding="utf-8",
+        )
+        return manifest_file
+
+    @classmethod
+    def load(cls, in_dir: Path, mmap: bool = True) -> "IssueColumns":
+        """Read columns written by ``save()``.
+
+        Args:
+            in_dir: Directory holding the manifest and ``.npy`` files
+            mmap: Memory-map the arrays read-only instead of reading them
+
+        Returns:
+            IssueColumns backed by the files
+
+        Raises:
+            ValueError: If the directory was written by another format version
+        """
+        _require_numpy()
+        manifest = json.loads((in_dir / MANIFEST_FILENAME).read_text(encoding="utf-8"))
+        if manifest.get("version") != COLUMNAR_VERSION:
+            raise ValueError(
+                f"{in_dir} holds columnar format version {manifest.get('version')}, "
+                f"expected {COLUMNAR_VERSION}"
+            )
+        mmap_mode = "r" if mmap else None
+        columns = {
+            name: np.load(in_dir / f"{name}.npy", mmap_mode=mmap_mode)
+            for name in manifest["columns"]
+        }
+        return cls(columns, manifest["categories"])
+
+
+def write_columnar(
+    issues: Iterable["Issue"], out_dir: Path, epic_of: dict[str, str] | None = None
+) -> IssueColumns:
+    """Build the columns of ``issues`` and save them to ``out_dir``.
+
+    Args:
+        issues: Parsed issues
+        out_dir: Output directory
+        epic_of: Issue key -> epic key for the ``epic`` column (optional)
+
+    Returns:
+        The columns that were written
+    """
+    columns = IssueColumns.from_issues(issues, epic_of)
+    columns.save(out_dir)
+    return columns
@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Compare two Jira snapshots and report what changed between them.
+
+A snapshot is either a Jira XML export (file, directory or glob, as accepted
+by parse_jira_xml.py) or a copy of the export cache database written with
+``--cache-dir``. Both sides are walked once in key order, so the diff is
+linear in the number of issues.
+
+Usage:
+    python scripts/jira_diff.py old.xml new.xml --output-dir docs/changes
+"""
+
+import argparse
+import json
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, field
+from operator import attrgetter
+from pathlib import Path
+from typing import Any
+
+from jira_export_cache import CACHE_FILENAME, iter_cached_issues
+from parse_jira_xml import (
+    Issue,
+    iter_jira_xml,
+    merge_issues,
+    parse_jira_exports,
+    resolve_xml_paths,
+)
+
+# Issue attribute -> label of the fields compared between snapshots
+DIFF_FIELDS = {
+    "summary": "Summary",
+    "issue_type": "Type",
+    "status": "Status",
+    "priority": "Priority",
+    "assignee": "Assignee",
+    "parent_key": "Parent",
+    "epic_link": "Epic Link",
+    "time_original_estimate": "Original Estimate",
+    "time_estimate": "Remaining Estimate",
+    "time_spent": "Time Spent",
+}
+
+# Time fields are compared by their parsed seconds ("1d" and "8h" are equal)
+_SECONDS_FIELDS = {
+    "time_original_estimate": "time_original_estimate_seconds",
+    "time_estimate": "time_estimate_seconds",
+    "time_spent": "time_spent_seconds",
+}
+
+# Fields reported in their own changelog sections; the rest go under "Other"
+_SECTION_FIELDS = {
+    "status": "Status transitions",
+    "assignee": "Reassignments",
+    "time_original_estimate": "Estimate changes",
+    "time_estimate": "Estimate changes",
+    "time_spent": "Estimate changes",
+}
+
+_CACHE_SUFFIXES = (".sqlite3", ".sqlite", ".db")
+
+
+@dataclass(slots=True)
+class FieldChange:
+    """A single field whose value differs between the two snapshots."""
+
+    field: str
+    old: str | None
+    new: str | None
+
+
+@dataclass(slots=True)
+class IssueChange:
+    """An issue present in both snapshots with at least one changed field."""
+
+    key: str
+    summary: str
+    changes: list[FieldChange]
+
+
+@dataclass(slots=True)
+class ChangeSet:
+    """Issues added, removed and changed between two snapshots."""
+
+    added: list[Issue] = field(default_factory=list)
+    removed: list[Issue] = field(default_factory=list)
+    changed: list[IssueChange] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the change set as a JSON-serializable dictionary."""
+        return {
+            "summary": {
+                "added": len(self.added),
+                "removed": len(self.removed),
+                "changed": len(self.changed),
+            },
+            "added": [_issue_brief(i) for i in self.added],
+            "removed": [_issue_brief(i) for i in self.removed],
+            "changed": [asdict(c) for c in self.changed],
+        }
+
+
+def _issue_brief(issue: Issue) -> dict[str, Any]:
+    """Return the fields identifying an added or removed issue."""
+    return {
+        "key": issue.key,
+        "summary": issue.summary,
+        "issuetype": issue.issue_type,
+        "status": issue.status,
+        "assignee": issue.assignee,
+    }
+
+
+def compare_issues(old: Issue, new: Issue) -> list[FieldChange]:
+    """Return the ``DIFF_FIELDS`` that differ between two copies of an issue.
+
+    Time fields are compared by their ``*_seconds`` values when parsed, so
+    only real estimate changes are reported, not a different rendering.
+
+    Args:
+        old: Issue from the older snapshot
+        new: Issue with the same key from the newer snapshot
+
+    Returns:
+        Changed fields, in ``DIFF_FIELDS`` order
+    """
+    changes = []
+    for name in DIFF_FIELDS:
+        old_value = getattr(old, name)
+        new_value = getattr(new, name)
+        seconds = _SECONDS_FIELDS.get(name)
+        if seconds is not None and (
+            getattr(old, seconds) is not None or getattr(new, seconds) is not None
+        ):
+            changed = getattr(old, seconds) != getattr(new, seconds)
+        else:
+            changed = old_value != new_value
+        if changed:
+            changes.append(FieldChange(name, old_value, new_value))
+    return changes
+
+
+def diff_issues(old: Iterable[Issue], new: Iterable[Issue]) -> ChangeSet:
+    """Compute the change set between two snapshots in a single merge pass.
+
+    Both inputs must be sorted by key; they are consumed lazily, so streams
+    such as ``iter_cached_issues()`` are never loaded whole.
+
+    Args:
+        old: Issues of the older snapshot, in ascending key order
+        new: Issues of the newer snapshot, in ascending key order
+
+    Returns:
+        Keyed change set
+    """
+    result = ChangeSet()
+    old_iter = iter(old)
+    new_iter = iter(new)
+    old_issue = next(old_iter, None)
+    new_issue = next(new_iter, None)
+
+    while old_issue is not None and new_issue is not None:
+        if old_issue.key == new_issue.key:
+            changes = compare_issues(old_issue, new_issue)
+            if changes:
+                result.changed.append(
+                    IssueChange(new_issue.key, new_issue.summary, changes)
+                )
+            old_issue = next(old_iter, None)
+            new_issue = next(new_iter, None)
+        elif old_issue.key < new_issue.key:
+            result.removed.append(old_issue)
+            old_issue = next(old_iter, None)
+        else:
+            result.added.append(new_issue)
+            new_issue = next(new_iter, None)
+
+    if old_issue is not None:
+        result.removed.append(old_issue)
+        result.removed.extend(old_iter)
+    if new_issue is not None:
+        result.added.append(new_issue)
+        result.added.extend(new_iter)
+    return result
+
+
+def snapshot_cache_file(spec: str) -> Path | None:
+    """Return the cache database a snapshot spec points to, if any."""
+    path = Path(spec)
+    if path.is_dir() and (path / CACHE_FILENAME).is_file():
+        return path / CACHE_FILENAME
+    if path.is_file() and path.suffix in _CACHE_SUFFIXES:
+        return path
+    return None
+
+
+def iter_snapshot(
+    spec: str, full: bool = False, workers: int | None = None
+) -> Iterator[Issue]:
+    """Stream the issues of a snapshot in ascending key order.
+
+    Args:
+        spec: Export file, directory of exports or glob, or an export cache
+            file (or directory holding one)
+        full: Read issues parsed in full extraction mode
+        workers: Worker processes when the spec names several export files
+
+    Yields:
+        Issues sorted by key
+
+    Raises:
+        FileNotFoundError: If the spec matches neither a cache nor any export
+    """
+    cache_file = snapshot_cache_file(spec)
+    if cache_file is not None:
+        variant = "full" if full else "basic"
+        for data in iter_cached_issues(cache_file, variant):
+            yield Issue.from_dict(data)
+        return
+
+    xml_paths = resolve_xml_paths(spec)
+    if not xml_paths:
+        raise FileNotFoundError(f"No Jira export or cache found at {spec}")
+    if len(xml_paths) == 1:
+        # Deduplicated like several files: the merge pass needs unique keys
+        issues = merge_issues([iter_jira_xml(xml_paths[0], full=full)])
+    else:
+        issues = parse_jira_exports(xml_paths, workers=workers, full=full)
+    issues.sort(key=attrgetter("key"))
+    yield from issues
+
+
+def _format_value(value: str | None) -> str:
+    """Render a field value for the changelog."""
+    return f"`{value}`" if value else "_none_"
+
+
+def generate_changelog_markdown(
+    changes: ChangeSet, old_label: str = "old", new_label: str = "new"
+) -> str:
+    """Generate a markdown changelog section for a change set.
+
+    Args:
+        changes: Change set from ``diff_issues()``
+        old_label: Name of the older snapshot
+        new_label: Name of the newer snapshot
+
+    Returns:
+        Markdown content
+    """
+    lines = []
+    lines.append(f"## Changelog: {old_label} → {new_label}")
+    lines.append("")
+    lines.append(
+        f"**New issues**: {len(changes.added)} | "
+        f"**Removed issues**: {len(changes.removed)} | "
+        f"**Changed issues**: {len(changes.changed)}"
+    )
+    lines.append("")
+
+    if not changes:
+        lines.append("No changes.")
+        lines.append("")
+        return "\n".join(lines)
+
+    if changes.added:
+        lines.append(f"### New issues ({len(changes.added)})")
+        lines.append("")
+        for issue in changes.added:
+            lines.append(
+                f"- **{issue.key}** [{issue.issue_type}] {issue.summary} "
+                f"({issue.status})"
+            )
+        lines.append("")
+
+    if changes.removed:
+        lines.append(f"### Removed issues ({len(changes.removed)})")
+        lines.append("")
+        for issue in changes.removed:
+            lines.append(f"- **{issue.key}** [{issue.issue_type}] {issue.summary}")
+        lines.append("")
+
+    # Bucket every field change into its section in one pass
+    sections: dict[str, list[str]] = {}
+    for title in _SECTION_FIELDS.values():
+        sections.setdefault(title, [])
+    sections["Other changes"] = []
+    for issue_change in changes.changed:
+        for change in issue_change.changes:
+            title = _SECTION_FIELDS.get(change.field, "Other changes")
+            label = DIFF_FIELDS[change.field]
+            prefix = "" if change.field in ("status", "assignee") else f"{label}: "
+            sections[title].append(
+                f"- **{issue_change.key}** {issue_change.summary}: {prefix}"
+                f"{_format_value(change.old)} → {_format_value(change.new)}"
+            )
+
+    for title, entries in sections.items():
+        if entries:
+            lines.append(f"### {title} ({len(entries)})")
+            lines.append("")
+            lines.extend(entries)
+            lines.append("")
+
+    return "\n".join(lines)
+
+
+def main():
+    """Diff two Jira snapshots and write the JSON and markdown reports."""
+    parser = argparse.ArgumentParser(
+        description="Compare two Jira exports or export cache snapshots",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "old",
+        type=str,
+        help="Older snapshot: export file, directory or glob, or a cache file",
+    )
+    parser.add_argument(
+        "new",
+        type=str,
+        help="Newer snapshot: export file, directory or glob, or a cache file",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=str,
+        default="docs/suppathletik",
+        help="Output directory for the change reports (default: docs/suppathletik)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes when a snapshot spans several export files "
+        "(default: one per CPU core)",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Parse exports in full extraction mode / read full-mode cache entries",
+    )
+
+    args = parser.parse_args()
+
+    try:
+        changes = diff_issues(
+            iter_snapshot(args.old, args.full, args.workers),
+            iter_snapshot(args.new, args.full, args.workers),
+        )
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    print(
+        f"\n{len(changes.added)} new, {len(changes.removed)} removed, "
+        f"{len(changes.changed)} changed issues"
+    )
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    json_file = output_dir / "suppathletik-changes.json"
+    json_file.write_text(
+        json.dumps(changes.to_dict(), indent=2, ensure_ascii=False) + "\n",
+        encoding="utf-8",
+    )
+    print(f"  Generated: {json_file}")
+
+    changelog_file = output_dir / "suppathletik-changelog.md"
+    changelog_file.write_text(
+        generate_changelog_markdown(changes, Path(args.old).name, Path(args.new).name),
+        encoding="utf-8",
+    )
+    print(f"  Generated: {changelog_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""On-disk cache of parsed Jira XML export data.
+
+Stores already-cleaned issue dictionaries keyed by ``(key, updated)`` so that
+re-running ``parse_jira_xml.py`` on a fresh export only has to clean the
+issues that were added or changed since the previous run. The output of
+``clean_text()`` and ``format_description()`` is memoized alongside, keyed by
+a digest of the input text.
+"""
+
+import hashlib
+import json
+import sqlite3
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+# Bump whenever the shape of cached issues or the text conversion changes;
+# a cache written by another version is discarded on open.
+CACHE_VERSION = 4
+
+CACHE_FILENAME = "jira_export_cache.sqlite3"
+
+# Pending writes are flushed in one transaction once this many accumulate
+_FLUSH_THRESHOLD = 1000
+
+
+class ExportCache:
+    """SQLite-backed cache of cleaned issues and converted text."""
+
+    def __init__(self, cache_dir: Path):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            cache_dir: Directory holding the cache file.
+        """
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.path = cache_dir / CACHE_FILENAME
+        self.hits = 0
+        self.misses = 0
+        self._pending_issues: list[tuple[str, str, str, str]] = []
+        self._pending_texts: list[tuple[str, bytes, str]] = []
+
+        self._conn = sqlite3.connect(self.path, timeout=60.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != CACHE_VERSION:
+            self._conn.executescript(
+                """
+                DROP TABLE IF EXISTS issues;
+                DROP TABLE IF EXISTS texts;
+                """
+            )
+            self._conn.execute(f"PRAGMA user_version={CACHE_VERSION}")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS issues (
+                variant TEXT NOT NULL,
+                key TEXT NOT NULL,
+                updated TEXT NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (variant, key)
+            );
+            CREATE TABLE IF NOT EXISTS texts (
+                kind TEXT NOT NULL,
+                digest BLOB NOT NULL,
+                value TEXT NOT NULL,
+                PRIMARY KEY (kind, digest)
+            );
+            """
+        )
+        self._conn.commit()
+
+    def __enter__(self) -> "ExportCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def get_issue(
+        self, key: str, updated: str, variant: str = "basic"
+    ) -> dict[str, Any] | None:
+        """
+        Look up a cleaned issue.
+
+        Args:
+            key: Issue key.
+            updated: Raw ``updated`` timestamp from the export.
+            variant: Extraction mode the issue was parsed with.
+
+        Returns:
+            The cached issue dictionary, or None if the issue is not cached or
+            has changed since it was cached.
+        """
+        row = self._conn.execute(
+            "SELECT data FROM issues WHERE variant = ? AND key = ? AND updated = ?",
+            (variant, key, updated),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put_issue(self, issue: dict[str, Any], variant: str = "basic") -> None:
+        """
+        Store a cleaned issue, replacing any older version of the same key.
+
+        Args:
+            issue: Issue dictionary as produced by the parser.
+            variant: Extraction mode the issue was parsed with.
+        """
+        self._pending_issues.append(
+            (
+                variant,
+                issue.get("key", ""),
+                issue.get("updated", ""),
+                json.dumps(issue, ensure_ascii=False),
+            )
+        )
+        if len(self._pending_issues) >= _FLUSH_THRESHOLD:
+            self.flush()
+
+    def memoize(self, kind: str, text: str, func: Callable[[str], str]) -> str:
+        """
+        Return ``func(text)``, computing it only if not already cached.
+
+        Args:
+            kind: Name of the conversion, including any parameters that
+                affect its output (e.g. ``"format_description:400"``).
+            text: Input text.
+            func: Conversion to apply on a cache miss.
+
+        Returns:
+            Converted text.
+        """
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        row = self._conn.execute(
+            "SELECT value FROM texts WHERE kind = ? AND digest = ?", (kind, digest)
+        ).fetchone()
+        if row is not None:
+            return row[0]
+
+        value = func(text)
+        self._pending_texts.append((kind, digest, value))
+        if len(self._pending_texts) >= _FLUSH_THRESHOLD:
+            self.flush()
+        return value
+
+    def flush(self) -> None:
+        """Write pending entries to disk in a single transaction."""
+        if not self._pending_issues and not self._pending_texts:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO issues (variant, key, updated, data) "
+                "VALUES (?, ?, ?, ?)",
+                self._pending_issues,
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO texts (kind, digest, value) VALUES (?, ?, ?)",
+                self._pending_texts,
+            )
+        self._pending_issues.clear()
+        self._pending_texts.clear()
+
+    def close(self) -> None:
+        """Flush pending entries and close the database."""
+        self.flush()
+        self._conn.close()
+
+
+def cached_issues_digest(path: Path, variant: str = "basic") -> str:
+    """
+    Fingerprint the issues stored in a cache file by their keys and versions.
+
+    Unlike the file's size and mtime, the digest only changes when cached
+    issues are added, removed or updated (readers touch the WAL files).
+
+    Args:
+        path: Cache database file (see ``CACHE_FILENAME``).
+        variant: Extraction mode whose issues to fingerprint.
+
+    Returns:
+        Hex digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        digest.update(f"{version}\0".encode())
+        for key, updated in conn.execute(
+            "SELECT key, updated FROM issues WHERE variant = ? ORDER BY key",
+            (variant,),
+        ):
+            digest.update(f"{key}\0{updated}\0".encode())
+    finally:
+        conn.close()
+    return digest.hexdigest()
+
+
+def iter_cached_issues(path: Path, variant: str = "basic") -> Iterator[dict[str, Any]]:
+    """
+    Stream the issues stored in a cache file, sorted by key.
+
+    The database is opened read-only, so a copied cache file can be used as
+    a snapshot of an export without being modified or reset.
+
+    Args:
+        path: Cache database file (see ``CACHE_FILENAME``).
+        variant: Extraction mode whose issues to read.
+
+    Yields:
+        Issue dictionaries in ascending key order.
+
+    Raises:
+        ValueError: If the cache was written by another cache version.
+    """
+    conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != CACHE_VERSION:
+            raise ValueError(
+                f"{path} was written by cache version {version}, "
+                f"expected {CACHE_VERSION}"
+            )
+        # Served in key order straight from the (variant, key) primary key
+        for (data,) in conn.execute(
+            "SELECT data FROM issues WHERE variant = ? ORDER BY key", (variant,)
+        ):
+            yield json.loads(data)
+    finally:
+        conn.close()
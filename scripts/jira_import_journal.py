@@ -0,0 +1,152 @@
+"""Append-only journal of Jira create requests for resumable imports.
+
+Every bulk-create request is logged *before* it is sent, and its outcome
+(created keys or failures) as soon as the response arrives. Each record is
+one JSON line, flushed and fsynced, so after a crash the journal tells
+exactly which issues were created, which failed, and which requests were in
+flight with no recorded answer ("in doubt"). Only the in-doubt issues, at
+most one batch per worker, need to be checked against Jira when resuming.
+
+Records:
+
+- ``{"event": "request", "batch": id, "at": iso-time, "keys": [local, ...]}``
+- ``{"event": "created", "batch": id, "keys": {local: remote, ...}}``
+- ``{"event": "failed", "batch": id, "errors": {local: reason, ...}}``
+"""
+
+import json
+import os
+import threading
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, TextIO
+
+
+@dataclass(slots=True)
+class JournalState:
+    """What a journal says about the issues of an import."""
+
+    # Local key -> remote key
+    created: dict[str, str] = field(default_factory=dict)
+    # Local key -> when its unanswered create request was sent
+    in_doubt: dict[str, datetime] = field(default_factory=dict)
+    records: int = 0
+
+
+class ImportJournal:
+    """Thread-safe append-only JSONL journal."""
+
+    def __init__(self, path: Path):
+        """
+        Use a journal file; it is created on the first record.
+
+        Args:
+            path: JSONL file
+        """
+        self.path = path
+        self._file: TextIO | None = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "ImportJournal":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the journal file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _append(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+                if not _ends_with_newline(self.path):
+                    # Terminate a line torn by a crash so this record stays whole
+                    line = "\n" + line
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def request(self, keys: list[str]) -> str:
+        """Log a create request about to be sent; returns its batch id."""
+        batch = uuid.uuid4().hex[:12]
+        self._append(
+            {
+                "event": "request",
+                "batch": batch,
+                "at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "keys": keys,
+            }
+        )
+        return batch
+
+    def created(self, batch: str | None, keys: dict[str, str]) -> None:
+        """Log issues created by a request (or found in Jira when recovering)."""
+        if keys:
+            self._append({"event": "created", "batch": batch, "keys": keys})
+
+    def failed(self, batch: str | None, errors: dict[str, str]) -> None:
+        """Log issues Jira definitely did not create."""
+        if errors:
+            self._append({"event": "failed", "batch": batch, "errors": errors})
+
+    def replay(self) -> JournalState:
+        """Read the journal back into created and in-doubt issues.
+
+        A torn last line (from a crash while writing) is ignored: the request
+        it belonged to then simply stays in doubt.
+
+        Returns:
+            JournalState
+        """
+        state = JournalState()
+        pending: dict[str, datetime] = {}
+        if not self.path.exists():
+            return state
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                state.records += 1
+                event = record.get("event")
+                if event == "request":
+                    sent = datetime.fromisoformat(record["at"])
+                    for key in record["keys"]:
+                        pending[key] = sent
+                elif event == "created":
+                    for key, remote in record["keys"].items():
+                        state.created[key] = remote
+                        pending.pop(key, None)
+                elif event == "failed":
+                    for key in record["errors"]:
+                        pending.pop(key, None)
+        state.in_doubt = {
+            key: sent for key, sent in pending.items() if key not in state.created
+        }
+        return state
+
+
+def _ends_with_newline(path: Path) -> bool:
+    """Whether a file is empty or its last byte is a newline."""
+    with open(path, "rb") as f:
+        if f.seek(0, os.SEEK_END) == 0:
+            return True
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+
+def default_journal_path(key_map_path: Path) -> Path:
+    """Return the journal location next to a key map file."""
+    return key_map_path.with_name(
+        f"{key_map_path.stem.removesuffix('-keymap')}-journal.jsonl"
+    )
@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Create the epic, parent and dependency links of an imported plan in Jira.
+
+Collects every relationship the planning JSON requires:
+
+- ``epic``: a story belongs to its epic (set through ``parent`` or the Epic
+  Link field with an issue update)
+- ``parent``: a task belongs to its story; satisfied by a subtask parent or
+  any issue link between the two, and otherwise created as an issue link
+  (``--parent-link-type``, for tasks created as standalone issues)
+- ``dependency``: the ``dependencies`` of the plan (``from`` blocks ``to``)
+
+Planning keys are translated with the import key map (and journal, see
+import_to_jira.py). Relationships already present in a fresh XML export,
+read in full mode for its ``<issuelinks>``, are skipped; the rest are sent
+through a bounded pool of worker threads sharing the client's rate limit,
+with rate-limited requests retried.
+
+Usage:
+    python scripts/jira_links.py "Jira (1).xml" --dry-run
+    JIRA_URL=... JIRA_USERNAME=... JIRA_API_TOKEN=... \\
+        python scripts/jira_links.py "Jira (1).xml" --concurrency 8
+"""
+
+import argparse
+import contextlib
+import json
+import sys
+import time
+from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from import_to_jira import (
+    DEFAULT_PLAN,
+    FieldConfig,
+    KeyMap,
+    default_key_map_path,
+    load_plan,
+)
+from jira_client import JiraClient, JiraError
+from jira_diff import iter_snapshot
+from jira_import_journal import ImportJournal, default_journal_path
+from parse_jira_xml import Issue, epic_key_of, epic_keys_by_name
+
+# Dependency types of the planning JSON -> Jira link type names
+LINK_TYPES = {
+    "blocks": "Blocks",
+    "relates": "Relates",
+    "duplicates": "Duplicate",
+    "clones": "Cloners",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class PlannedLink:
+    """A relationship the plan requires, between two planning keys."""
+
+    # "epic", "parent" or "dependency"
+    kind: str
+    # Child (epic, parent) or the issue the outward description applies to
+    outward: str
+    # Epic or story (epic, parent) or the other end of the dependency
+    inward: str
+    # Jira link type name; empty for epic relationships
+    link_type: str = ""
+
+    def describe(self) -> str:
+        """Return a one-line description of the relationship."""
+        if self.kind == "dependency":
+            return f"{self.outward} -[{self.link_type}]-> {self.inward}"
+        return f"{self.outward} in {self.kind} {self.inward}"
+
+
+def collect_links(plan_path: Path, parent_link_type: str) -> list[PlannedLink]:
+    """Collect the epic, parent and dependency links of a planning JSON.
+
+    Args:
+        plan_path: Planning JSON file
+        parent_link_type: Link type used for tasks not created as subtasks
+
+    Returns:
+        Planned links, epics first, then parents, then dependencies
+    """
+    links = []
+    for issue in load_plan(plan_path):
+        if issue.parent is None:
+            continue
+        if issue.level == "story":
+            links.append(PlannedLink("epic", issue.key, issue.parent))
+        else:
+            links.append(
+                PlannedLink("parent", issue.key, issue.parent, parent_link_type)
+            )
+
+    with open(plan_path, "r", encoding="utf-8") as f:
+        dependencies = json.load(f).get("dependencies", [])
+    for dependency in dependencies:
+        kind = dependency.get("type", "blocks")
+        links.append(
+            PlannedLink(
+                "dependency",
+                dependency["from"],
+                dependency["to"],
+                LINK_TYPES.get(kind.lower(), kind),
+            )
+        )
+    return links
+
+
+class ExistingLinks:
+    """Relationships present in an export, indexed by Jira key."""
+
+    def __init__(self, issues: Iterable[Issue]):
+        """
+        Index the parents, epic links and issue links of exported issues.
+
+        Args:
+            issues: Issues parsed in full extraction mode
+        """
+        # (lowercased link type, outward key, inward key)
+        self.links: set[tuple[str, str, str]] = set()
+        # Unordered pairs of linked keys, whatever the link type
+        self.pairs: set[frozenset[str]] = set()
+        # Key -> parent and epic keys
+        self.parents: dict[str, set[str]] = {}
+        self.issues = 0
+        # Epic Links hold epic names, resolved once every epic has been seen
+        epics: list[Issue] = []
+        epic_linked: list[Issue] = []
+        for issue in issues:
+            self.issues += 1
+            if issue.issue_type_lower == "epic":
+                epics.append(issue)
+            if issue.epic_link:
+                epic_linked.append(issue)
+            if issue.parent_key:
+                self.parents[issue.key] = {issue.parent_key}
+            for link in issue.links:
+                if link.direction == "outward":
+                    outward, inward = issue.key, link.key
+                else:
+                    outward, inward = link.key, issue.key
+                self.links.add((link.link_type.lower(), outward, inward))
+                self.pairs.add(frozenset((outward, inward)))
+        epic_keys = epic_keys_by_name(epics)
+        for issue in epic_linked:
+            self.parents.setdefault(issue.key, set()).add(
+                epic_key_of(issue, epic_keys)
+            )
+
+    def __contains__(self, link: object) -> bool:
+        """Whether a resolved ``(PlannedLink, outward, inward)`` exists."""
+        planned, outward, inward = link  # type: ignore[misc]
+        if planned.kind == "dependency":
+            return (planned.link_type.lower(), outward, inward) in self.links
+        if inward in self.parents.get(outward, ()):
+            return True
+        return planned.kind == "parent" and frozenset((outward, inward)) in self.pairs
+
+
+@dataclass(slots=True)
+class LinkReport:
+    """Outcome of a link run."""
+
+    created: int = 0
+    existing: int = 0
+    # Links with an end not created in Jira yet
+    unmapped: list[PlannedLink] = field(default_factory=list)
+    failed: dict[PlannedLink, str] = field(default_factory=dict)
+    seconds: float = 0.0
+
+
+def resolve_links(
+    links: list[PlannedLink], key_map: KeyMap, existing: ExistingLinks
+) -> tuple[list[tuple[PlannedLink, str, str]], LinkReport]:
+    """Translate planned links to Jira keys and drop those already present.
+
+    Args:
+        links: Planned links
+        key_map: Planning key -> Jira key map
+        existing: Relationships of a fresh export
+
+    Returns:
+        (links to create with their Jira keys, report of skipped links)
+    """
+    report = LinkReport()
+    pending = []
+    seen: set[tuple[PlannedLink, str, str]] = set()
+    for link in links:
+        outward, inward = key_map.get(link.outward), key_map.get(link.inward)
+        if outward is None or inward is None:
+            report.unmapped.append(link)
+            continue
+        resolved = (link, outward, inward)
+        if resolved in existing or resolved in seen:
+            report.existing += 1
+            continue
+        seen.add(resolved)
+        pending.append(resolved)
+    return pending, report
+
+
+class LinkCreator:
+    """Creates links through a bounded pool of worker threads."""
+
+    def __init__(
+        self,
+        client: JiraClient,
+        config: FieldConfig | None = None,
+        concurrency: int = 8,
+    ):
+        """
+        Configure the creator.
+
+        Args:
+            client: Jira client (shared by the worker threads)
+            config: Target project configuration (for epic relationships)
+            concurrency: Requests in flight at once
+        """
+        self.client = client
+        self.config = config or FieldConfig()
+        self.concurrency = concurrency
+
+    def _create(self, link: PlannedLink, outward: str, inward: str) -> None:
+        """Send the request that creates one relationship."""
+        if link.kind == "epic":
+            # Setting a field is idempotent, so transient failures are retried
+            if self.config.epic_link_field:
+                fields = {self.config.epic_link_field: inward}
+            else:
+                fields = {"parent": {"key": inward}}
+            self.client.request(
+                "PUT", f"/issue/{outward}", {"fields": fields}, idempotent=True
+            )
+        else:
+            self.client.request(
+                "POST",
+                "/issueLink",
+                {
+                    "type": {"name": link.link_type},
+                    "outwardIssue": {"key": outward},
+                    "inwardIssue": {"key": inward},
+                },
+            )
+
+    def run(
+        self, pending: list[tuple[PlannedLink, str, str]], report: LinkReport
+    ) -> LinkReport:
+        """Create every pending link, recording the outcome in ``report``.
+
+        Args:
+            pending: Links with their Jira keys (see ``resolve_links()``)
+            report: Report to complete
+
+        Returns:
+            The completed report
+        """
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = {
+                executor.submit(self._create, *resolved): resolved[0]
+                for resolved in pending
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except (JiraError, OSError) as e:
+                    # One dropped connection fails its link, not the whole run
+                    report.failed[futures[future]] = str(e)
+                else:
+                    report.created += 1
+        report.seconds = time.perf_counter() - started
+        return report
+
+
+def main():
+    """Create the links of the planning JSON in Jira."""
+    parser = argparse.ArgumentParser(
+        description="Create the epic, parent and dependency links of an imported "
+        "plan, skipping those already present in an XML export",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "export",
+        type=str,
+        help="Fresh Jira XML export (file, directory or glob) or export cache",
+    )
+    parser.add_argument(
+        "--plan",
+        type=str,
+        default=str(DEFAULT_PLAN),
+        help="Planning JSON file (default: docs/pm/farmacias-macross-jira-import.json)",
+    )
+    parser.add_argument(
+        "--key-map",
+        type=str,
+        default=None,
+        help="Planning key -> Jira key map written by import_to_jira.py "
+        "(default: <plan>-keymap.json next to the plan)",
+    )
+    parser.add_argument(
+        "--journal",
+        type=str,
+        default=None,
+        help="Import journal replayed over the key map "
+        "(default: <plan>-journal.jsonl next to the key map)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Link requests in flight at once (default: 8)",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=5.0,
+        help="Maximum requests per second to Jira (default: 5)",
+    )
+    parser.add_argument(
+        "--parent-link-type",
+        type=str,
+        default="Relates",
+        help="Link type joining a task that is not a subtask to its story "
+        "(default: Relates)",
+    )
+    parser.add_argument(
+        "--epic-link-field",
+        type=str,
+        default=None,
+        help="Custom field id of Epic Link; without it stories use 'parent'",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only print the links that would be created",
+    )
+
+    args = parser.parse_args()
+
+    plan_path = Path(args.plan)
+    key_map_path = (
+        Path(args.key_map) if args.key_map else default_key_map_path(plan_path)
+    )
+    journal = ImportJournal(
+        Path(args.journal) if args.journal else default_journal_path(key_map_path)
+    )
+    key_map = KeyMap(key_map_path, journal)
+    links = collect_links(plan_path, args.parent_link_type)
+
+    # Parsing progress goes to stderr
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            existing = ExistingLinks(iter_snapshot(args.export, full=True))
+        except FileNotFoundError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+
+    pending, report = resolve_links(links, key_map, existing)
+    kinds = Counter(link.kind for link, _, _ in pending)
+    print(
+        f"{len(links)} planned links: {report.existing} already in the export "
+        f"({existing.issues} issues), {len(report.unmapped)} with an issue not "
+        f"created yet, {len(pending)} to create "
+        f"({kinds['epic']} epic, {kinds['parent']} parent, "
+        f"{kinds['dependency']} dependency)"
+    )
+
+    if args.dry_run:
+        for link, outward, inward in pending:
+            print(f"  {link.describe()}  ({outward} -> {inward})")
+        return
+    if not pending:
+        return
+
+    try:
+        client = JiraClient.from_env(rate=args.rate)
+    except JiraError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    creator = LinkCreator(
+        client,
+        FieldConfig(epic_link_field=args.epic_link_field),
+        concurrency=args.concurrency,
+    )
+    creator.run(pending, report)
+    print(f"Created {report.created} links ({report.seconds:.1f}s)")
+    if report.failed:
+        print(f"{len(report.failed)} links failed:")
+        for link, reason in report.failed.items():
+            print(f"  {link.describe()}: {reason}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
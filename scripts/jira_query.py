@@ -0,0 +1,509 @@
+#!/usr/bin/env python3
+"""
+Filter parsed Jira issues by status, type, label, assignee, epic, dates and
+free text.
+
+Issues are loaded once from a Jira XML export or, much faster, from an export
+cache written by ``parse_jira_xml.py --cache-dir``. Inverted indexes over
+every filterable field are then built in a single pass, so each filter is a
+set lookup (or a bisect for date ranges) and a query is an intersection of
+posting sets.
+
+The built index is saved next to the export cache (or the exports) as
+``jira_query_index.json``, keyed by a fingerprint of the source files, and
+later queries on an unchanged source load it instead of reading the issues
+again.
+
+Usage:
+    python scripts/jira_query.py .cache/jira --status "To Do" --epic SD-42
+    python scripts/jira_query.py export.xml --text checkout --format csv
+"""
+
+import argparse
+import contextlib
+import csv
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from bisect import bisect_left
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from operator import attrgetter
+from pathlib import Path
+
+from jira_diff import iter_snapshot, snapshot_cache_file
+from jira_export_cache import cached_issues_digest
+from parse_jira_xml import (
+    Issue,
+    organize_issues,
+    render_task_lines,
+    resolve_xml_paths,
+)
+
+_TERM_RE = re.compile(r"\w+")
+
+INDEX_CACHE_FILENAME = "jira_query_index.json"
+
+# Bump whenever the indexes or their saved layout change; older files are rebuilt
+INDEX_CACHE_VERSION = 1
+
+# Fields with an inverted index; also the names of the CLI filters
+INDEXED_FIELDS = ("status", "type", "priority", "label", "assignee", "epic")
+
+# Date fields usable in ranges -> Issue attribute
+DATE_FIELDS = {
+    "created": "created_at",
+    "updated": "updated_at",
+    "resolved": "resolved_at",
+    "due": "due_at",
+}
+
+CSV_COLUMNS = (
+    "key",
+    "issuetype",
+    "status",
+    "priority",
+    "assignee",
+    "epic",
+    "labels",
+    "created",
+    "updated",
+    "resolved",
+    "summary",
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercased word terms."""
+    return _TERM_RE.findall(text.lower())
+
+
+class IssueIndex:
+    """Inverted indexes over a set of issues.
+
+    Rows are the issues sorted by key; every index maps a value to the set of
+    rows holding it, and date indexes keep (timestamp, row) pairs sorted by
+    timestamp for range lookups.
+    """
+
+    __slots__ = ("issues", "epic_of", "fields", "terms", "dates")
+
+    def __init__(self, issues: Iterable[Issue], epic_of: dict[str, str] | None = None):
+        """
+        Build every index in one pass over the issues.
+
+        Args:
+            issues: Parsed issues
+            epic_of: Issue key -> epic key (see ``IssueGraph.epic_by_issue()``)
+        """
+        self.issues = sorted(issues, key=attrgetter("key"))
+        self.epic_of = epic_of or {}
+        self.fields: dict[str, dict[str, set[int]]] = {
+            name: {} for name in INDEXED_FIELDS
+        }
+        self.terms: dict[str, set[int]] = {}
+        dated: dict[str, list[tuple[datetime, int]]] = {
+            name: [] for name in DATE_FIELDS
+        }
+
+        for row, issue in enumerate(self.issues):
+            values = {
+                "status": (issue.status,),
+                "type": (issue.issue_type,),
+                "priority": (issue.priority,),
+                "label": issue.labels,
+                "assignee": (issue.assignee,),
+                "epic": (self.epic_of.get(issue.key),),
+            }
+            for name, field_values in values.items():
+                postings = self.fields[name]
+                for value in field_values:
+                    if value:
+                        postings.setdefault(value.lower(), set()).add(row)
+
+            for term in set(tokenize(issue.summary)).union(tokenize(issue.description)):
+                self.terms.setdefault(term, set()).add(row)
+
+            for name, attr in DATE_FIELDS.items():
+                value = getattr(issue, attr)
+                if value is not None:
+                    dated[name].append((value, row))
+
+        self.dates: dict[str, tuple[list[datetime], list[int]]] = {}
+        for name, pairs in dated.items():
+            pairs.sort()
+            self.dates[name] = ([p[0] for p in pairs], [p[1] for p in pairs])
+
+    def __len__(self) -> int:
+        return len(self.issues)
+
+    def save(self, path: Path, fingerprint: str) -> None:
+        """Write the issues and indexes to a JSON file atomically.
+
+        Args:
+            path: Index cache file
+            fingerprint: Fingerprint of the source (see ``source_fingerprint()``)
+        """
+        data = {
+            "version": INDEX_CACHE_VERSION,
+            "fingerprint": fingerprint,
+            "issues": [issue.to_dict() for issue in self.issues],
+            "epic_of": self.epic_of,
+            "fields": {
+                name: {value: sorted(rows) for value, rows in postings.items()}
+                for name, postings in self.fields.items()
+            },
+            "terms": {term: sorted(rows) for term, rows in self.terms.items()},
+            "dates": {
+                name: [[stamp.isoformat() for stamp in stamps], rows]
+                for name, (stamps, rows) in self.dates.items()
+            },
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path, fingerprint: str) -> "IssueIndex | None":
+        """Load an index saved by ``save()`` for the same source.
+
+        Args:
+            path: Index cache file
+            fingerprint: Fingerprint of the source being queried
+
+        Returns:
+            The index, or None if the file is missing, unreadable or was
+            built from another version of the source
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (
+            data.get("version") != INDEX_CACHE_VERSION
+            or data.get("fingerprint") != fingerprint
+        ):
+            return None
+
+        index = cls.__new__(cls)
+        index.issues = [Issue.from_dict(issue) for issue in data["issues"]]
+        index.epic_of = data["epic_of"]
+        index.fields = {
+            name: {value: set(rows) for value, rows in postings.items()}
+            for name, postings in data["fields"].items()
+        }
+        index.terms = {term: set(rows) for term, rows in data["terms"].items()}
+        index.dates = {
+            name: ([datetime.fromisoformat(stamp) for stamp in stamps], rows)
+            for name, (stamps, rows) in data["dates"].items()
+        }
+        return index
+
+    def match_field(self, name: str, values: Iterable[str]) -> set[int]:
+        """Return the rows whose ``name`` field equals any of ``values``."""
+        postings = self.fields[name]
+        rows: set[int] = set()
+        for value in values:
+            rows |= postings.get(value.lower(), set())
+        return rows
+
+    def match_terms(self, text: str) -> set[int]:
+        """Return the rows whose summary or description contain every term."""
+        postings = sorted(
+            (self.terms.get(term, set()) for term in set(tokenize(text))), key=len
+        )
+        if not postings:
+            return set(range(len(self.issues)))
+        return set.intersection(*postings)
+
+    def match_dates(
+        self, name: str, after: datetime | None, before: datetime | None
+    ) -> set[int]:
+        """Return the rows whose ``name`` date is in ``[after, before)``."""
+        stamps, rows = self.dates[name]
+        start = bisect_left(stamps, after) if after is not None else 0
+        end = bisect_left(stamps, before) if before is not None else len(stamps)
+        return set(rows[start:end])
+
+    def search(
+        self,
+        fields: dict[str, list[str]] | None = None,
+        text: str = "",
+        dates: dict[str, tuple[datetime | None, datetime | None]] | None = None,
+    ) -> list[Issue]:
+        """Return the issues matching every filter, sorted by key.
+
+        Values given for the same field are alternatives; different fields,
+        free-text terms and date ranges must all match.
+
+        Args:
+            fields: Indexed field -> accepted values (case-insensitive)
+            text: Free-text terms searched in summaries and descriptions
+            dates: Date field -> (inclusive start, exclusive end)
+
+        Returns:
+            Matching issues
+        """
+        candidates = [
+            self.match_field(name, values)
+            for name, values in (fields or {}).items()
+            if values
+        ]
+        if text.strip():
+            candidates.append(self.match_terms(text))
+        for name, (after, before) in (dates or {}).items():
+            if after is not None or before is not None:
+                candidates.append(self.match_dates(name, after, before))
+
+        if not candidates:
+            return list(self.issues)
+        # Intersect starting from the most selective filter
+        candidates.sort(key=len)
+        rows = candidates[0].intersection(*candidates[1:])
+        return [self.issues[row] for row in sorted(rows)]
+
+
+def source_fingerprint(spec: str, full: bool) -> str:
+    """Fingerprint a source: its cached issues, or its export files' stats.
+
+    Export files are fingerprinted by path, size and mtime; an export cache
+    by the keys and ``updated`` timestamps it holds.
+
+    Args:
+        spec: Export file, directory or glob, or an export cache
+        full: Whether issues are read in full extraction mode
+
+    Returns:
+        Hex digest
+
+    Raises:
+        FileNotFoundError: If the spec matches neither a cache nor any export
+    """
+    cache_file = snapshot_cache_file(spec)
+    if cache_file is not None:
+        variant = "full" if full else "basic"
+        parts: list = [
+            str(cache_file.resolve()),
+            cached_issues_digest(cache_file, variant),
+        ]
+    else:
+        xml_paths = resolve_xml_paths(spec)
+        if not xml_paths:
+            raise FileNotFoundError(f"No Jira export or cache found at {spec}")
+        parts = []
+        for path in xml_paths:
+            stat = path.stat()
+            parts.append((str(path.resolve()), stat.st_size, stat.st_mtime_ns))
+    payload = json.dumps([INDEX_CACHE_VERSION, full, parts]).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def default_index_cache_path(spec: str) -> Path:
+    """Return the index cache location next to the export cache or exports."""
+    cache_file = snapshot_cache_file(spec)
+    if cache_file is not None:
+        return cache_file.parent / INDEX_CACHE_FILENAME
+    xml_paths = resolve_xml_paths(spec)
+    base = xml_paths[0].parent if xml_paths else Path(spec).parent
+    return base / INDEX_CACHE_FILENAME
+
+
+def parse_date(value: str) -> datetime:
+    """Parse an ISO date or datetime from the command line (UTC if naive)."""
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date: {value!r}") from None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def format_json(issues: list[Issue], index: IssueIndex) -> str:
+    """Render matching issues as a JSON array of issue dictionaries."""
+    records = []
+    for issue in issues:
+        record = issue.to_dict()
+        epic = index.epic_of.get(issue.key)
+        if epic:
+            record["epic"] = epic
+        records.append(record)
+    return json.dumps(records, indent=2, ensure_ascii=False) + "\n"
+
+
+def format_csv(issues: list[Issue], index: IssueIndex) -> str:
+    """Render matching issues as CSV with one row per issue."""
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(CSV_COLUMNS)
+    for issue in issues:
+        writer.writerow(
+            (
+                issue.key,
+                issue.issue_type,
+                issue.status,
+                issue.priority,
+                issue.assignee or "",
+                index.epic_of.get(issue.key, ""),
+                ";".join(issue.labels),
+                issue.created,
+                issue.updated,
+                issue.resolved,
+                issue.summary,
+            )
+        )
+    return out.getvalue()
+
+
+def format_markdown(issues: list[Issue], index: IssueIndex) -> str:
+    """Render matching issues as the task lines used in the epics markdown."""
+    lines = []
+    for issue in issues:
+        lines.extend(render_task_lines(issue))
+        lines.append("")
+    return "\n".join(lines)
+
+
+FORMATTERS = {
+    "json": format_json,
+    "csv": format_csv,
+    "markdown": format_markdown,
+}
+
+
+def main():
+    """Load the issues, build the indexes and print the matching issues."""
+    parser = argparse.ArgumentParser(
+        description="Query parsed Jira issues by field, date range and text",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "source",
+        type=str,
+        help="Export file, directory or glob, or an export cache file "
+        "(or directory holding one)",
+    )
+    for name, help_text in (
+        ("status", "Status name"),
+        ("type", "Issue type name"),
+        ("priority", "Priority name"),
+        ("label", "Label"),
+        ("assignee", "Assignee display name"),
+        ("epic", "Epic key the issue rolls up to"),
+    ):
+        parser.add_argument(
+            f"--{name}",
+            action="append",
+            default=[],
+            metavar="VALUE",
+            help=f"{help_text}; repeat to accept several values",
+        )
+    parser.add_argument(
+        "--text",
+        type=str,
+        default="",
+        help="Terms that must all appear in the summary or description",
+    )
+    for name in DATE_FIELDS:
+        parser.add_argument(
+            f"--{name}-after",
+            type=parse_date,
+            default=None,
+            metavar="DATE",
+            help=f"Only issues {name} on or after this ISO date/datetime",
+        )
+        parser.add_argument(
+            f"--{name}-before",
+            type=parse_date,
+            default=None,
+            metavar="DATE",
+            help=f"Only issues {name} before this ISO date/datetime",
+        )
+    parser.add_argument(
+        "--format",
+        choices=sorted(FORMATTERS),
+        default="markdown",
+        help="Output format (default: markdown task lines)",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Parse exports in full extraction mode / read full-mode cache entries",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes when the source spans several export files "
+        "(default: one per CPU core)",
+    )
+    parser.add_argument(
+        "--index-cache",
+        type=str,
+        default=None,
+        help=f"Saved index file (default: {INDEX_CACHE_FILENAME} next to the "
+        "export cache or exports)",
+    )
+    parser.add_argument(
+        "--no-index-cache",
+        action="store_true",
+        help="Always rebuild the indexes and do not save them",
+    )
+
+    args = parser.parse_args()
+
+    # Keep stdout for the query results
+    started = time.perf_counter()
+    try:
+        fingerprint = source_fingerprint(args.source, args.full)
+        cache_path = None
+        if not args.no_index_cache:
+            cache_path = (
+                Path(args.index_cache)
+                if args.index_cache
+                else default_index_cache_path(args.source)
+            )
+        index = IssueIndex.load(cache_path, fingerprint) if cache_path else None
+        source = "loaded"
+        if index is None:
+            source = "indexed"
+            with contextlib.redirect_stdout(sys.stderr):
+                issues = list(iter_snapshot(args.source, args.full, args.workers))
+            index = IssueIndex(issues, organize_issues(issues)["graph"].epic_by_issue())
+            if cache_path is not None:
+                try:
+                    index.save(cache_path, fingerprint)
+                except OSError as e:
+                    print(f"Warning: could not save {cache_path}: {e}", file=sys.stderr)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    loaded = time.perf_counter()
+
+    results = index.search(
+        fields={name: getattr(args, name) for name in INDEXED_FIELDS},
+        text=args.text,
+        dates={
+            name: (getattr(args, f"{name}_after"), getattr(args, f"{name}_before"))
+            for name in DATE_FIELDS
+        },
+    )
+    queried = time.perf_counter()
+
+    sys.stdout.write(FORMATTERS[args.format](results, index))
+    print(
+        f"Matched {len(results)} of {len(index)} issues "
+        f"({source} in {(loaded - started) * 1000:.0f} ms, "
+        f"queried in {(queried - loaded) * 1000:.1f} ms)",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""
+Reconcile a planning JSON against a Jira XML export and report the drift.
+
+Each planned issue is matched to an exported issue in two passes, both hash
+lookups so matching stays linear in the size of the plan and the export:
+
+1. By mapped key: the import key map (and journal, see import_to_jira.py)
+   gives the Jira key of every issue the import created, which still
+   matches after a rename.
+2. By summary fingerprint: issues created outside the import (or whose key
+   map was lost) match on their summary, folded to lowercase ASCII words.
+
+The result is the minimal set of operations that brings Jira in line with
+the plan: ``create`` for planned issues not found, ``update`` for changed
+summaries, descriptions, priorities or labels, and ``move`` for issues under
+a different story or epic than planned. Exported issues the plan does not
+know about are listed as unplanned.
+
+Usage:
+    python scripts/jira_reconcile.py "Jira (1).xml"
+    python scripts/jira_reconcile.py exports/ --format json > drift.json
+"""
+
+import argparse
+import contextlib
+import json
+import re
+import sys
+import time
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from import_to_jira import (
+    DEFAULT_PLAN,
+    LEVELS,
+    KeyMap,
+    PlannedIssue,
+    default_key_map_path,
+    load_plan,
+    load_project_key,
+)
+from jira_diff import iter_snapshot
+from jira_import_journal import ImportJournal, default_journal_path
+from jira_search import fold
+from parse_jira_xml import Issue, epic_key_of, epic_keys_by_name
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# Operations are listed creates first, so moves can target created parents
+_OP_ORDER = {"create": 0, "update": 1, "move": 2}
+
+
+def fingerprint(text: str) -> str:
+    """Reduce text to its lowercase ASCII words, ignoring punctuation."""
+    return " ".join(_WORD_RE.findall(fold(text)))
+
+
+def _squash(text: str) -> str:
+    """Collapse runs of whitespace."""
+    return " ".join(text.split())
+
+
+def _level(issue: Issue) -> str:
+    """Return the planning level an exported issue most likely belongs to."""
+    if issue.issue_type_lower == "epic":
+        return "epic"
+    if issue.parent_key or "sub" in issue.issue_type_lower:
+        return "task"
+    return "story"
+
+
+@dataclass(slots=True)
+class Operation:
+    """One change needed to bring Jira in line with the plan."""
+
+    # "create", "update" or "move"
+    op: str
+    # Planning key
+    key: str
+    summary: str
+    # Jira key of the matched issue (None for creates)
+    jira_key: str | None = None
+    # Field -> [Jira value, planned value] (updates and moves)
+    changes: dict[str, list[Any]] = field(default_factory=dict)
+    # Planning key of the planned parent (creates and moves)
+    parent: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class Reconciliation:
+    """Outcome of reconciling a plan against an export."""
+
+    operations: list[Operation] = field(default_factory=list)
+    # Planning key -> Jira key, for every planned issue found in the export
+    matched: dict[str, str] = field(default_factory=dict)
+    # Matches found by summary fingerprint rather than the key map
+    discovered: dict[str, str] = field(default_factory=dict)
+    # Exported issues of the project that no planned issue matched
+    unplanned: list[Issue] = field(default_factory=list)
+
+    def count(self, op: str) -> int:
+        return sum(1 for operation in self.operations if operation.op == op)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "operations": [operation.to_dict() for operation in self.operations],
+            "matched": self.matched,
+            "discovered": self.discovered,
+            "unplanned": [
+                {"key": issue.key, "summary": issue.summary, "type": issue.issue_type}
+                for issue in self.unplanned
+            ],
+        }
+
+
+def _field_changes(planned: PlannedIssue, issue: Issue) -> dict[str, list[Any]]:
+    """Return the fields of an exported issue that differ from the plan."""
+    changes: dict[str, list[Any]] = {}
+    if _squash(planned.summary) != _squash(issue.summary):
+        changes["summary"] = [issue.summary, planned.summary]
+    # The export holds rendered descriptions; compare their words only
+    if planned.description and fingerprint(planned.description) != fingerprint(
+        issue.description
+    ):
+        changes["description"] = [issue.description, planned.description]
+    if planned.priority and planned.priority.lower() != issue.priority.lower():
+        changes["priority"] = [issue.priority, planned.priority]
+    if planned.labels and sorted(set(planned.labels)) != sorted(set(issue.labels)):
+        changes["labels"] = [sorted(issue.labels), sorted(planned.labels)]
+    return changes
+
+
+def _current_parents(
+    issue: Issue, level: str, epic_keys: dict[str, str]
+) -> set[str]:
+    """Return the keys an exported issue currently sits under."""
+    epic_key = epic_key_of(issue, epic_keys)
+    parents = {key for key in (issue.parent_key, epic_key) if key}
+    if level == "task":
+        # Tasks created as standalone issues hang off their story by a link
+        parents.update(link.key for link in issue.links)
+    return parents
+
+
+def reconcile(
+    plan: list[PlannedIssue],
+    issues: Iterable[Issue],
+    key_map: KeyMap,
+    project_key: str | None = None,
+) -> Reconciliation:
+    """Match a plan against exported issues and list the operations to sync.
+
+    Args:
+        plan: Planned issues, parents before children (see ``load_plan()``)
+        issues: Exported issues
+        key_map: Planning key -> Jira key map of the import
+        project_key: Only consider exported issues of this project
+
+    Returns:
+        Reconciliation
+    """
+    by_key = {
+        issue.key: issue
+        for issue in issues
+        if project_key is None or issue.project_key in (None, "", project_key)
+    }
+    # Epic Links hold epic names; parents are compared by key
+    epic_keys = epic_keys_by_name(
+        issue for issue in by_key.values() if issue.issue_type_lower == "epic"
+    )
+    result = Reconciliation()
+    claimed: set[str] = set()
+
+    # Pass 1: mapped keys
+    for planned in plan:
+        jira_key = key_map.get(planned.key)
+        if jira_key in by_key and jira_key not in claimed:
+            result.matched[planned.key] = jira_key
+            claimed.add(jira_key)
+
+    # Pass 2: summary fingerprints of the exported issues still unclaimed
+    by_fingerprint: dict[str, list[Issue]] = {}
+    for jira_key in sorted(by_key.keys() - claimed):
+        issue = by_key[jira_key]
+        by_fingerprint.setdefault(fingerprint(issue.summary), []).append(issue)
+    for planned in plan:
+        if planned.key in result.matched:
+            continue
+        candidates = by_fingerprint.get(fingerprint(planned.summary))
+        if not candidates:
+            continue
+        # Prefer an issue at the same level (epic, story or task)
+        index = next(
+            (i for i, c in enumerate(candidates) if _level(c) == planned.level), 0
+        )
+        issue = candidates.pop(index)
+        result.matched[planned.key] = issue.key
+        result.discovered[planned.key] = issue.key
+        claimed.add(issue.key)
+
+    for planned in plan:
+        jira_key = result.matched.get(planned.key)
+        if jira_key is None:
+            result.operations.append(
+                Operation(
+                    "create", planned.key, planned.summary, parent=planned.parent
+                )
+            )
+            continue
+        issue = by_key[jira_key]
+        changes = _field_changes(planned, issue)
+        if changes:
+            result.operations.append(
+                Operation("update", planned.key, planned.summary, jira_key, changes)
+            )
+        if planned.parent is None:
+            continue
+        parent_key = result.matched.get(planned.parent)
+        current = _current_parents(issue, planned.level, epic_keys)
+        if parent_key is None or parent_key not in current:
+            # The old parent is whichever issue it sits under, links aside
+            old_parent = issue.parent_key or epic_key_of(issue, epic_keys)
+            result.operations.append(
+                Operation(
+                    "move",
+                    planned.key,
+                    planned.summary,
+                    jira_key,
+                    {"parent": [old_parent, parent_key]},
+                    parent=planned.parent,
+                )
+            )
+
+    result.operations.sort(key=lambda operation: _OP_ORDER[operation.op])
+    result.unplanned = [by_key[key] for key in sorted(by_key.keys() - claimed)]
+    return result
+
+
+def _format_change(value: Any) -> str:
+    """Render a field value for the markdown report."""
+    if isinstance(value, list):
+        value = ", ".join(value)
+    if not value:
+        return "_none_"
+    value = _squash(str(value))
+    return f"`{value[:77]}...`" if len(value) > 80 else f"`{value}`"
+
+
+def format_markdown(result: Reconciliation, plan: list[PlannedIssue]) -> str:
+    """Render a reconciliation as a markdown report."""
+    levels = {planned.key: planned.level for planned in plan}
+    lines = [
+        "# Plan vs. Jira Reconciliation",
+        "",
+        f"- Matched: {len(result.matched)} "
+        f"({len(result.discovered)} by summary fingerprint)",
+        f"- To create: {result.count('create')}",
+        f"- To update: {result.count('update')}",
+        f"- To move: {result.count('move')}",
+        f"- Unplanned issues in Jira: {len(result.unplanned)}",
+        "",
+    ]
+
+    creates = [o for o in result.operations if o.op == "create"]
+    if creates:
+        lines += ["## Create", ""]
+        for level in LEVELS:
+            for operation in creates:
+                if levels.get(operation.key) == level:
+                    under = f" (under {operation.parent})" if operation.parent else ""
+                    lines.append(
+                        f"- **{operation.key}** {level}: {operation.summary}{under}"
+                    )
+        lines.append("")
+
+    updates = [o for o in result.operations if o.op == "update"]
+    if updates:
+        lines += ["## Update", ""]
+        for operation in updates:
+            lines.append(f"- **{operation.jira_key}** ({operation.key})")
+            for name, (old, new) in operation.changes.items():
+                lines.append(
+                    f"  - {name.title()}: {_format_change(old)} → "
+                    f"{_format_change(new)}"
+                )
+        lines.append("")
+
+    moves = [o for o in result.operations if o.op == "move"]
+    if moves:
+        lines += ["## Move", ""]
+        for operation in moves:
+            old, new = operation.changes["parent"]
+            target = new or f"{operation.parent} (not created yet)"
+            lines.append(
+                f"- **{operation.jira_key}** ({operation.key}): "
+                f"{old or '_none_'} → {target}"
+            )
+        lines.append("")
+
+    if result.discovered:
+        lines += ["## Matched by Summary", ""]
+        for key, jira_key in result.discovered.items():
+            lines.append(f"- {key} → {jira_key}")
+        lines.append("")
+
+    if result.unplanned:
+        lines += ["## Unplanned", ""]
+        for issue in result.unplanned:
+            lines.append(f"- **{issue.key}** {issue.issue_type}: {issue.summary}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def format_json(result: Reconciliation, plan: list[PlannedIssue]) -> str:
+    """Render a reconciliation as JSON."""
+    return json.dumps(result.to_dict(), indent=2, ensure_ascii=False) + "\n"
+
+
+FORMATTERS = {"markdown": format_markdown, "json": format_json}
+
+
+def main():
+    """Reconcile the planning JSON against a Jira export."""
+    parser = argparse.ArgumentParser(
+        description="Report the create/update/move operations that bring Jira "
+        "in line with a planning JSON",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "export",
+        type=str,
+        help="Jira XML export (file, directory or glob) or export cache",
+    )
+    parser.add_argument(
+        "--plan",
+        type=str,
+        default=str(DEFAULT_PLAN),
+        help="Planning JSON file (default: docs/pm/farmacias-macross-jira-import.json)",
+    )
+    parser.add_argument(
+        "--key-map",
+        type=str,
+        default=None,
+        help="Planning key -> Jira key map written by import_to_jira.py "
+        "(default: <plan>-keymap.json next to the plan)",
+    )
+    parser.add_argument(
+        "--journal",
+        type=str,
+        default=None,
+        help="Import journal replayed over the key map "
+        "(default: <plan>-journal.jsonl next to the key map)",
+    )
+    parser.add_argument(
+        "--project",
+        type=str,
+        default=None,
+        help="Only reconcile exported issues of this project "
+        "(default: project.key of the plan)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=sorted(FORMATTERS),
+        default="markdown",
+        help="Output format (default: markdown)",
+    )
+    parser.add_argument(
+        "--update-key-map",
+        action="store_true",
+        help="Record issues matched by summary in the key map, so later "
+        "imports and links use them",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Parse exports in full extraction mode, so tasks linked to their "
+        "story (rather than subtasks of it) are not reported as moved",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes when the export spans several files "
+        "(default: one per CPU core)",
+    )
+
+    args = parser.parse_args()
+
+    plan_path = Path(args.plan)
+    plan = load_plan(plan_path)
+    project_key = args.project or load_project_key(plan_path)
+    key_map_path = (
+        Path(args.key_map) if args.key_map else default_key_map_path(plan_path)
+    )
+    journal = ImportJournal(
+        Path(args.journal) if args.journal else default_journal_path(key_map_path)
+    )
+    key_map = KeyMap(key_map_path, journal)
+
+    # Keep stdout for the report
+    started = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            issues = list(iter_snapshot(args.export, args.full, args.workers))
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    loaded = time.perf_counter()
+    result = reconcile(plan, issues, key_map, project_key)
+    reconciled = time.perf_counter()
+
+    sys.stdout.write(FORMATTERS[args.format](result, plan))
+    print(
+        f"Reconciled {len(plan)} planned issues against {len(issues)} exported "
+        f"(loaded in {(loaded - started) * 1000:.0f} ms, "
+        f"matched in {(reconciled - loaded) * 1000:.1f} ms)",
+        file=sys.stderr,
+    )
+    if args.update_key_map and result.discovered:
+        with journal:
+            key_map.update(result.discovered)
+        key_map.save()
+        print(
+            f"Recorded {len(result.discovered)} matches in {key_map.path}",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+BM25 full-text search over Jira issue summaries, descriptions and comments.
+
+The index is a SQLite database kept next to the exports (by default
+``jira_search_index.sqlite3`` in the export's directory). Indexing is
+incremental: export files already indexed with the same size and mtime are
+skipped without being parsed, and within a new export only issues with a
+newer ``updated`` timestamp are re-tokenized (an older export never rolls an
+issue back). Issues indexed without comments are re-indexed by a ``--full``
+run. Searching never touches the XML.
+
+Text is the cleaned output of ``clean_text()``, folded to ASCII, split into
+words, filtered against English and Spanish stop words and reduced by a light
+suffix-stripping stemmer covering both languages, since ticket content mixes
+them.
+
+Usage:
+    python scripts/jira_search.py index "exports/Jira (*).xml" --full
+    python scripts/jira_search.py search "core web vitals LCP checkout" \\
+        --index exports
+"""
+
+import argparse
+import json
+import math
+import re
+import sqlite3
+import sys
+import unicodedata
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from parse_jira_xml import Issue, iter_jira_xml, parse_jira_date, resolve_xml_paths
+
+# Bump whenever tokenization or the schema changes; older indexes are rebuilt
+INDEX_VERSION = 3
+
+INDEX_FILENAME = "jira_search_index.sqlite3"
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Summary terms count this many times towards term frequency
+SUMMARY_WEIGHT = 2
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+STOP_WORDS = frozenset(
+    """
+    a an and are as at be by for from has have in is it its of on or that the
+    this to was were will with
+    al con de del el en es la las lo los para por que se sin su sus un una y
+    """.split()
+)
+
+# Longest first; English and Spanish inflectional and derivational endings.
+# Plurals are handled by _singular() first, so none of these end in -s, and
+# a final -e is already gone (``able`` is listed as ``abl``).
+_SUFFIXES = tuple(
+    sorted(
+        {
+            # Spanish
+            "amiento", "imiento", "acion", "ucion", "adora", "ador", "ancia",
+            "encia", "idad", "ment", "abl", "ibl", "ista", "oso", "osa",
+            "ando", "iendo", "ado", "ada", "ido", "ida", "ar", "er", "ir",
+            # English
+            "ation", "ing", "edly", "ness", "ed", "ly",
+        },
+        key=len,
+        reverse=True,
+    )
+)
+
+# Characters a stem must keep after stripping a suffix
+_MIN_STEM = 3
+
+
+def fold(text: str) -> str:
+    """Lowercase text and strip accents (``Optimización`` -> ``optimizacion``)."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return decomposed.encode("ascii", "ignore").decode("ascii")
+
+
+def _singular(word: str) -> str:
+    """
+    Reduce a plural and its singular to the same form.
+
+    A final -s is dropped, then a final -e, so ``tienda``/``tiendas``,
+    ``class``/``classes``, ``accion``/``acciones`` and ``code``/``codes``
+    each meet. Words ending in -ss, -us or -is are singular (``process``,
+    ``status``, ``analysis``).
+    """
+    if word.endswith("ies") and len(word) - 2 >= _MIN_STEM:
+        return word[:-3] + "y"
+    if word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        if len(word) - 1 < _MIN_STEM:
+            return word
+        word = word[:-1]
+    if word.endswith("e") and len(word) - 1 >= _MIN_STEM:
+        word = word[:-1]
+    return word
+
+
+def stem(word: str) -> str:
+    """Strip the plural, then the longest known suffix, from a folded word."""
+    if word.isdigit():
+        return word
+    word = _singular(word)
+    if len(word) <= _MIN_STEM + 1:
+        return word
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= _MIN_STEM:
+            word = word[: -len(suffix)]
+            # running -> runn -> run, planned -> plann -> plan
+            doubled = word[-1] == word[-2] and word[-1] not in "lsz"
+            if suffix in ("ing", "ed") and doubled:
+                word = word[:-1]
+            return word
+    return word
+
+
+def analyze(text: str) -> list[str]:
+    """Turn text into index terms: fold, split, drop stop words, stem."""
+    return [
+        stem(word) for word in _WORD_RE.findall(fold(text)) if word not in STOP_WORDS
+    ]
+
+
+def issue_terms(issue: Issue) -> Counter:
+    """Return the weighted term frequencies of an issue's searchable text."""
+    terms = Counter(analyze(issue.description))
+    for comment in issue.comments:
+        terms.update(analyze(comment.body))
+    for term in analyze(issue.summary):
+        terms[term] += SUMMARY_WEIGHT
+    return terms
+
+
+@dataclass(slots=True)
+class SearchHit:
+    """A ranked search result."""
+
+    key: str
+    score: float
+    status: str
+    summary: str
+
+
+class SearchIndex:
+    """Persistent BM25 index over issues, updated incrementally."""
+
+    def __init__(self, path: Path):
+        """
+        Open (or create) the index database.
+
+        Args:
+            path: Index file, or a directory to keep ``INDEX_FILENAME`` in
+        """
+        if path.is_dir():
+            path = path / INDEX_FILENAME
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+
+        self._conn = sqlite3.connect(path, timeout=60.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != INDEX_VERSION:
+            self._conn.executescript(
+                """
+                DROP TABLE IF EXISTS sources;
+                DROP TABLE IF EXISTS docs;
+                DROP TABLE IF EXISTS postings;
+                """
+            )
+            self._conn.execute(f"PRAGMA user_version={INDEX_VERSION}")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS sources (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime REAL NOT NULL,
+                full INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS docs (
+                id INTEGER PRIMARY KEY,
+                key TEXT NOT NULL UNIQUE,
+                updated TEXT NOT NULL,
+                length INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                summary TEXT NOT NULL,
+                full INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                term TEXT NOT NULL,
+                doc INTEGER NOT NULL,
+                tf INTEGER NOT NULL,
+                PRIMARY KEY (term, doc)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc);
+            """
+        )
+        self._conn.commit()
+
+    def __enter__(self) -> "SearchIndex":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database."""
+        self._conn.close()
+
+    def is_indexed(self, xml_path: Path, full: bool = False) -> bool:
+        """Return True if this export file was indexed and has not changed.
+
+        An export indexed without comments does not count for a full run.
+        """
+        stat = xml_path.stat()
+        row = self._conn.execute(
+            "SELECT size, mtime, full FROM sources WHERE path = ?",
+            (str(xml_path.resolve()),),
+        ).fetchone()
+        return (
+            row is not None
+            and row[:2] == (stat.st_size, stat.st_mtime)
+            and (row[2] or not full)
+        )
+
+    def add_issues(
+        self, issues: Iterable[Issue], full: bool = False
+    ) -> tuple[int, int]:
+        """Index new issues and re-index updated ones in one transaction.
+
+        An issue replaces the indexed document only if its ``updated``
+        timestamp is newer, or, in full mode, if it is as recent and the
+        document was indexed without comments.
+
+        Args:
+            issues: Parsed issues
+            full: Whether the issues were parsed in full mode (with comments)
+
+        Returns:
+            (indexed, unchanged) issue counts; older copies count as unchanged
+        """
+        indexed = unchanged = 0
+        with self._conn:
+            for issue in issues:
+                row = self._conn.execute(
+                    "SELECT id, updated, full FROM docs WHERE key = ?", (issue.key,)
+                ).fetchone()
+                if row is not None:
+                    doc, updated, doc_full = row
+                    if not _replaces(issue, updated, bool(doc_full), full):
+                        unchanged += 1
+                        continue
+                    self._conn.execute("DELETE FROM postings WHERE doc = ?", (doc,))
+                    self._conn.execute("DELETE FROM docs WHERE id = ?", (doc,))
+
+                terms = issue_terms(issue)
+                doc = self._conn.execute(
+                    "INSERT INTO docs (key, updated, length, status, summary, full) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        issue.key,
+                        issue.updated,
+                        sum(terms.values()),
+                        issue.status,
+                        issue.summary,
+                        full,
+                    ),
+                ).lastrowid
+                self._conn.executemany(
+                    "INSERT INTO postings (term, doc, tf) VALUES (?, ?, ?)",
+                    [(term, doc, tf) for term, tf in terms.items()],
+                )
+                indexed += 1
+        return indexed, unchanged
+
+    def add_export(self, xml_path: Path, full: bool = False) -> tuple[int, int]:
+        """Index an export file unless it was already indexed unchanged.
+
+        Args:
+            xml_path: Jira XML export
+            full: Parse in full extraction mode so comments are indexed too
+
+        Returns:
+            (indexed, unchanged) issue counts; (0, 0) if the file was skipped
+        """
+        if self.is_indexed(xml_path, full):
+            return 0, 0
+        counts = self.add_issues(iter_jira_xml(xml_path, full=full), full)
+        stat = xml_path.stat()
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sources (path, size, mtime, full) "
+                "VALUES (?, ?, ?, ?)",
+                (str(xml_path.resolve()), stat.st_size, stat.st_mtime, full),
+            )
+        return counts
+
+    def search(self, query: str, limit: int = 20) -> list[SearchHit]:
+        """Rank issues against a query with BM25.
+
+        Args:
+            query: Free text; analyzed like the indexed text
+            limit: Maximum number of hits
+
+        Returns:
+            Hits, best first
+        """
+        terms = set(analyze(query))
+        total, avg_length = self._conn.execute(
+            "SELECT COUNT(*), AVG(length) FROM docs"
+        ).fetchone()
+        if not terms or not total:
+            return []
+        avg_length = avg_length or 1.0
+
+        placeholders = ",".join("?" * len(terms))
+        postings = self._conn.execute(
+            f"SELECT p.term, p.doc, p.tf, d.length FROM postings p "
+            f"JOIN docs d ON d.id = p.doc WHERE p.term IN ({placeholders})",
+            tuple(terms),
+        ).fetchall()
+
+        doc_freq = Counter(term for term, _, _, _ in postings)
+        idf = {
+            term: math.log(1 + (total - df + 0.5) / (df + 0.5))
+            for term, df in doc_freq.items()
+        }
+        scores: dict[int, float] = {}
+        for term, doc, tf, length in postings:
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+            scores[doc] = scores.get(doc, 0.0) + idf[term] * tf * (BM25_K1 + 1) / (
+                tf + norm
+            )
+
+        best = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        hits = []
+        for doc, score in best:
+            key, status, summary = self._conn.execute(
+                "SELECT key, status, summary FROM docs WHERE id = ?", (doc,)
+            ).fetchone()
+            hits.append(SearchHit(key, round(score, 4), status, summary))
+        return hits
+
+
+def _replaces(issue: Issue, updated: str, doc_full: bool, full: bool) -> bool:
+    """Whether an issue should replace the document indexed from ``updated``."""
+    indexed_at = parse_jira_date(updated)
+    if issue.updated_at is None or indexed_at is None:
+        # Unparseable timestamps: fall back to any change
+        newer = issue.updated != updated
+    elif issue.updated_at != indexed_at:
+        return issue.updated_at > indexed_at
+    else:
+        newer = False
+    return newer or (full and not doc_full)
+
+
+def _default_index_path(spec: str) -> Path:
+    """Return the index location next to the exports named by ``spec``."""
+    path = Path(spec)
+    if path.is_dir():
+        return path / INDEX_FILENAME
+    xml_paths = resolve_xml_paths(spec)
+    base = xml_paths[0].parent if xml_paths else path.parent
+    return base / INDEX_FILENAME
+
+
+def main():
+    """Index exports or search the index."""
+    parser = argparse.ArgumentParser(
+        description="BM25 full-text search over Jira exports",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    index_parser = subparsers.add_parser(
+        "index", help="Add exports to the index (unchanged files are skipped)"
+    )
+    index_parser.add_argument(
+        "xml_file",
+        type=str,
+        help="Jira XML export file, directory of exports or glob",
+    )
+    index_parser.add_argument(
+        "--index",
+        type=str,
+        default=None,
+        help=f"Index file or directory (default: {INDEX_FILENAME} next to the "
+        "exports)",
+    )
+    index_parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Parse in full extraction mode so comments are indexed too",
+    )
+
+    search_parser = subparsers.add_parser("search", help="Search the index")
+    search_parser.add_argument("query", type=str, help="Search terms")
+    search_parser.add_argument(
+        "--index",
+        type=str,
+        default=".",
+        help=f"Index file or directory holding {INDEX_FILENAME} (default: .)",
+    )
+    search_parser.add_argument(
+        "--limit",
+        type=int,
+        default=20,
+        help="Maximum number of results (default: 20)",
+    )
+    search_parser.add_argument(
+        "--format",
+        choices=("markdown", "json"),
+        default="markdown",
+        help="Output format (default: markdown)",
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "index":
+        xml_paths = resolve_xml_paths(args.xml_file)
+        if not xml_paths:
+            print(f"Error: XML file not found: {args.xml_file}")
+            sys.exit(1)
+        index_path = (
+            Path(args.index) if args.index else _default_index_path(args.xml_file)
+        )
+        with SearchIndex(index_path) as index:
+            for xml_path in xml_paths:
+                if index.is_indexed(xml_path, args.full):
+                    print(f"  {xml_path.name}: already indexed")
+                    continue
+                indexed, unchanged = index.add_export(xml_path, full=args.full)
+                print(f"  {xml_path.name}: {indexed} indexed, {unchanged} unchanged")
+            print(f"\nIndex {index.path} holds {len(index)} issues")
+        return
+
+    index_path = Path(args.index)
+    if not (index_path / INDEX_FILENAME).is_file() and not index_path.is_file():
+        print(f"Error: no search index found at {index_path}")
+        sys.exit(1)
+    with SearchIndex(index_path) as index:
+        hits = index.search(args.query, limit=args.limit)
+
+    if args.format == "json":
+        print(json.dumps([asdict(hit) for hit in hits], indent=2, ensure_ascii=False))
+        return
+    if not hits:
+        print("No matches")
+    for hit in hits:
+        print(f"- **{hit.key}** ({hit.score:.2f}): {hit.summary}, Status: {hit.status}")
+
+
+if __name__ == "__main__":
+    main()
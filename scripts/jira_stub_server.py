@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+In-memory stub of the Jira REST API endpoints used by the import scripts.
+
+Lets an import be exercised end to end without a Jira site:
+
+    python scripts/jira_stub_server.py --port 8089 --latency 0.05 &
+    JIRA_URL=http://127.0.0.1:8089 python scripts/import_to_jira.py
+
+Supported endpoints (under ``/rest/api/2``):
+
+- ``POST /issue/bulk`` and ``POST /issue``: create issues, assigning keys
+  ``<PROJECT>-<n>``; a ``parent`` must already exist
+- ``GET /issue/<key>``: fetch a created issue
+- ``PUT /issue/<key>``: update fields of a created issue
+- ``POST /issueLink``: record a link between two existing issues
+- ``POST /search``: page through issues; only the ``project = X`` clause of
+  the JQL is honoured
+
+``GET /stub/state`` returns every issue and link plus request counters, so a
+run can be checked afterwards. ``--rate-limit-every N`` answers every Nth
+request with 429 to exercise retries.
+"""
+
+import argparse
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+API_PREFIX = "/rest/api/2"
+BULK_CREATE_LIMIT = 50
+
+_ISSUE_PATH_RE = re.compile(rf"^{API_PREFIX}/issue/([A-Z][A-Z0-9_]*-\d+)$")
+_JQL_PROJECT_RE = re.compile(r'\bproject\s*=\s*"?([A-Z][A-Z0-9_]*)"?', re.IGNORECASE)
+
+
+class StubJira:
+    """Thread-safe in-memory issue store."""
+
+    def __init__(self, latency: float = 0.0, rate_limit_every: int = 0):
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.issues: dict[str, dict[str, Any]] = {}
+        self.links: list[dict[str, Any]] = []
+        self.counters: dict[str, int] = {}
+        self._next_number: dict[str, int] = {}
+        self._requests = 0
+        self._lock = threading.Lock()
+
+    def count(self, name: str) -> bool:
+        """Count a request; return False if it should be rate limited."""
+        with self._lock:
+            self._requests += 1
+            self.counters[name] = self.counters.get(name, 0) + 1
+            limited = (
+                self.rate_limit_every > 0
+                and self._requests % self.rate_limit_every == 0
+            )
+            if limited:
+                self.counters["rate_limited"] = (
+                    self.counters.get("rate_limited", 0) + 1
+                )
+            return not limited
+
+    def create(self, fields: dict[str, Any]) -> dict[str, Any]:
+        """Create one issue, returning ``{"key": ...}`` or ``{"errors": ...}``."""
+        errors = {}
+        project = (fields.get("project") or {}).get("key")
+        if not project:
+            errors["project"] = "project is required"
+        if not fields.get("summary"):
+            errors["summary"] = "You must specify a summary of the issue."
+        if not (fields.get("issuetype") or {}).get("name"):
+            errors["issuetype"] = "issue type is required"
+        parent = (fields.get("parent") or {}).get("key")
+
+        with self._lock:
+            if parent and parent not in self.issues:
+                errors["parent"] = f"Issue {parent} does not exist"
+            if errors:
+                return {"errors": errors}
+            number = self._next_number.get(project, 0) + 1
+            self._next_number[project] = number
+            key = f"{project}-{number}"
+            issue_id = str(len(self.issues) + 10000)
+            self.issues[key] = {"id": issue_id, "key": key, "fields": fields}
+        return {"key": key, "id": issue_id}
+
+    def update(self, key: str, fields: dict[str, Any]) -> dict[str, Any] | None:
+        """Update an issue's fields, returning an error dict if it is invalid."""
+        parent = (fields.get("parent") or {}).get("key")
+        with self._lock:
+            if key not in self.issues:
+                return {"errorMessages": ["Issue does not exist"]}
+            if parent and parent not in self.issues:
+                return {"errors": {"parent": f"Issue {parent} does not exist"}}
+            self.issues[key]["fields"].update(fields)
+        return None
+
+    def link(self, payload: dict[str, Any]) -> dict[str, Any] | None:
+        """Record an issue link, returning an error dict if it is invalid."""
+        inward = (payload.get("inwardIssue") or {}).get("key")
+        outward = (payload.get("outwardIssue") or {}).get("key")
+        link_type = (payload.get("type") or {}).get("name")
+        with self._lock:
+            missing = [k for k in (inward, outward) if k not in self.issues]
+            if missing or not link_type:
+                return {"errorMessages": [f"Invalid link: {missing or 'type'}"]}
+            self.links.append({"type": link_type, "inward": inward, "outward": outward})
+        return None
+
+    def search(self, query: dict[str, Any]) -> dict[str, Any]:
+        """Return one page of issues in the JQL's project, in creation order."""
+        match = _JQL_PROJECT_RE.search(query.get("jql") or "")
+        prefix = f"{match.group(1).upper()}-" if match else ""
+        wanted = query.get("fields") or []
+        with self._lock:
+            matches = [
+                issue for key, issue in self.issues.items() if key.startswith(prefix)
+            ]
+        start = int(query.get("startAt") or 0)
+        page = matches[start : start + int(query.get("maxResults") or 50)]
+        return {
+            "startAt": start,
+            "total": len(matches),
+            "issues": [
+                {
+                    "key": issue["key"],
+                    "fields": {
+                        name: issue["fields"][name]
+                        for name in wanted
+                        if name in issue["fields"]
+                    },
+                }
+                for issue in page
+            ],
+        }
+
+    def state(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "issues": list(self.issues.values()),
+                "links": list(self.links),
+                "counters": dict(self.counters),
+            }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Routes requests to the server's ``StubJira``."""
+
+    server: "StubServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status: int, body: Any = None, headers: dict | None = None):
+        data = json.dumps(body).encode("utf-8") if body is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_json(self) -> Any:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"null")
+
+    def _admit(self, name: str) -> bool:
+        stub = self.server.stub
+        if stub.latency:
+            time.sleep(stub.latency)
+        if not stub.count(name):
+            self._send(
+                429,
+                {"errorMessages": ["Rate limit exceeded"]},
+                {"Retry-After": "0.05"},
+            )
+            return False
+        return True
+
+    def do_GET(self) -> None:
+        if self.path == "/stub/state":
+            self._send(200, self.server.stub.state())
+            return
+        match = _ISSUE_PATH_RE.match(self.path)
+        if not match:
+            self._send(404, {"errorMessages": ["Not found"]})
+            return
+        if not self._admit("get_issue"):
+            return
+        issue = self.server.stub.issues.get(match.group(1))
+        if issue is None:
+            self._send(404, {"errorMessages": ["Issue does not exist"]})
+        else:
+            self._send(200, issue)
+
+    def do_PUT(self) -> None:
+        match = _ISSUE_PATH_RE.match(self.path)
+        if not match:
+            self._send(404, {"errorMessages": ["Not found"]})
+            return
+        if not self._admit("update_issue"):
+            return
+        fields = (self._read_json() or {}).get("fields", {})
+        error = self.server.stub.update(match.group(1), fields)
+        if error is None:
+            self._send(204)
+        else:
+            self._send(404 if "errorMessages" in error else 400, error)
+
+    def do_POST(self) -> None:
+        stub = self.server.stub
+        if self.path == f"{API_PREFIX}/issue/bulk":
+            if not self._admit("bulk_create"):
+                return
+            updates = (self._read_json() or {}).get("issueUpdates", [])
+            if len(updates) > BULK_CREATE_LIMIT:
+                self._send(400, {"errorMessages": ["Too many issues"]})
+                return
+            issues, errors = [], []
+            for index, update in enumerate(updates):
+                result = stub.create(update.get("fields", {}))
+                if "errors" in result:
+                    errors.append(
+                        {
+                            "status": 400,
+                            "failedElementNumber": index,
+                            "elementErrors": {"errors": result["errors"]},
+                        }
+                    )
+                else:
+                    issues.append(result)
+            self._send(201 if issues else 400, {"issues": issues, "errors": errors})
+        elif self.path == f"{API_PREFIX}/issue":
+            if not self._admit("create_issue"):
+                return
+            result = stub.create((self._read_json() or {}).get("fields", {}))
+            if "errors" in result:
+                self._send(400, {"errors": result["errors"]})
+            else:
+                self._send(201, result)
+        elif self.path == f"{API_PREFIX}/issueLink":
+            if not self._admit("create_link"):
+                return
+            error = stub.link(self._read_json() or {})
+            if error:
+                self._send(400, error)
+            else:
+                self._send(201)
+        elif self.path == f"{API_PREFIX}/search":
+            if not self._admit("search"):
+                return
+            self._send(200, stub.search(self._read_json() or {}))
+        else:
+            self._send(404, {"errorMessages": ["Not found"]})
+
+
+class StubServer(ThreadingHTTPServer):
+    """HTTP server holding a ``StubJira``."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], stub: StubJira, verbose=False):
+        super().__init__(address, StubHandler)
+        self.stub = stub
+        self.verbose = verbose
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start_stub_server(
+    port: int = 0, latency: float = 0.0, rate_limit_every: int = 0
+) -> StubServer:
+    """Start a stub server on a background thread.
+
+    Args:
+        port: Port to listen on (0 picks a free one; see ``server.url``)
+        latency: Seconds added to every API request
+        rate_limit_every: Answer every Nth API request with 429 (0: never)
+
+    Returns:
+        The running server; call ``shutdown()`` when done
+    """
+    server = StubServer(("127.0.0.1", port), StubJira(latency, rate_limit_every))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    """Run the stub server in the foreground."""
+    parser = argparse.ArgumentParser(
+        description="In-memory stub of the Jira REST API for import testing",
+    )
+    parser.add_argument(
+        "--port", type=int, default=8089, help="Port to listen on (default: 8089)"
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Seconds added to every API request (default: 0)",
+    )
+    parser.add_argument(
+        "--rate-limit-every",
+        type=int,
+        default=0,
+        help="Answer every Nth API request with HTTP 429 (default: never)",
+    )
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    server = StubServer(
+        ("127.0.0.1", args.port),
+        StubJira(args.latency, args.rate_limit_every),
+        verbose=args.verbose,
+    )
+    print(f"Jira stub listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
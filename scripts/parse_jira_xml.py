@@ -5,84 +5,181 @@ similar to the FM project structure.
 """
 
 import argparse
+import glob
 import html
+import io
+import os
 import re
 import sys
-from datetime import datetime
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 from xml.etree import ElementTree as ET
 
+from jira_analytics import time_tracking_section
+from jira_columnar import write_columnar
+from jira_export_cache import ExportCache
+
+# Optional on-disk memo for clean_text()/format_description() (--cache-dir)
+_text_cache: ExportCache | None = None
+
+
+def set_text_cache(cache: ExportCache | None) -> None:
+    """Memoize clean_text() and format_description() in ``cache``.
+
+    Args:
+        cache: Export cache to use, or None to disable memoization
+    """
+    global _text_cache
+    _text_cache = cache
+
+
+# Tags, leftover tag-like fragments and the double-escaped entities that
+# survive html.unescape(), split out of the text in one left-to-right scan
+_TOKEN_RE = re.compile(
+    r"<(/?)([a-zA-Z][a-zA-Z0-9]*)[^>]*>|<[!?/][^>]*>|&(amp|lt|gt|quot|#39);"
+)
+# Literal-prefixed so the scan skips ahead instead of stopping at every space
+_NEWLINES_RE = re.compile(r"\n\n\n+")
+_SPACES_RE = re.compile(r"  +")
+
+_ENTITIES = {"amp": "&", "lt": "<", "gt": ">", "quot": '"', "#39": "'"}
+
+# Tag name -> kind of markdown conversion; unlisted tags are dropped
+_BLOCK, _BREAK, _BOLD, _ITALIC, _BULLETS, _NUMBERED, _ITEM = range(7)
+_TAG_KINDS = {
+    "p": _BLOCK,
+    "pre": _BLOCK,
+    "br": _BREAK,
+    "b": _BOLD,
+    "strong": _BOLD,
+    "i": _ITALIC,
+    "em": _ITALIC,
+    "ul": _BULLETS,
+    "ol": _NUMBERED,
+    "li": _ITEM,
+}
+
 
 def clean_text(text: str) -> str:
     """Clean and format text from Jira XML.
-    
-    Handles HTML entities, tags, and formatting.
+
+    Handles HTML entities, tags, and formatting. Markup is converted to
+    markdown in a single pass over the text: paragraphs become blank lines,
+    ``<br>`` a newline, ``<b>/<strong>`` **bold**, ``<i>/<em>`` *italic*,
+    ``<ul>`` items ``- `` bullets and ``<ol>`` items numbered ``1. `` entries.
+    Any other tag is dropped.
     """
     if not text:
         return ""
-    
+    if _text_cache is not None:
+        return _text_cache.memoize("clean_text", text, _clean_text)
+    return _clean_text(text)
+
+
+def _clean_text(text: str) -> str:
+    """Convert Jira HTML to markdown; see ``clean_text()``."""
     # Unescape HTML/XML entities
     text = html.unescape(text)
-    
-    # Convert common HTML entities to markdown-friendly text
-    text = text.replace("&amp;", "&")
-    text = text.replace("&lt;", "<")
-    text = text.replace("&gt;", ">")
-    text = text.replace("&quot;", '"')
-    text = text.replace("&#39;", "'")
-    
-    # Remove HTML tags but preserve structure
-    # Convert <p> to double newlines
-    text = re.sub(r"<p[^>]*>", "\n\n", text)
-    text = re.sub(r"</p>", "", text)
-    
-    # Convert <br/> to single newline
-    text = re.sub(r"<br\s*/?>", "\n", text)
-    
-    # Convert <b> and <strong> to **bold**
-    text = re.sub(r"<(b|strong)[^>]*>(.*?)</(b|strong)>", r"**\2**", text, flags=re.DOTALL)
-    
-    # Convert <i> and <em> to *italic*
-    text = re.sub(r"<(i|em)[^>]*>(.*?)</(i|em)>", r"*\2*", text, flags=re.DOTALL)
-    
-    # Convert <ul><li> to markdown lists
-    text = re.sub(r"<ul[^>]*>", "", text)
-    text = re.sub(r"</ul>", "", text)
-    text = re.sub(r"<li[^>]*>", "- ", text)
-    text = re.sub(r"</li>", "", text)
-    
-    # Convert <ol><li> to numbered lists
-    text = re.sub(r"<ol[^>]*>", "", text)
-    text = re.sub(r"</ol>", "", text)
-    # Note: Numbered lists need special handling, keeping as bullets for now
-    
-    # Remove remaining HTML tags
-    text = re.sub(r"<[^>]+>", "", text)
-    
+
+    tokens = iter(_TOKEN_RE.split(text))
+    pieces = [next(tokens)]
+    append = pieces.append
+    # Index of the placeholder emitted for an open <b>/<i>; it only becomes a
+    # marker once the matching close tag is seen
+    bold_at: int | None = None
+    italic_at: int | None = None
+    # One entry per open list: None for <ul>, last item number for <ol>
+    lists: list[int | None] = []
+
+    # re.split with three groups yields 1 + 4n items, so the quadruples line up
+    quads = zip(tokens, tokens, tokens, tokens, strict=True)
+    for closing, tag, entity, segment in quads:
+        if entity:
+            append(_ENTITIES[entity])
+        elif tag:
+            kind = _TAG_KINDS.get(tag)
+            if kind is None:
+                kind = _TAG_KINDS.get(tag.lower())
+
+            if closing:
+                if kind == _BOLD:
+                    if bold_at is not None:
+                        pieces[bold_at] = "**"
+                        append("**")
+                        bold_at = None
+                elif kind == _ITALIC:
+                    if italic_at is not None:
+                        pieces[italic_at] = "*"
+                        append("*")
+                        italic_at = None
+                elif (kind == _BULLETS or kind == _NUMBERED) and lists:
+                    lists.pop()
+            elif kind == _ITEM:
+                number = lists[-1] if lists else None
+                if number is None:
+                    append("- ")
+                else:
+                    lists[-1] = number + 1
+                    append(f"{number + 1}. ")
+            elif kind == _BLOCK:
+                append("\n\n")
+            elif kind == _BREAK:
+                append("\n")
+            elif kind == _BOLD:
+                if bold_at is None:
+                    bold_at = len(pieces)
+                    append("")
+            elif kind == _ITALIC:
+                if italic_at is None:
+                    italic_at = len(pieces)
+                    append("")
+            elif kind == _BULLETS:
+                lists.append(None)
+            elif kind == _NUMBERED:
+                lists.append(0)
+
+        if segment:
+            append(segment)
+
     # Clean up whitespace
-    text = re.sub(r"\n{3,}", "\n\n", text)  # Max 2 consecutive newlines
-    text = re.sub(r"[ \t]+", " ", text)  # Multiple spaces to single
-    text = text.strip()
-    
-    return text
+    text = _NEWLINES_RE.sub("\n\n", "".join(pieces))  # Max 2 consecutive newlines
+    text = _SPACES_RE.sub(" ", text.replace("\t", " "))  # Multiple spaces to single
+    return text.strip()
 
 
 def format_description(description: str, max_length: int = 500) -> str:
     """Format description for markdown display.
-    
+
     Args:
         description: Raw description text
         max_length: Maximum length before truncation
-        
+
     Returns:
         Formatted description
     """
     if not description:
         return ""
-    
+    if _text_cache is not None:
+        return _text_cache.memoize(
+            f"format_description:{max_length}",
+            description,
+            lambda text: _format_description(text, max_length),
+        )
+    return _format_description(description, max_length)
+
+
+def _format_description(description: str, max_length: int) -> str:
+    """Clean and truncate a description; see ``format_description()``."""
     desc = clean_text(description)
-    
+
     # Truncate if too long, but try to break at sentence
     if len(desc) > max_length:
         # Try to break at last sentence before max_length
@@ -90,148 +187,834 @@ def format_description(description: str, max_length: int = 500) -> str:
         last_period = truncated.rfind(".")
         last_newline = truncated.rfind("\n")
         break_point = max(last_period, last_newline)
-        
+
         if break_point > max_length * 0.7:  # If we found a good break point
-            desc = desc[:break_point + 1]
+            desc = desc[: break_point + 1]
         else:
             desc = desc[:max_length]
         desc += "..."
-    
+
     return desc
 
 
-def parse_jira_xml(xml_path: Path) -> list[dict[str, Any]]:
-    """Parse Jira XML export file and extract all issues.
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        "Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec".split(), 1
+    )
+}
+
+
+@lru_cache(maxsize=64)
+def _utc_offset(offset: str) -> timezone:
+    """Return the timezone for a ``+HHMM``/``-HHMM`` offset."""
+    minutes = int(offset[1:3]) * 60 + int(offset[3:5])
+    if offset[0] == "-":
+        minutes = -minutes
+    return timezone(timedelta(minutes=minutes)) if minutes else timezone.utc
+
+
+@lru_cache(maxsize=4096)
+def parse_jira_date(value: str) -> datetime | None:
+    """Parse a Jira RFC-822 timestamp such as ``Wed, 5 Nov 2025 17:24:24 -0600``.
+
+    The fixed export format is split by hand; anything else falls back to
+    ``email.utils``. Results are memoized since an export repeats the same
+    timestamps many times.
 
     Args:
-        xml_path: Path to the Jira XML export file
+        value: Raw timestamp from the export
 
     Returns:
-        List of issue dictionaries
+        Timezone-aware datetime, or None if the value is empty or unparseable
     """
-    print(f"Parsing Jira XML file: {xml_path}")
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
+    if not value:
+        return None
+    parts = value.split()
+    try:
+        if len(parts) == 6 and parts[0].endswith(","):
+            _, day, month, year, clock, offset = parts
+            hour, minute, second = clock.split(":")
+            return datetime(
+                int(year),
+                _MONTHS[month],
+                int(day),
+                int(hour),
+                int(minute),
+                int(second),
+                tzinfo=_utc_offset(offset),
+            )
+    except (KeyError, ValueError):
+        pass
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
 
-    # Find the channel element (RSS structure)
-    channel = root.find("channel")
-    if channel is None:
-        raise ValueError("Invalid XML structure: no <channel> element found")
 
-    issues = []
-    items = channel.findall("item")
+# Custom fields shown in the epics markdown when parsed with --full
+MARKDOWN_CUSTOM_FIELDS = ("Sprint", "Story Points", "Start date")
 
-    print(f"Found {len(items)} issues in XML")
+# Statuses listed first, in this order, when tasks are grouped by status
+STATUS_ORDER = ("Done", "In Progress", "To Do", "In Review", "Blocked")
+_STATUS_RANK = {status: rank for rank, status in enumerate(STATUS_ORDER)}
 
-    for item in items:
-        issue = {}
+# Lowercased issue type names grouped as stories and tasks
+STORY_TYPES = frozenset({"story", "user story"})
+TASK_TYPES = frozenset({"task", "subtask"})
 
-        # Extract basic fields
-        key_elem = item.find("key")
-        issue["key"] = key_elem.text if key_elem is not None else ""
+_MISSING = object()
 
-        summary_elem = item.find("summary")
-        issue["summary"] = clean_text(summary_elem.text) if summary_elem is not None else ""
 
-        type_elem = item.find("type")
-        issue["issuetype"] = {
-            "name": type_elem.text if type_elem is not None else "Unknown"
-        }
+@dataclass(slots=True)
+class CustomField:
+    """A decoded <customfield> of an issue."""
 
-        status_elem = item.find("status")
-        issue["status"] = {
-            "name": status_elem.text if status_elem is not None else "Unknown"
-        }
+    field_id: str
+    name: str
+    field_type: str = ""
+    values: list[str] = field(default_factory=list)
 
-        priority_elem = item.find("priority")
-        issue["priority"] = {
-            "name": priority_elem.text if priority_elem is not None else ""
-        }
 
-        description_elem = item.find("description")
-        issue["description"] = (
-            clean_text(description_elem.text) if description_elem is not None else ""
+@dataclass(slots=True)
+class Comment:
+    """An issue comment, with its body converted to markdown."""
+
+    comment_id: str
+    author: str
+    created: str
+    body: str
+
+
+@dataclass(slots=True)
+class IssueLink:
+    """One end of an issue link, as seen from the issue that holds it."""
+
+    link_type: str
+    direction: str  # "outward" or "inward"
+    description: str  # e.g. "clones" / "is cloned by"
+    key: str
+
+
+class CustomFieldIndex:
+    """Custom field id -> name index, built once per export.
+
+    Every <item> repeats the <customfieldname> of each of its fields; the
+    index records the name the first time an id is seen, so later items are
+    decoded by id alone, and remembers which field holds the Epic Link.
+    """
+
+    __slots__ = ("names", "epic_link_id")
+
+    def __init__(self) -> None:
+        self.names: dict[str, str] = {}
+        self.epic_link_id: str | None = None
+
+    def name(self, customfield: ET.Element) -> str:
+        """Return the name of a <customfield> element."""
+        field_id = customfield.get("id", "")
+        name = self.names.get(field_id)
+        if name is None:
+            name = sys.intern((customfield.findtext("customfieldname") or "").strip())
+            self.names[field_id] = name
+            if self.epic_link_id is None and "Epic Link" in name:
+                self.epic_link_id = field_id
+        return name
+
+    def decode(self, customfield: ET.Element) -> CustomField:
+        """Decode a <customfield> element into a CustomField."""
+        values = []
+        values_elem = customfield.find("customfieldvalues")
+        if values_elem is not None:
+            for value_elem in values_elem.findall("customfieldvalue"):
+                value = (value_elem.text or "").strip()
+                if value:
+                    values.append(value)
+        return CustomField(
+            field_id=customfield.get("id", ""),
+            name=self.name(customfield),
+            field_type=sys.intern(customfield.get("key", "")),
+            values=values,
         )
 
-        # Extract parent (for subtasks)
-        parent_elem = item.find("parent")
-        if parent_elem is not None:
-            parent_key = parent_elem.text if parent_elem.text else None
-            if parent_key:
-                issue["parent"] = {"key": parent_key}
-
-        # Extract Epic Link from customfields
-        epic_link = None
-        customfields = item.find("customfields")
-        if customfields is not None:
+    def epic_link(self, customfields: ET.Element) -> str | None:
+        """Return the Epic Link value from a <customfields> element."""
+        for customfield in customfields.findall("customfield"):
+            self.name(customfield)
+            if customfield.get("id") == self.epic_link_id:
+                values = customfield.find("customfieldvalues")
+                if values is not None:
+                    value_elem = values.find("customfieldvalue")
+                    if value_elem is not None:
+                        return value_elem.text
+        return None
+
+
+@dataclass(slots=True)
+class Issue:
+    """A Jira issue parsed from an XML export.
+
+    Type, status and priority names are interned so the issues of an export
+    share a handful of string objects, and the lowercased type used for
+    grouping is computed once. The raw ``created``, ``updated``, ``resolved``
+    and ``due`` timestamps are parsed once into the matching ``*_at``
+    datetimes (None when empty). ``get()``, ``[]`` and ``in`` expose the legacy
+    nested-dict layout (``issue.get("status", {}).get("name")``) so callers
+    written against the old list-of-dicts output keep working.
+    """
+
+    key: str = ""
+    summary: str = ""
+    issue_type: str = "Unknown"
+    status: str = "Unknown"
+    priority: str = ""
+    description: str = ""
+    parent_key: str | None = None
+    epic_link: str | None = None
+    project_key: str | None = None
+    project_name: str = ""
+    assignee: str | None = None
+    created: str = ""
+    updated: str = ""
+    resolved: str = ""
+    due: str = ""
+    time_original_estimate: str | None = None
+    time_estimate: str | None = None
+    time_spent: str | None = None
+    # Time tracking in seconds, from the ``seconds`` attribute
+    time_original_estimate_seconds: int | None = None
+    time_estimate_seconds: int | None = None
+    time_spent_seconds: int | None = None
+    labels: list[str] = field(default_factory=list)
+    # Only filled in full extraction mode (see iter_jira_xml())
+    custom_fields: list[CustomField] = field(default_factory=list)
+    comments: list[Comment] = field(default_factory=list)
+    links: list[IssueLink] = field(default_factory=list)
+    subtasks: list[str] = field(default_factory=list)
+    issue_type_lower: str = field(init=False, repr=False, compare=False)
+    created_at: datetime | None = field(init=False, repr=False, compare=False)
+    updated_at: datetime | None = field(init=False, repr=False, compare=False)
+    resolved_at: datetime | None = field(init=False, repr=False, compare=False)
+    due_at: datetime | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.issue_type = sys.intern(self.issue_type)
+        self.issue_type_lower = sys.intern(self.issue_type.lower())
+        self.status = sys.intern(self.status)
+        self.priority = sys.intern(self.priority)
+        self.created_at = parse_jira_date(self.created)
+        self.updated_at = parse_jira_date(self.updated)
+        self.resolved_at = parse_jira_date(self.resolved)
+        self.due_at = parse_jira_date(self.due)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Return a field in the legacy dict layout, like ``dict.get()``."""
+        value = _LEGACY_FIELDS[name](self) if name in _LEGACY_FIELDS else _MISSING
+        return default if value is _MISSING else value
+
+    def __getitem__(self, name: str) -> Any:
+        value = self.get(name, _MISSING)
+        if value is _MISSING:
+            raise KeyError(name)
+        return value
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self.get(name, _MISSING) is not _MISSING
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the issue in the legacy nested-dict layout."""
+        issue = {}
+        for name, getter in _LEGACY_FIELDS.items():
+            value = getter(self)
+            if value is not _MISSING:
+                issue[name] = value
+        return issue
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Issue":
+        """Build an issue from the legacy nested-dict layout.
+
+        Args:
+            data: Issue dictionary as produced by ``to_dict()``
+
+        Returns:
+            Issue instance
+        """
+        parent = data.get("parent")
+        project = data.get("project")
+        return cls(
+            key=data.get("key", ""),
+            summary=data.get("summary", ""),
+            issue_type=data.get("issuetype", {}).get("name", "Unknown"),
+            status=data.get("status", {}).get("name", "Unknown"),
+            priority=data.get("priority", {}).get("name", ""),
+            description=data.get("description", ""),
+            parent_key=parent.get("key") if isinstance(parent, dict) else parent,
+            epic_link=data.get("epicLink"),
+            project_key=project.get("key", "") if project is not None else None,
+            project_name=project.get("name", "") if project is not None else "",
+            assignee=data.get("assignee", {}).get("displayName"),
+            created=data.get("created", ""),
+            updated=data.get("updated", ""),
+            resolved=data.get("resolved", ""),
+            due=data.get("due", ""),
+            time_original_estimate=data.get("time_original_estimate"),
+            time_estimate=data.get("time_estimate"),
+            time_spent=data.get("time_spent"),
+            time_original_estimate_seconds=data.get("time_original_estimate_seconds"),
+            time_estimate_seconds=data.get("time_estimate_seconds"),
+            time_spent_seconds=data.get("time_spent_seconds"),
+            labels=list(data.get("labels", [])),
+            custom_fields=[CustomField(**f) for f in data.get("customfields", [])],
+            comments=[Comment(**c) for c in data.get("comments", [])],
+            links=[IssueLink(**link) for link in data.get("issuelinks", [])],
+            subtasks=list(data.get("subtasks", [])),
+        )
+
+    def custom_field(self, name: str) -> CustomField | None:
+        """Return the custom field called ``name``, if it was extracted."""
+        for custom_field in self.custom_fields:
+            if custom_field.name == name:
+                return custom_field
+        return None
+
+
+def _or_missing(value: Any) -> Any:
+    """Map None to ``_MISSING`` so the legacy dict omits the key."""
+    return _MISSING if value is None else value
+
+
+# Legacy dict key -> value for an Issue (_MISSING when the key was omitted)
+_LEGACY_FIELDS: dict[str, Callable[[Issue], Any]] = {
+    "key": lambda i: i.key,
+    "summary": lambda i: i.summary,
+    "issuetype": lambda i: {"name": i.issue_type},
+    "status": lambda i: {"name": i.status},
+    "priority": lambda i: {"name": i.priority},
+    "description": lambda i: i.description,
+    "parent": lambda i: {"key": i.parent_key} if i.parent_key else _MISSING,
+    "epicLink": lambda i: i.epic_link or _MISSING,
+    "project": lambda i: (
+        {"key": i.project_key, "name": i.project_name}
+        if i.project_key is not None
+        else _MISSING
+    ),
+    "assignee": lambda i: {"displayName": i.assignee} if i.assignee else _MISSING,
+    "created": lambda i: i.created,
+    "updated": lambda i: i.updated,
+    "resolved": lambda i: i.resolved,
+    "due": lambda i: i.due,
+    "time_original_estimate": lambda i: i.time_original_estimate or _MISSING,
+    "time_estimate": lambda i: i.time_estimate or _MISSING,
+    "time_spent": lambda i: i.time_spent or _MISSING,
+    "time_original_estimate_seconds": lambda i: _or_missing(
+        i.time_original_estimate_seconds
+    ),
+    "time_estimate_seconds": lambda i: _or_missing(i.time_estimate_seconds),
+    "time_spent_seconds": lambda i: _or_missing(i.time_spent_seconds),
+    "labels": lambda i: i.labels,
+    "customfields": lambda i: [asdict(f) for f in i.custom_fields] or _MISSING,
+    "comments": lambda i: [asdict(c) for c in i.comments] or _MISSING,
+    "issuelinks": lambda i: [asdict(link) for link in i.links] or _MISSING,
+    "subtasks": lambda i: list(i.subtasks) or _MISSING,
+}
+
+
+def _parse_comments(item: ET.Element) -> list[Comment]:
+    """Decode the <comments> of an item."""
+    return [
+        Comment(
+            comment_id=elem.get("id", ""),
+            author=elem.get("author", ""),
+            created=elem.get("created", ""),
+            body=clean_text(elem.text or ""),
+        )
+        for elem in item.iterfind("comments/comment")
+    ]
+
+
+def _parse_issue_links(item: ET.Element) -> list[IssueLink]:
+    """Decode the <issuelinks> of an item, both outward and inward."""
+    links = []
+    for link_type in item.iterfind("issuelinks/issuelinktype"):
+        type_name = sys.intern(link_type.findtext("name", ""))
+        for direction in ("outward", "inward"):
+            for group in link_type.iterfind(f"{direction}links"):
+                description = sys.intern(group.get("description", ""))
+                for key in group.iterfind("issuelink/issuekey"):
+                    if key.text:
+                        links.append(
+                            IssueLink(type_name, direction, description, key.text)
+                        )
+    return links
+
+
+def _parse_seconds(elem: ET.Element | None) -> int | None:
+    """Return the ``seconds`` attribute of a time tracking element."""
+    if elem is None:
+        return None
+    try:
+        return int(elem.get("seconds", ""))
+    except ValueError:
+        return None
+
+
+def _parse_item(
+    item: ET.Element,
+    field_index: CustomFieldIndex | None = None,
+    full: bool = False,
+) -> Issue:
+    """Extract an issue from a single <item> element.
+
+    Args:
+        item: The <item> element of the RSS export
+        field_index: Custom field index shared by all items of the export
+        full: Also decode all custom fields, comments, issue links and
+            subtasks
+
+    Returns:
+        Parsed issue
+    """
+    if field_index is None:
+        field_index = CustomFieldIndex()
+
+    # Extract Epic Link from customfields
+    epic_link = None
+    custom_fields = []
+    customfields = item.find("customfields")
+    if customfields is not None:
+        if full:
             for customfield in customfields.findall("customfield"):
-                field_name = customfield.find("customfieldname")
-                if field_name is not None and "Epic Link" in field_name.text:
-                    values = customfield.find("customfieldvalues")
+                decoded = field_index.decode(customfield)
+                custom_fields.append(decoded)
+                if decoded.field_id == field_index.epic_link_id and not epic_link:
+                    values = customfield.find("customfieldvalues/customfieldvalue")
                     if values is not None:
-                        value_elem = values.find("customfieldvalue")
-                        if value_elem is not None:
-                            epic_link = value_elem.text
-                            break
+                        epic_link = values.text
+        else:
+            epic_link = field_index.epic_link(customfields)
+
+    # Extract project info
+    project_elem = item.find("project")
+
+    # Extract labels
+    labels_elem = item.find("labels")
+    labels = []
+    if labels_elem is not None:
+        for label in labels_elem.findall("label"):
+            if label.text:
+                labels.append(label.text)
+
+    return Issue(
+        key=item.findtext("key") or "",
+        summary=clean_text(item.findtext("summary") or ""),
+        issue_type=item.findtext("type", "Unknown"),
+        status=item.findtext("status", "Unknown"),
+        priority=item.findtext("priority", ""),
+        description=clean_text(item.findtext("description") or ""),
+        # Parent is only set for subtasks
+        parent_key=item.findtext("parent") or None,
+        epic_link=epic_link or None,
+        project_key=project_elem.get("key", "") if project_elem is not None else None,
+        project_name=(project_elem.text or "") if project_elem is not None else "",
+        assignee=item.findtext("assignee") or None,
+        created=item.findtext("created", ""),
+        updated=item.findtext("updated", ""),
+        resolved=item.findtext("resolved", ""),
+        due=item.findtext("due", ""),
+        # Time tracking
+        time_original_estimate=item.findtext("timeoriginalestimate") or None,
+        time_estimate=item.findtext("timeestimate") or None,
+        time_spent=item.findtext("timespent") or None,
+        time_original_estimate_seconds=_parse_seconds(
+            item.find("timeoriginalestimate")
+        ),
+        time_estimate_seconds=_parse_seconds(item.find("timeestimate")),
+        time_spent_seconds=_parse_seconds(item.find("timespent")),
+        labels=labels,
+        custom_fields=custom_fields,
+        comments=_parse_comments(item) if full else [],
+        links=_parse_issue_links(item) if full else [],
+        subtasks=(
+            [elem.text for elem in item.iterfind("subtasks/subtask") if elem.text]
+            if full
+            else []
+        ),
+    )
 
-        if epic_link:
-            issue["epicLink"] = epic_link
-
-        # Extract project info
-        project_elem = item.find("project")
-        if project_elem is not None:
-            issue["project"] = {
-                "key": project_elem.get("key", ""),
-                "name": project_elem.text or "",
-            }
-
-        # Extract assignee
-        assignee_elem = item.find("assignee")
-        if assignee_elem is not None and assignee_elem.text:
-            issue["assignee"] = {"displayName": assignee_elem.text}
-
-        # Extract created/updated dates
-        created_elem = item.find("created")
-        issue["created"] = created_elem.text if created_elem is not None else ""
-
-        updated_elem = item.find("updated")
-        issue["updated"] = updated_elem.text if updated_elem is not None else ""
-        
-        resolved_elem = item.find("resolved")
-        issue["resolved"] = resolved_elem.text if resolved_elem is not None else ""
-        
-        # Extract time tracking
-        time_original_estimate = item.find("timeoriginalestimate")
-        if time_original_estimate is not None and time_original_estimate.text:
-            issue["time_original_estimate"] = time_original_estimate.text
-        
-        time_spent = item.find("timespent")
-        if time_spent is not None and time_spent.text:
-            issue["time_spent"] = time_spent.text
-
-        # Extract labels
-        labels_elem = item.find("labels")
-        labels = []
-        if labels_elem is not None:
-            for label in labels_elem.findall("label"):
-                if label.text:
-                    labels.append(label.text)
-        issue["labels"] = labels
-
-        issues.append(issue)
 
+def iter_jira_xml(
+    xml_path: Path, cache: ExportCache | None = None, full: bool = False
+) -> Iterator[Issue]:
+    """Stream issues from a Jira XML export one <item> at a time.
+
+    Uses ``iterparse`` and drops every processed <item> from the tree, so
+    memory use stays flat regardless of the size of the export.
+
+    Args:
+        xml_path: Path to the Jira XML export file
+        cache: Optional export cache; items whose ``(key, updated)`` is
+            already cached are taken from it instead of being re-cleaned
+        full: Full extraction mode; also decode all custom fields, comments,
+            issue links and subtasks of every issue
+
+    Yields:
+        Parsed issues, in document order
+    """
+    channel = None
+    depth = 0
+    field_index = CustomFieldIndex()
+    variant = "full" if full else "basic"
+
+    for event, elem in ET.iterparse(xml_path, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if depth == 2 and elem.tag == "channel":
+                channel = elem
+            continue
+
+        depth -= 1
+        if channel is None or depth != 2:
+            continue
+
+        if elem.tag == "item":
+            if cache is None:
+                yield _parse_item(elem, field_index, full)
+            else:
+                cached = cache.get_issue(
+                    elem.findtext("key", ""), elem.findtext("updated", ""), variant
+                )
+                if cached is None:
+                    issue = _parse_item(elem, field_index, full)
+                    cache.put_issue(issue.to_dict(), variant)
+                else:
+                    issue = Issue.from_dict(cached)
+                yield issue
+            # Release the processed item so the tree never grows
+            elem.clear()
+            channel.remove(elem)
+        elif elem.tag == "issue":
+            try:
+                total = int(elem.get("end", "")) - int(elem.get("start", ""))
+                print(f"Found {total} issues in XML")
+            except ValueError:
+                pass
+
+    if channel is None:
+        raise ValueError("Invalid XML structure: no <channel> element found")
+
+    if cache is not None:
+        print(
+            f"Cache: {cache.hits} unchanged issues reused, "
+            f"{cache.misses} new or changed issues parsed"
+        )
+
+
+def parse_jira_xml(xml_path: Path, full: bool = False) -> list[Issue]:
+    """Parse Jira XML export file and extract all issues.
+
+    Args:
+        xml_path: Path to the Jira XML export file
+        full: Also extract custom fields, comments, issue links and subtasks
+
+    Returns:
+        List of parsed issues
+    """
+    print(f"Parsing Jira XML file: {xml_path}")
+    issues = list(iter_jira_xml(xml_path, full=full))
     print(f"Successfully parsed {len(issues)} issues")
     return issues
 
 
-def organize_issues(issues: list[dict[str, Any]]) -> dict[str, Any]:
+_EPOCH_MIN = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _updated_sort_key(issue: Issue) -> datetime:
+    """Return the issue's ``updated`` timestamp for recency comparisons."""
+    return issue.updated_at or _EPOCH_MIN
+
+
+def merge_issues(
+    issue_lists: Iterable[Iterable[Issue]],
+) -> list[Issue]:
+    """Merge issues from several exports into one deduplicated set.
+
+    Issues are keyed by ``key``; when the same key appears more than once the
+    copy with the most recent ``updated`` timestamp wins (later exports win
+    ties).
+
+    Args:
+        issue_lists: Parsed issues per export file
+
+    Returns:
+        Deduplicated list of issues
+    """
+    merged: dict[str, Issue] = {}
+    for issues in issue_lists:
+        for issue in issues:
+            key = issue.key
+            current = merged.get(key)
+            if current is None or _updated_sort_key(issue) >= _updated_sort_key(
+                current
+            ):
+                merged[key] = issue
+    return list(merged.values())
+
+
+def resolve_xml_paths(spec: str) -> list[Path]:
+    """Expand an XML file, a directory of exports or a glob into file paths.
+
+    Args:
+        spec: File path, directory path or glob pattern
+
+    Returns:
+        Sorted list of XML export paths
+    """
+    path = Path(spec)
+    if path.is_dir():
+        return sorted(path.glob("*.xml"))
+    if path.exists():
+        return [path]
+    if glob.has_magic(spec):
+        return sorted(Path(p) for p in glob.glob(spec))
+    return []
+
+
+def _parse_export_file(
+    xml_path: Path, cache_dir: Path | None = None, full: bool = False
+) -> list[Issue]:
+    """Parse one export file in a worker process."""
+    if cache_dir is None:
+        return list(iter_jira_xml(xml_path, full=full))
+
+    with ExportCache(cache_dir) as cache:
+        set_text_cache(cache)
+        try:
+            return list(iter_jira_xml(xml_path, cache, full))
+        finally:
+            set_text_cache(None)
+
+
+def parse_jira_exports(
+    xml_paths: list[Path],
+    workers: int | None = None,
+    cache_dir: Path | None = None,
+    full: bool = False,
+) -> list[Issue]:
+    """Parse several Jira XML exports in parallel and merge the results.
+
+    Each file is parsed in its own worker process, so throughput scales with
+    the number of CPU cores.
+
+    Args:
+        xml_paths: Export files to parse
+        workers: Number of worker processes (default: one per CPU core)
+        cache_dir: Optional export cache directory shared by the workers
+        full: Full extraction mode (see ``iter_jira_xml()``)
+
+    Returns:
+        Deduplicated list of issues (see ``merge_issues()``)
+    """
+    workers = min(workers or os.cpu_count() or 1, len(xml_paths))
+    print(f"Parsing {len(xml_paths)} Jira XML files with {workers} workers")
+
+    cache_dirs = [cache_dir] * len(xml_paths)
+    modes = [full] * len(xml_paths)
+    if workers <= 1:
+        results = [
+            _parse_export_file(*args)
+            for args in zip(xml_paths, cache_dirs, modes, strict=True)
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(_parse_export_file, xml_paths, cache_dirs, modes)
+            )
+
+    for path, issues in zip(xml_paths, results, strict=True):
+        print(f"  {path.name}: {len(issues)} issues")
+
+    return merge_issues(results)
+
+
+def group_by_status(issues: list[Issue]) -> list[tuple[str, list[Issue]]]:
+    """Group issues by status, keeping each group in input order.
+
+    Args:
+        issues: Issues to group
+
+    Returns:
+        (status, issues) pairs, statuses in ``STATUS_ORDER`` first and the
+        rest alphabetically
+    """
+    groups: dict[str, list[Issue]] = {}
+    for issue in issues:
+        if issue.status in groups:
+            groups[issue.status].append(issue)
+        else:
+            groups[issue.status] = [issue]
+    return sorted(
+        groups.items(), key=lambda item: (_STATUS_RANK.get(item[0], 999), item[0])
+    )
+
+
+class IssueGraph:
+    """Relationship index over an export, built once by organize_issues().
+
+    Every list the markdown generators need is filtered and sorted by key up
+    front: epics, stories and tasks per epic, children per parent (also
+    grouped by status), standalone tasks per epic and per-status counts, so
+    rendering is a lookup per epic/story instead of a re-scan of the export.
+    """
+
+    __slots__ = (
+        "issues_by_key",
+        "epics",
+        "epic_stories",
+        "epic_tasks",
+        "standalone_tasks",
+        "children",
+        "children_by_status",
+        "done_counts",
+        "status_counts",
+    )
+
+    def __init__(
+        self,
+        epics: list[Issue],
+        stories: list[Issue],
+        tasks: list[Issue],
+        issues_by_key: dict[str, Issue],
+        epic_links: dict[str, list[Issue]],
+        parent_children: dict[str, list[Issue]],
+    ):
+        by_key = attrgetter("key")
+        self.issues_by_key = issues_by_key
+        self.epics = sorted(epics, key=by_key)
+
+        # Parent key -> children, sorted and grouped by status
+        self.children: dict[str, list[Issue]] = {}
+        self.children_by_status: dict[str, list[tuple[str, list[Issue]]]] = {}
+        self.done_counts: dict[str, int] = {}
+        for parent_key, children in parent_children.items():
+            children = sorted(children, key=by_key)
+            self.children[parent_key] = children
+            self.children_by_status[parent_key] = group_by_status(children)
+            self.done_counts[parent_key] = sum(
+                1 for child in children if child.status.lower() == "done"
+            )
+
+        # Epic key -> linked stories / tasks / tasks not under a story
+        self.epic_stories: dict[str, list[Issue]] = {}
+        self.epic_tasks: dict[str, list[Issue]] = {}
+        self.standalone_tasks: dict[str, list[tuple[str, list[Issue]]]] = {}
+        for epic_key, linked in epic_links.items():
+            linked = sorted(linked, key=by_key)
+            self.epic_stories[epic_key] = [
+                i for i in linked if i.issue_type_lower in STORY_TYPES
+            ]
+            epic_tasks = [i for i in linked if i.issue_type_lower in TASK_TYPES]
+            self.epic_tasks[epic_key] = epic_tasks
+            self.standalone_tasks[epic_key] = group_by_status(
+                [task for task in epic_tasks if not self._has_story_parent(task)]
+            )
+
+        self.status_counts: dict[str, int] = {}
+        for issue in chain(epics, stories, tasks):
+            self.status_counts[issue.status] = (
+                self.status_counts.get(issue.status, 0) + 1
+            )
+
+    def epic_by_issue(self) -> dict[str, str]:
+        """Map each epic and every issue under it to the epic's key.
+
+        Covers the stories and tasks linked to the epic and the children of
+        those, so subtasks roll up to the epic of their story.
+        """
+        epic_of: dict[str, str] = {}
+        for epic in self.epics:
+            epic_of[epic.key] = epic.key
+            for issue in chain(
+                self.epic_stories.get(epic.key, ()), self.epic_tasks.get(epic.key, ())
+            ):
+                epic_of.setdefault(issue.key, epic.key)
+                for child in self.children.get(issue.key, ()):
+                    epic_of.setdefault(child.key, epic.key)
+        return epic_of
+
+    def epic_subgraph(self, epic_key: str) -> "IssueGraph":
+        """Return the slice of the graph needed to render one epic section.
+
+        Keeps only the epic's stories and tasks and the children of those
+        stories, so a section can be shipped to a worker process without the
+        rest of the export.
+        """
+        sub = IssueGraph.__new__(IssueGraph)
+        sub.issues_by_key = {}
+        sub.epics = []
+        sub.status_counts = {}
+        sub.epic_stories = {}
+        sub.epic_tasks = {}
+        sub.standalone_tasks = {}
+        sub.children = {}
+        sub.children_by_status = {}
+        sub.done_counts = {}
+        if epic_key in self.epic_stories:
+            sub.epic_stories[epic_key] = self.epic_stories[epic_key]
+            sub.epic_tasks[epic_key] = self.epic_tasks[epic_key]
+            sub.standalone_tasks[epic_key] = self.standalone_tasks[epic_key]
+            for story in self.epic_stories[epic_key]:
+                if story.key in self.children:
+                    sub.children[story.key] = self.children[story.key]
+                    sub.children_by_status[story.key] = self.children_by_status[
+                        story.key
+                    ]
+                    sub.done_counts[story.key] = self.done_counts[story.key]
+        return sub
+
+    def _has_story_parent(self, task: Issue) -> bool:
+        """Whether the task is a subtask of a story in this export."""
+        parent = self.issues_by_key.get(task.parent_key or "")
+        return parent is not None and parent.issue_type_lower in STORY_TYPES
+
+
+def epic_keys_by_name(epics: Iterable[Issue]) -> dict[str, str]:
+    """Map epic names (their summaries) to epic keys.
+
+    The Epic Link field of most exports holds the epic's name rather than its
+    key; see ``epic_key_of()``.
+    """
+    return {epic.summary: epic.key for epic in epics if epic.summary}
+
+
+def epic_key_of(issue: Issue, epic_keys: dict[str, str]) -> str | None:
+    """Return the key of the epic an issue's Epic Link points to.
+
+    Args:
+        issue: Linked issue
+        epic_keys: Epic name -> key map (see ``epic_keys_by_name()``)
+
+    Returns:
+        Epic key, the raw link when it names no known epic (it may already be
+        a key), or None without an Epic Link
+    """
+    if not issue.epic_link:
+        return None
+    return epic_keys.get(issue.epic_link, issue.epic_link)
+
+
+def organize_issues(issues: Iterable[Issue | dict[str, Any]]) -> dict[str, Any]:
     """Organize issues by type and relationships.
 
     Args:
-        issues: List of issue dictionaries
+        issues: Parsed issues (a list or a streaming generator such as
+            ``iter_jira_xml()``); consumed in a single pass. Legacy issue
+            dictionaries are converted with ``Issue.from_dict()``
 
     Returns:
-        Dictionary with organized issues
+        Dictionary with organized issues; ``graph`` holds the IssueGraph
+        index the markdown generators read from
     """
     epics = []
     stories = []
@@ -239,19 +1022,20 @@ def organize_issues(issues: list[dict[str, Any]]) -> dict[str, Any]:
     other_issues = []
 
     # Issue lookup by key
-    issues_by_key: dict[str, dict[str, Any]] = {}
+    issues_by_key: dict[str, Issue] = {}
 
     for issue in issues:
-        key = issue.get("key", "")
-        issues_by_key[key] = issue
+        if not isinstance(issue, Issue):
+            issue = Issue.from_dict(issue)
+        issues_by_key[issue.key] = issue
 
-        issue_type = issue.get("issuetype", {}).get("name", "").lower()
+        issue_type = issue.issue_type_lower
 
         if issue_type == "epic":
             epics.append(issue)
-        elif issue_type in ["story", "user story"]:
+        elif issue_type in STORY_TYPES:
             stories.append(issue)
-        elif issue_type in ["task", "subtask"]:
+        elif issue_type in TASK_TYPES:
             tasks.append(issue)
         else:
             other_issues.append(issue)
@@ -259,17 +1043,12 @@ def organize_issues(issues: list[dict[str, Any]]) -> dict[str, Any]:
     # Map relationships
     # Epic links: stories/tasks linked to epics
     # Epic links can be by key or by name (summary)
-    epic_links: dict[str, list[dict[str, Any]]] = {}
+    epic_links: dict[str, list[Issue]] = {}
     # Create a mapping from epic name to epic key
-    epic_name_to_key: dict[str, str] = {}
-    for epic in epics:
-        epic_key = epic.get("key", "")
-        epic_name = epic.get("summary", "")
-        if epic_name:
-            epic_name_to_key[epic_name] = epic_key
+    epic_name_to_key = epic_keys_by_name(epics)
 
     for story in stories + tasks + other_issues:
-        epic_link = story.get("epicLink")
+        epic_link = story.epic_link
         if epic_link:
             # Try to find epic by name first, then by key
             epic_key = None
@@ -284,15 +1063,9 @@ def organize_issues(issues: list[dict[str, Any]]) -> dict[str, Any]:
                 epic_links[epic_key].append(story)
 
     # Parent-child relationships (subtasks)
-    parent_children: dict[str, list[dict[str, Any]]] = {}
+    parent_children: dict[str, list[Issue]] = {}
     for task in tasks + stories + other_issues:
-        parent = task.get("parent")
-        parent_key = None
-        if isinstance(parent, dict):
-            parent_key = parent.get("key")
-        elif isinstance(parent, str):
-            parent_key = parent
-
+        parent_key = task.parent_key
         if parent_key:
             if parent_key not in parent_children:
                 parent_children[parent_key] = []
@@ -306,28 +1079,75 @@ def organize_issues(issues: list[dict[str, Any]]) -> dict[str, Any]:
         "issues_by_key": issues_by_key,
         "epic_links": epic_links,
         "parent_children": parent_children,
+        "graph": IssueGraph(
+            epics, stories, tasks, issues_by_key, epic_links, parent_children
+        ),
     }
 
 
-def generate_epics_markdown(
-    organized: dict[str, Any], project_key: str, project_name: str = ""
-) -> str:
-    """Generate the epics markdown file.
+def _extracted_details(issue: Issue) -> list[tuple[str, str]]:
+    """Return (label, value) pairs for data only present in full extraction.
+
+    Covers the custom fields listed in ``MARKDOWN_CUSTOM_FIELDS``, subtasks,
+    issue links and the comment count; empty for issues parsed without
+    ``--full``.
+    """
+    details = []
+    for name in MARKDOWN_CUSTOM_FIELDS:
+        custom_field = issue.custom_field(name)
+        if custom_field is not None and custom_field.values:
+            details.append((name, ", ".join(custom_field.values)))
+    if issue.subtasks:
+        details.append(("Subtasks", ", ".join(issue.subtasks)))
+    if issue.links:
+        links = ", ".join(f"{link.description} {link.key}" for link in issue.links)
+        details.append(("Links", links))
+    if issue.comments:
+        details.append(("Comments", str(len(issue.comments))))
+    return details
+
+
+def render_task_lines(task: Issue, show_status: bool = True) -> list[str]:
+    """Render a task as a markdown bullet followed by its detail bullets.
 
     Args:
-        organized: Organized issues dictionary
-        project_key: Project key
-        project_name: Project name (optional)
+        task: Task to render
+        show_status: Include the status on the bullet line
 
     Returns:
-        Markdown content
+        Markdown lines
     """
+    # Build task line with key info
+    task_parts = [f"**{task.key}**: {task.summary}"]
+    if show_status:
+        task_parts.append(f"Status: {task.status}")
+    if task.priority:
+        task_parts.append(f"Priority: {task.priority}")
+
+    lines = [f"- {', '.join(task_parts)}"]
+
+    # Add additional info if available
+    if task.assignee and task.assignee != "Unassigned":
+        lines.append(f"  - Assignee: {task.assignee}")
+    if task.labels:
+        lines.append(f"  - Labels: {', '.join(task.labels)}")
+
+    # Add time tracking if available
+    if task.time_spent:
+        lines.append(f"  - Time Spent: {task.time_spent}")
+
+    for label, value in _extracted_details(task):
+        lines.append(f"  - {label}: {value}")
+    return lines
+
+
+def _render_epics_header(
+    organized: dict[str, Any], project_key: str, project_name: str = ""
+) -> list[str]:
+    """Render the title and summary statistics of the epics markdown."""
     epics = organized["epics"]
     stories = organized["stories"]
     tasks = organized["tasks"]
-    epic_links = organized["epic_links"]
-    parent_children = organized["parent_children"]
-    issues_by_key = organized["issues_by_key"]
 
     lines = []
     lines.append(f"# {project_name or project_key} - Jira Epic Structure")
@@ -339,7 +1159,7 @@ def generate_epics_markdown(
 
     # Summary statistics
     lines.append("**Estructura en Jira:**")
-    epic_keys = [e.get("key", "") for e in epics]
+    epic_keys = [e.key for e in epics]
     lines.append(f"- **{len(epics)} Epics**: {', '.join(epic_keys)}")
     lines.append(f"- **{len(stories)} Stories**")
     lines.append(f"- **{len(tasks)} Tasks**")
@@ -347,266 +1167,322 @@ def generate_epics_markdown(
     lines.append("---")
     lines.append("")
 
-    # Sort epics by key
-    epics_sorted = sorted(epics, key=lambda x: x.get("key", ""))
+    return lines
 
-    for epic_idx, epic in enumerate(epics_sorted, 1):
-        epic_key = epic.get("key", "")
-        epic_summary = epic.get("summary", "")
-        epic_status = epic.get("status", {}).get("name", "Unknown")
-        epic_description = epic.get("description", "")
 
-        # Get custom fields that might be useful
-        priority = epic.get("priority", {}).get("name", "")
-        assignee = epic.get("assignee", {}).get("displayName", "")
-        created = epic.get("created", "")
-        updated = epic.get("updated", "")
+def _render_epic_section(graph: IssueGraph, epic_idx: int, epic: Issue) -> list[str]:
+    """Render the markdown section of one epic, its stories and tasks.
 
-        lines.append(f"## EPIC {epic_idx}: {epic_summary}")
-        lines.append("")
-        lines.append(f"**Epic Key**: {epic_key}")
-        lines.append(f"**Summary**: {epic_summary}")
-        lines.append(f"**Status**: {epic_status}")
-        if priority:
-            lines.append(f"**Priority**: {priority}")
-        if assignee and assignee != "Unassigned":
-            lines.append(f"**Assignee**: {assignee}")
-        if created:
-            # Format date nicely
-            try:
-                from datetime import datetime
-                dt = datetime.strptime(created.split(",")[1].strip(), "%d %b %Y %H:%M:%S %z")
-                lines.append(f"**Created**: {dt.strftime('%Y-%m-%d')}")
-            except Exception:
-                lines.append(f"**Created**: {created}")
-        
-        # Count linked issues
-        epic_stories = epic_links.get(epic_key, [])
-        if epic_stories:
-            stories_count = len([s for s in epic_stories if s.get("issuetype", {}).get("name", "").lower() in ["story", "user story"]])
-            tasks_count = len([t for t in epic_stories if t.get("issuetype", {}).get("name", "").lower() in ["task", "subtask"]])
-            if stories_count > 0 or tasks_count > 0:
-                counts = []
-                if stories_count > 0:
-                    counts.append(f"{stories_count} Stories")
-                if tasks_count > 0:
-                    counts.append(f"{tasks_count} Tasks")
-                lines.append(f"**Linked Issues**: {', '.join(counts)}")
-        
-        lines.append("")
-        
-        if epic_description:
-            desc = format_description(epic_description, max_length=400)
-            if desc:
-                lines.append("**Description**:")
-                lines.append("")
-                # Indent description for better readability
-                for line in desc.split("\n"):
-                    if line.strip():
-                        lines.append(f"  {line}")
-                    else:
-                        lines.append("")
-                lines.append("")
+    Args:
+        graph: Issue graph from ``organize_issues()``
+        epic_idx: 1-based position of the epic in key order
+        epic: The epic
 
-        # Get stories/tasks linked to this epic
-        epic_stories = epic_links.get(epic_key, [])
+    Returns:
+        Markdown lines of the section
+    """
+    lines = []
+    epic_key = epic.key
+    epic_summary = epic.summary
+    epic_status = epic.status
+    epic_description = epic.description
 
-        if epic_stories:
-            # Separate stories and tasks
-            epic_stories_list = [
-                s
-                for s in epic_stories
-                if s.get("issuetype", {}).get("name", "").lower() in ["story", "user story"]
-            ]
-            epic_tasks_list = [
-                t
-                for t in epic_stories
-                if t.get("issuetype", {}).get("name", "").lower() in ["task", "subtask"]
-            ]
+    # Get custom fields that might be useful
+    priority = epic.priority
+    assignee = epic.assignee
+    created = epic.created
 
-            # Sort by key
-            epic_stories_list = sorted(epic_stories_list, key=lambda x: x.get("key", ""))
-            epic_tasks_list = sorted(epic_tasks_list, key=lambda x: x.get("key", ""))
-
-            # Process stories
-            for story in epic_stories_list:
-                story_key = story.get("key", "")
-                story_summary = story.get("summary", "")
-                story_status = story.get("status", {}).get("name", "Unknown")
-                story_priority = story.get("priority", {}).get("name", "")
-                story_description = story.get("description", "")
-
-                story_assignee = story.get("assignee", {}).get("displayName", "")
-                story_labels = story.get("labels", [])
-                
-                lines.append(f"### Story {story_key}: {story_summary}")
-                lines.append("")
-                lines.append(f"**Story Key**: {story_key}")
-                lines.append(f"**Summary**: {story_summary}")
-                lines.append(f"**Status**: {story_status}")
-                if story_priority:
-                    lines.append(f"**Priority**: {story_priority}")
-                if story_assignee and story_assignee != "Unassigned":
-                    lines.append(f"**Assignee**: {story_assignee}")
-                if story_labels:
-                    lines.append(f"**Labels**: {', '.join(story_labels)}")
-                
-                # Get task count for this story
-                story_tasks = parent_children.get(story_key, [])
-                if story_tasks:
-                    done_count = len([t for t in story_tasks if t.get("status", {}).get("name", "").lower() == "done"])
-                    total_count = len(story_tasks)
-                    lines.append(f"**Tasks**: {total_count} total ({done_count} done)")
-                
-                lines.append("")
-                
-                if story_description:
-                    desc = format_description(story_description, max_length=300)
-                    if desc:
-                        lines.append("**Description**:")
-                        lines.append("")
-                        for line in desc.split("\n"):
-                            if line.strip():
-                                lines.append(f"  {line}")
-                            else:
-                                lines.append("")
-                        lines.append("")
+    lines.append(f"## EPIC {epic_idx}: {epic_summary}")
+    lines.append("")
+    lines.append(f"**Epic Key**: {epic_key}")
+    lines.append(f"**Summary**: {epic_summary}")
+    lines.append(f"**Status**: {epic_status}")
+    if priority:
+        lines.append(f"**Priority**: {priority}")
+    if assignee and assignee != "Unassigned":
+        lines.append(f"**Assignee**: {assignee}")
+    if created:
+        created_at = epic.created_at
+        if created_at is not None:
+            lines.append(f"**Created**: {created_at:%Y-%m-%d}")
+        else:
+            lines.append(f"**Created**: {created}")
+
+    # Get stories/tasks linked to this epic
+    epic_stories_list = graph.epic_stories.get(epic_key, [])
+    epic_tasks_list = graph.epic_tasks.get(epic_key, [])
+
+    # Count linked issues
+    stories_count = len(epic_stories_list)
+    tasks_count = len(epic_tasks_list)
+    if stories_count > 0 or tasks_count > 0:
+        counts = []
+        if stories_count > 0:
+            counts.append(f"{stories_count} Stories")
+        if tasks_count > 0:
+            counts.append(f"{tasks_count} Tasks")
+        lines.append(f"**Linked Issues**: {', '.join(counts)}")
+
+    for label, value in _extracted_details(epic):
+        lines.append(f"**{label}**: {value}")
 
-                # Get tasks linked to this story (as parent)
-                story_tasks = parent_children.get(story_key, [])
-                story_tasks = sorted(story_tasks, key=lambda x: x.get("key", ""))
-
-                if story_tasks:
-                    # Group tasks by status for better organization
-                    tasks_by_status: dict[str, list[dict[str, Any]]] = {}
-                    for task in story_tasks:
-                        status = task.get("status", {}).get("name", "Unknown")
-                        if status not in tasks_by_status:
-                            tasks_by_status[status] = []
-                        tasks_by_status[status].append(task)
-                    
-                    # Sort statuses: Done first, then others
-                    status_order = ["Done", "In Progress", "To Do", "In Review", "Blocked"]
-                    sorted_statuses = sorted(
-                        tasks_by_status.keys(),
-                        key=lambda x: (
-                            status_order.index(x) if x in status_order else 999,
-                            x
-                        )
-                    )
-                    
-                    lines.append("#### Tasks:")
+    lines.append("")
+
+    if epic_description:
+        desc = format_description(epic_description, max_length=400)
+        if desc:
+            lines.append("**Description**:")
+            lines.append("")
+            # Indent description for better readability
+            for line in desc.split("\n"):
+                if line.strip():
+                    lines.append(f"  {line}")
+                else:
                     lines.append("")
-                    
-                    for status in sorted_statuses:
-                        status_tasks = sorted(tasks_by_status[status], key=lambda x: x.get("key", ""))
-                        if len(sorted_statuses) > 1:
-                            lines.append(f"**{status}** ({len(status_tasks)}):")
-                            lines.append("")
-                        
-                        for task in status_tasks:
-                            task_key = task.get("key", "")
-                            task_summary = task.get("summary", "")
-                            task_status = task.get("status", {}).get("name", "Unknown")
-                            task_priority = task.get("priority", {}).get("name", "")
-                            task_assignee = task.get("assignee", {}).get("displayName", "")
-                            task_labels = task.get("labels", [])
-                            
-                            # Build task line with key info
-                            task_parts = [f"**{task_key}**: {task_summary}"]
-                            if task_status != status or len(sorted_statuses) == 1:
-                                task_parts.append(f"Status: {task_status}")
-                            if task_priority:
-                                task_parts.append(f"Priority: {task_priority}")
-                            
-                            lines.append(f"- {', '.join(task_parts)}")
-                            
-                            # Add additional info if available
-                            if task_assignee and task_assignee != "Unassigned":
-                                lines.append(f"  - Assignee: {task_assignee}")
-                            if task_labels:
-                                lines.append(f"  - Labels: {', '.join(task_labels)}")
-                            
-                            # Add time tracking if available
-                            if task.get("time_spent"):
-                                lines.append(f"  - Time Spent: {task.get('time_spent')}")
-                            
+            lines.append("")
+
+    if epic_key in graph.epic_stories:
+        # Process stories
+        for story in epic_stories_list:
+            story_key = story.key
+            story_summary = story.summary
+            story_status = story.status
+            story_priority = story.priority
+            story_description = story.description
+
+            story_assignee = story.assignee
+            story_labels = story.labels
+
+            lines.append(f"### Story {story_key}: {story_summary}")
+            lines.append("")
+            lines.append(f"**Story Key**: {story_key}")
+            lines.append(f"**Summary**: {story_summary}")
+            lines.append(f"**Status**: {story_status}")
+            if story_priority:
+                lines.append(f"**Priority**: {story_priority}")
+            if story_assignee and story_assignee != "Unassigned":
+                lines.append(f"**Assignee**: {story_assignee}")
+            if story_labels:
+                lines.append(f"**Labels**: {', '.join(story_labels)}")
+
+            # Get task count for this story
+            story_tasks = graph.children.get(story_key, [])
+            if story_tasks:
+                done_count = graph.done_counts[story_key]
+                total_count = len(story_tasks)
+                lines.append(f"**Tasks**: {total_count} total ({done_count} done)")
+
+            for label, value in _extracted_details(story):
+                lines.append(f"**{label}**: {value}")
+
+            lines.append("")
+
+            if story_description:
+                desc = format_description(story_description, max_length=300)
+                if desc:
+                    lines.append("**Description**:")
+                    lines.append("")
+                    for line in desc.split("\n"):
+                        if line.strip():
+                            lines.append(f"  {line}")
+                        else:
                             lines.append("")
+                    lines.append("")
 
-                lines.append("---")
-                lines.append("")
+            # Tasks linked to this story (as parent), grouped by status
+            # for better organization: Done first, then others
+            tasks_by_status = graph.children_by_status.get(story_key, [])
 
-            # Process standalone tasks (not linked to stories as subtasks)
-            standalone_tasks = []
-            for t in epic_tasks_list:
-                parent = t.get("parent")
-                if not parent:
-                    standalone_tasks.append(t)
-                else:
-                    parent_key = (
-                        parent.get("key") if isinstance(parent, dict) else parent
-                    )
-                    # Check if parent is a story - if not, it's standalone
-                    if parent_key and parent_key in issues_by_key:
-                        parent_issue = issues_by_key[parent_key]
-                        parent_type = (
-                            parent_issue.get("issuetype", {}).get("name", "").lower()
-                        )
-                        if parent_type not in ["story", "user story"]:
-                            standalone_tasks.append(t)
-                    else:
-                        standalone_tasks.append(t)
-
-            if standalone_tasks:
-                # Group standalone tasks by status
-                standalone_by_status: dict[str, list[dict[str, Any]]] = {}
-                for task in standalone_tasks:
-                    status = task.get("status", {}).get("name", "Unknown")
-                    if status not in standalone_by_status:
-                        standalone_by_status[status] = []
-                    standalone_by_status[status].append(task)
-                
-                # Sort statuses
-                status_order = ["Done", "In Progress", "To Do", "In Review", "Blocked"]
-                sorted_statuses = sorted(
-                    standalone_by_status.keys(),
-                    key=lambda x: (
-                        status_order.index(x) if x in status_order else 999,
-                        x
-                    )
-                )
-                
-                lines.append("### Standalone Tasks:")
+            if tasks_by_status:
+                lines.append("#### Tasks:")
                 lines.append("")
-                
-                for status in sorted_statuses:
-                    status_tasks = sorted(standalone_by_status[status], key=lambda x: x.get("key", ""))
-                    if len(sorted_statuses) > 1:
+
+                for status, status_tasks in tasks_by_status:
+                    if len(tasks_by_status) > 1:
                         lines.append(f"**{status}** ({len(status_tasks)}):")
                         lines.append("")
-                    
+
                     for task in status_tasks:
-                        task_key = task.get("key", "")
-                        task_summary = task.get("summary", "")
-                        task_status = task.get("status", {}).get("name", "Unknown")
-                        task_priority = task.get("priority", {}).get("name", "")
-                        task_assignee = task.get("assignee", {}).get("displayName", "")
-                        
-                        task_parts = [f"**{task_key}**: {task_summary}"]
-                        if task_status != status or len(sorted_statuses) == 1:
-                            task_parts.append(f"Status: {task_status}")
-                        if task_priority:
-                            task_parts.append(f"Priority: {task_priority}")
-                        
-                        lines.append(f"- {', '.join(task_parts)}")
-                        
-                        if task_assignee and task_assignee != "Unassigned":
-                            lines.append(f"  - Assignee: {task_assignee}")
+                        show_status = task.status != status or len(tasks_by_status) == 1
+                        lines.extend(render_task_lines(task, show_status))
                         lines.append("")
 
-        lines.append("")
+            lines.append("---")
+            lines.append("")
 
-    return "\n".join(lines)
+        # Process standalone tasks (not linked to stories as subtasks),
+        # grouped by status
+        standalone_by_status = graph.standalone_tasks[epic_key]
+
+        if standalone_by_status:
+            lines.append("### Standalone Tasks:")
+            lines.append("")
+
+            for status, status_tasks in standalone_by_status:
+                if len(standalone_by_status) > 1:
+                    lines.append(f"**{status}** ({len(status_tasks)}):")
+                    lines.append("")
+
+                for task in status_tasks:
+                    task_key = task.key
+                    task_summary = task.summary
+                    task_status = task.status
+                    task_priority = task.priority
+                    task_assignee = task.assignee
+
+                    task_parts = [f"**{task_key}**: {task_summary}"]
+                    if task_status != status or len(standalone_by_status) == 1:
+                        task_parts.append(f"Status: {task_status}")
+                    if task_priority:
+                        task_parts.append(f"Priority: {task_priority}")
+
+                    lines.append(f"- {', '.join(task_parts)}")
+
+                    if task_assignee and task_assignee != "Unassigned":
+                        lines.append(f"  - Assignee: {task_assignee}")
+                    for label, value in _extracted_details(task):
+                        lines.append(f"  - {label}: {value}")
+                    lines.append("")
+
+    lines.append("")
+
+    return lines
+
+
+def _render_epic_job(job: tuple[IssueGraph, int, Issue]) -> list[str]:
+    """Render one epic section in a worker process."""
+    return _render_epic_section(*job)
+
+
+def _iter_epic_sections(
+    graph: IssueGraph, workers: int | None = None
+) -> Iterator[tuple[int, Issue, list[str]]]:
+    """Render the epic sections in key order, optionally in parallel.
+
+    With ``workers`` > 1 the sections are rendered by a process pool; results
+    are still yielded in key order, so the output is identical to the serial
+    path.
+
+    Args:
+        graph: Issue graph from ``organize_issues()``
+        workers: Number of worker processes (None or 1 renders serially)
+
+    Yields:
+        (epic index, epic, section lines) tuples
+    """
+    numbered = list(enumerate(graph.epics, 1))
+    if not workers or workers <= 1 or len(numbered) <= 1:
+        for epic_idx, epic in numbered:
+            yield epic_idx, epic, _render_epic_section(graph, epic_idx, epic)
+        return
+
+    jobs = (
+        (graph.epic_subgraph(epic.key), epic_idx, epic) for epic_idx, epic in numbered
+    )
+    # Workers must not share the parent's SQLite connection
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=set_text_cache, initargs=(None,)
+    ) as executor:
+        sections = executor.map(_render_epic_job, jobs)
+        for (epic_idx, epic), lines in zip(numbered, sections, strict=True):
+            yield epic_idx, epic, lines
+
+
+def write_epics_markdown(
+    organized: dict[str, Any],
+    out: TextIO,
+    project_key: str,
+    project_name: str = "",
+    workers: int | None = None,
+) -> None:
+    """Write the epics markdown to a text sink, one epic at a time.
+
+    Only the sections being rendered are held in memory and the sink is
+    flushed after each section, so partial output can be inspected while a
+    large project is still rendering.
+
+    Args:
+        organized: Organized issues dictionary
+        out: Open text file or any object with ``write()``
+        project_key: Project key
+        project_name: Project name (optional)
+        workers: Worker processes for rendering epic sections (default: serial)
+    """
+    graph: IssueGraph = organized["graph"]
+
+    out.write("\n".join(_render_epics_header(organized, project_key, project_name)))
+    for _, _, lines in _iter_epic_sections(graph, workers):
+        out.write("\n")
+        out.write("\n".join(lines))
+        if hasattr(out, "flush"):
+            out.flush()
+
+
+def write_epics_markdown_split(
+    organized: dict[str, Any],
+    output_dir: Path,
+    filename: str,
+    project_key: str,
+    project_name: str = "",
+    workers: int | None = None,
+) -> list[Path]:
+    """Write the epics markdown as one file per epic.
+
+    ``output_dir / filename`` gets the title, summary statistics and a link to
+    each epic; every epic section goes to ``<stem>/<EPIC-KEY>.md`` next to it.
+
+    Args:
+        organized: Organized issues dictionary
+        output_dir: Output directory
+        filename: Name of the overview file (e.g. ``suppathletik-epics.md``)
+        project_key: Project key
+        project_name: Project name (optional)
+        workers: Worker processes for rendering epic sections (default: serial)
+
+    Returns:
+        Paths of the files written, overview first
+    """
+    graph: IssueGraph = organized["graph"]
+    epics_dir = output_dir / Path(filename).stem
+    epics_dir.mkdir(parents=True, exist_ok=True)
+
+    overview = output_dir / filename
+    written = [overview]
+    with overview.open("w", encoding="utf-8") as out:
+        out.write("\n".join(_render_epics_header(organized, project_key, project_name)))
+        for epic_idx, epic, lines in _iter_epic_sections(graph, workers):
+            epic_file = epics_dir / f"{epic.key}.md"
+            epic_file.write_text("\n".join(lines), encoding="utf-8")
+            written.append(epic_file)
+            out.write(
+                f"\n- [EPIC {epic_idx}: {epic.summary}]"
+                f"({epics_dir.name}/{epic_file.name})"
+            )
+        out.write("\n")
+
+    return written
+
+
+def generate_epics_markdown(
+    organized: dict[str, Any],
+    project_key: str,
+    project_name: str = "",
+    workers: int | None = None,
+) -> str:
+    """Generate the epics markdown file.
+
+    Args:
+        organized: Organized issues dictionary
+        project_key: Project key
+        project_name: Project name (optional)
+        workers: Worker processes for rendering epic sections (default: serial)
+
+    Returns:
+        Markdown content
+    """
+    out = io.StringIO()
+    write_epics_markdown(organized, out, project_key, project_name, workers)
+    return out.getvalue()
 
 
 def generate_index_markdown(
@@ -658,13 +1534,10 @@ def generate_index_markdown(
     lines.append(f"- **{len(stories)} Stories**")
     lines.append(f"- **{len(tasks)} Tasks**")
     lines.append("")
-    
-    # Calculate status breakdown
-    status_counts: dict[str, int] = {}
-    for issue in epics + stories + tasks:
-        status = issue.get("status", {}).get("name", "Unknown")
-        status_counts[status] = status_counts.get(status, 0) + 1
-    
+
+    # Status breakdown
+    status_counts = organized["graph"].status_counts
+
     if status_counts:
         lines.append("### Status Breakdown")
         lines.append("")
@@ -677,12 +1550,12 @@ def generate_index_markdown(
     if epics:
         lines.append("### Epics")
         lines.append("")
-        for epic in sorted(epics, key=lambda x: x.get("key", "")):
-            epic_key = epic.get("key", "")
-            epic_summary = epic.get("summary", "")
-            epic_status = epic.get("status", {}).get("name", "Unknown")
-            epic_priority = epic.get("priority", {}).get("name", "")
-            
+        for epic in organized["graph"].epics:
+            epic_key = epic.key
+            epic_summary = epic.summary
+            epic_status = epic.status
+            epic_priority = epic.priority
+
             epic_info = f"- **{epic_key}**: {epic_summary}"
             epic_info += f" (Status: {epic_status}"
             if epic_priority:
@@ -693,12 +1566,19 @@ def generate_index_markdown(
 
     lines.append("---")
     lines.append("")
+
+    time_tracking = time_tracking_section(
+        organized["issues_by_key"].values(), organized["graph"].epic_by_issue()
+    )
+    if time_tracking:
+        lines.extend(time_tracking)
+        lines.append("---")
+        lines.append("")
+
     lines.append("## Notes")
     lines.append("")
     lines.append("- Esta documentación se genera automáticamente desde Jira XML export")
-    lines.append(
-        "- Para actualizar, ejecutar el script `scripts/parse_jira_xml.py`"
-    )
+    lines.append("- Para actualizar, ejecutar el script `scripts/parse_jira_xml.py`")
     lines.append("")
     lines.append("---")
     lines.append("")
@@ -718,7 +1598,10 @@ def main():
     parser.add_argument(
         "xml_file",
         type=str,
-        help="Path to Jira XML export file",
+        help=(
+            "Path to a Jira XML export file, a directory of exports or a glob "
+            "such as 'exports/Jira (*).xml'"
+        ),
     )
     parser.add_argument(
         "--output-dir",
@@ -726,20 +1609,73 @@ def main():
         default="docs/suppathletik",
         help="Output directory for markdown files (default: docs/suppathletik)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for parsing multiple export files "
+        "(default: one per CPU core)",
+    )
+    parser.add_argument(
+        "--render-workers",
+        type=int,
+        default=None,
+        help="Worker processes for rendering epic sections; the output is "
+        "identical to serial rendering (default: serial)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="Directory for the incremental export cache; unchanged issues and "
+        "already-converted text are reused across runs (default: no cache)",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Full extraction mode: also decode all custom fields, comments, "
+        "issue links and subtasks and include them in the markdown",
+    )
+    parser.add_argument(
+        "--split-epics",
+        action="store_true",
+        help="Write one markdown file per epic next to an overview epics file",
+    )
+    parser.add_argument(
+        "--columnar-dir",
+        type=str,
+        default=None,
+        help="Also write the parsed issues as memory-mappable NumPy columns "
+        "to this directory (requires numpy)",
+    )
 
     args = parser.parse_args()
 
-    xml_path = Path(args.xml_file)
-    if not xml_path.exists():
-        print(f"Error: XML file not found: {xml_path}")
+    xml_paths = resolve_xml_paths(args.xml_file)
+    if not xml_paths:
+        print(f"Error: XML file not found: {args.xml_file}")
         sys.exit(1)
 
-    # Parse XML
+    cache_dir = Path(args.cache_dir) if args.cache_dir else None
+    cache = ExportCache(cache_dir) if cache_dir is not None else None
+    set_text_cache(cache)
+
     try:
-        issues = parse_jira_xml(xml_path)
-        if not issues:
-            print("No issues found in XML file")
-            sys.exit(0)
+        if len(xml_paths) == 1:
+            # Parse XML and organize issues in a single streaming pass
+            print(f"Parsing Jira XML file: {xml_paths[0]}")
+            organized = organize_issues(
+                iter_jira_xml(xml_paths[0], cache, full=args.full)
+            )
+        else:
+            organized = organize_issues(
+                parse_jira_exports(
+                    xml_paths,
+                    workers=args.workers,
+                    cache_dir=cache_dir,
+                    full=args.full,
+                )
+            )
     except Exception as e:
         print(f"Error parsing XML: {e}")
         import traceback
@@ -747,22 +1683,26 @@ def main():
         traceback.print_exc()
         sys.exit(1)
 
-    # Organize issues
-    print("\nOrganizing issues...")
-    organized = organize_issues(issues)
+    issues_by_key = organized["issues_by_key"]
+    if not issues_by_key:
+        print("No issues found in XML file")
+        sys.exit(0)
+
+    print(f"Successfully parsed {len(issues_by_key)} issues")
 
+    print("\nOrganizing issues...")
     print(f"  Found {len(organized['epics'])} epics")
     print(f"  Found {len(organized['stories'])} stories")
     print(f"  Found {len(organized['tasks'])} tasks")
     print(f"  Found {len(organized['other_issues'])} other issues")
 
     # Get project info from first issue
+    first_issue = next(iter(issues_by_key.values()))
     project_key = "SD"
     project_name = "SUPP-DIGITAL"
-    if issues:
-        project_info = issues[0].get("project", {})
-        project_key = project_info.get("key", "SD")
-        project_name = project_info.get("name", "SUPP-DIGITAL")
+    if first_issue.project_key is not None:
+        project_key = first_issue.project_key
+        project_name = first_issue.project_name
 
     # Generate markdown files
     output_dir = Path(args.output_dir)
@@ -770,11 +1710,28 @@ def main():
 
     print(f"\nGenerating markdown files in {output_dir}...")
 
-    # Generate epics markdown
-    epics_md = generate_epics_markdown(organized, project_key, project_name)
+    # Generate epics markdown, streamed to disk epic by epic
     epics_file = output_dir / "suppathletik-epics.md"
-    epics_file.write_text(epics_md, encoding="utf-8")
-    print(f"  Generated: {epics_file}")
+    if args.split_epics:
+        written = write_epics_markdown_split(
+            organized,
+            output_dir,
+            epics_file.name,
+            project_key,
+            project_name,
+            workers=args.render_workers,
+        )
+        print(f"  Generated: {epics_file} (+{len(written) - 1} epic files)")
+    else:
+        with epics_file.open("w", encoding="utf-8") as out:
+            write_epics_markdown(
+                organized,
+                out,
+                project_key,
+                project_name,
+                workers=args.render_workers,
+            )
+        print(f"  Generated: {epics_file}")
 
     # Generate index markdown
     index_md = generate_index_markdown(organized, project_key, project_name)
@@ -782,9 +1739,24 @@ def main():
     index_file.write_text(index_md, encoding="utf-8")
     print(f"  Generated: {index_file}")
 
+    if args.columnar_dir:
+        columnar_dir = Path(args.columnar_dir)
+        try:
+            columns = write_columnar(
+                issues_by_key.values(),
+                columnar_dir,
+                organized["graph"].epic_by_issue(),
+            )
+        except RuntimeError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print(f"  Generated: {columnar_dir} ({len(columns)} issues, columnar)")
+
+    if cache is not None:
+        cache.close()
+
     print("\nDone!")
 
 
 if __name__ == "__main__":
     main()
-
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""Benchmark SiteCrawler link extraction against the BeautifulSoup version.
+
+Runs on saved storefront HTML fixtures (one page per .html file). Save them
+once from the URLs of a previous crawl:
+
+    python benchmark_link_extraction.py --save 20
+    python benchmark_link_extraction.py
+
+Without fixtures, a synthetic page shaped like a heavy Shopify theme page
+(mega menu, inline scripts and JSON, SVG icons, product grid) is used.
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+from urllib.parse import urljoin, urlparse
+
+import httpx
+
+try:
+    from bs4 import BeautifulSoup
+    HAS_BS4 = True
+except ImportError:
+    HAS_BS4 = False
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from url_crawler import USER_AGENT, SiteCrawler
+
+DOCS_DIR = Path(__file__).parent.parent.parent / "docs" / "shopify-analysis"
+FIXTURES_DIR = DOCS_DIR / "html_fixtures"
+BASE_URL = "https://farmaciasmacross.com.mx"
+
+
+def legacy_extract_links(
+    crawler: SiteCrawler, html: str, current_url: str
+) -> List[str]:
+    """
+    Previous SiteCrawler._extract_links(): full BeautifulSoup tree per page.
+
+    Args:
+        crawler: Crawler providing base_url and URL normalization.
+        html: HTML content.
+        current_url: Current page URL.
+
+    Returns:
+        List of absolute URLs found in the page.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    links = []
+    for tag in soup.find_all("a", href=True):
+        absolute_url = urljoin(current_url, tag["href"])
+        parsed = urlparse(absolute_url)
+        base_parsed = urlparse(crawler.base_url)
+        if parsed.netloc == base_parsed.netloc:
+            links.append(crawler._normalize_url(absolute_url))
+    return links
+
+
+def save_fixtures(count: int) -> int:
+    """
+    Download pages listed in crawl_results.json as fixtures.
+
+    Args:
+        count: Number of pages to save.
+
+    Returns:
+        Number of pages saved.
+    """
+    with open(DOCS_DIR / "crawl_results.json", "r", encoding="utf-8") as f:
+        results = json.load(f)
+    # Spread the sample over categories (home, collections, products, ...)
+    urls = [url for urls in results["categories"].values() for url in urls[:5]]
+
+    FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+    saved = 0
+    with httpx.Client(
+        timeout=30.0, follow_redirects=True, headers={"User-Agent": USER_AGENT}
+    ) as client:
+        for url in urls[:count]:
+            try:
+                response = client.get(url)
+            except Exception as e:
+                print(f"   ❌ {url}: {e}")
+                continue
+            if response.status_code != 200:
+                print(f"   ⚠ {url}: status {response.status_code}")
+                continue
+            path = urlparse(url).path.strip("/").replace("/", "_") or "home"
+            (FIXTURES_DIR / f"{path}.html").write_text(response.text, encoding="utf-8")
+            print(f"✓ Saved {url}")
+            saved += 1
+            time.sleep(0.5)
+    return saved
+
+
+def synthetic_theme_page(seed: int = 0) -> str:
+    """
+    Build a page shaped like a heavy Shopify theme page.
+
+    Args:
+        seed: Random seed.
+
+    Returns:
+        HTML content.
+    """
+    rng = random.Random(seed)
+    icon = (
+        '<svg class="icon" viewBox="0 0 20 20" aria-hidden="true">'
+        + "".join(f'<path d="M{i} {i}L{i + 5} {i + 9}Z"/>' for i in range(12))
+        + "</svg>"
+    )
+    menu = "".join(
+        f'<li class="mega-menu__item"><a href="/collections/coleccion-{i}" '
+        f'class="mega-menu__link link">{icon}Colección {i}</a><ul>'
+        + "".join(
+            f'<li><a href="/collections/coleccion-{i}/tipo-{j}?sort_by=price">'
+            f"Tipo {j}</a></li>"
+            for j in range(8)
+        )
+        + "</ul></li>"
+        for i in range(16)
+    )
+    products = "".join(
+        f'<div class="card-wrapper" data-product-id="{rng.randint(1, 10**9)}">'
+        f'<a href="/products/medicamento-{i}#reviews" class="full-unstyled-link">'
+        f'<img srcset="//cdn.shopify.com/s/files/1/p{i}_360x.jpg 360w, '
+        f'//cdn.shopify.com/s/files/1/p{i}_720x.jpg 720w" loading="lazy" '
+        f'alt="Medicamento {i}" width="720" height="720"></a>'
+        f'<h3 class="card__heading">'
+        f'<a href="/collections/all/products/medicamento-{i}">'
+        f"Medicamento &amp; suplemento {i}</a></h3>"
+        f'<div class="price"><span class="price-item">'
+        f"$ {rng.randint(50, 5000)}.00 MXN</span></div>{icon}"
+        f'<button type="button" class="quick-add__submit">Agregar</button></div>'
+        for i in range(48)
+    )
+    script = (
+        "<script>window.ShopifyAnalytics = window.ShopifyAnalytics || {};"
+        + "var meta = "
+        + json.dumps(
+            {
+                "products": [
+                    {"id": i, "handle": f"medicamento-{i}", "variants": list(range(6))}
+                    for i in range(48)
+                ]
+            }
+        )
+        + ";document.write('<a href=\"/not-a-link\">');</script>"
+    )
+    json_ld = (
+        '<script type="application/ld+json">'
+        + json.dumps({"@type": "ItemList", "itemListElement": list(range(400))})
+        + "</script>"
+    )
+    footer = "".join(
+        f'<a href="{href}">{icon}Enlace</a>'
+        for href in (
+            "/pages/aviso-de-privacidad",
+            "/policies/terms-of-service",
+            "/account/login",
+            "/cart",
+            "/search",
+            "https://www.facebook.com/farmaciasmacross",
+            "mailto:contacto@farmaciasmacross.com.mx",
+            "tel:+520000000000",
+            "#MainContent",
+        )
+    )
+    return (
+        "<!doctype html><html lang=\"es\"><head><meta charset=\"utf-8\">"
+        + "".join(
+            f'<link rel="preload" href="//cdn.shopify.com/s/{i}.css" as="style">'
+            for i in range(20)
+        )
+        + script * 6
+        + json_ld
+        + "</head><body><header><nav>"
+        + f'<ul class="mega-menu">{menu}</ul></nav></header>'
+        + f'<main id="MainContent"><div class="grid">{products}</div></main>'
+        + f"<footer>{footer}</footer></body></html>"
+    )
+
+
+def load_pages() -> Tuple[List[Tuple[str, str]], str]:
+    """
+    Load the fixtures, or a synthetic page if there are none.
+
+    Returns:
+        ([(page URL, HTML)], description of the source).
+    """
+    paths = sorted(FIXTURES_DIR.glob("*.html")) if FIXTURES_DIR.exists() else []
+    if paths:
+        pages = []
+        for path in paths:
+            slug = "" if path.stem == "home" else path.stem.replace("_", "/")
+            pages.append((f"{BASE_URL}/{slug}".rstrip("/"), path.read_text("utf-8")))
+        return pages, f"{len(paths)} fixtures from {FIXTURES_DIR}"
+    pages = [
+        (f"{BASE_URL}/collections/coleccion-{seed}", synthetic_theme_page(seed))
+        for seed in range(5)
+    ]
+    return pages, "5 synthetic theme pages (no fixtures saved)"
+
+
+def benchmark(
+    extract: Callable[[str, str], List[str]],
+    pages: List[Tuple[str, str]],
+    rounds: int,
+) -> Tuple[float, Dict[str, List[str]]]:
+    """
+    Time an extractor over all pages.
+
+    Args:
+        extract: Function taking (html, url) and returning links.
+        pages: (page URL, HTML) pairs.
+        rounds: Passes over the pages; the fastest is reported.
+
+    Returns:
+        (seconds per page, links extracted per page URL).
+    """
+    best = float("inf")
+    links: Dict[str, List[str]] = {}
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for url, html in pages:
+            links[url] = extract(html, url)
+        best = min(best, time.perf_counter() - started)
+    return best / len(pages), links
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark SiteCrawler link extraction against BeautifulSoup"
+    )
+    parser.add_argument(
+        "--save",
+        type=int,
+        default=0,
+        metavar="N",
+        help="First save N pages from crawl_results.json as fixtures",
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=5, help="Timing passes (default: 5)"
+    )
+    args = parser.parse_args()
+
+    if args.save:
+        save_fixtures(args.save)
+
+    pages, source = load_pages()
+    size = sum(len(html) for _, html in pages) / len(pages) / 1024
+    print(f"Pages: {source}, {size:.0f} KB on average\n")
+
+    crawler = SiteCrawler(BASE_URL)
+    current, links = benchmark(crawler._extract_links, pages, args.rounds)
+    print(f"  extract_hrefs:  {current * 1000:8.2f} ms/page")
+    if not HAS_BS4:
+        print("  BeautifulSoup:  not installed, skipped")
+        return
+
+    legacy, legacy_links = benchmark(
+        lambda html, url: legacy_extract_links(crawler, html, url), pages, args.rounds
+    )
+    print(f"  BeautifulSoup:  {legacy * 1000:8.2f} ms/page")
+    print(f"\n  Speedup: {legacy / current:.1f}x")
+    same = links == legacy_links
+    print(f"  Same links as BeautifulSoup: {'yes' if same else 'NO'}")
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,414 @@
+"""Shared on-disk HTTP response cache for the storefront audit scripts.
+
+Responses to GET requests are stored in one SQLite file keyed by URL, with
+zlib-compressed bodies and their ETag/Last-Modified validators. Within the
+TTL a cached response is served without any request; after it the request
+is revalidated with If-None-Match/If-Modified-Since, so a re-run of the
+crawl or the on-page analysis mostly gets cache hits or 304s instead of
+full page downloads.
+
+The cache plugs into httpx as a transport, so existing clients only change
+how they are built:
+
+    client = cached_client(timeout=30.0, follow_redirects=True)
+    client = cached_async_client(timeout=30.0, follow_redirects=True)
+
+Served responses carry ``response.extensions["http_cache"]``: "hit",
+"revalidated" (304) or "miss". Cache-Control is deliberately ignored: the
+audit wants repeatable snapshots of the storefront, and the TTL is the only
+freshness rule.
+
+Cached responses are read into memory whole. Requests whose body is consumed
+incrementally (large sitemaps) bypass the cache with a request extension:
+
+    client.stream("GET", url, extensions=no_cache())
+
+Environment:
+    HTTP_CACHE=off       Disable the cache.
+    HTTP_CACHE_TTL       Seconds a response is served without revalidation
+                         (default: 86400; 0 always revalidates).
+    HTTP_CACHE_PATH      SQLite file (default: docs/shopify-analysis/http_cache.sqlite).
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+DEFAULT_CACHE_PATH = (
+    Path(__file__).parent.parent.parent / "docs" / "shopify-analysis" / "http_cache.sqlite"
+)
+DEFAULT_TTL = 24 * 3600.0
+
+# OK and permanent redirects; anything else is always fetched
+CACHEABLE_STATUSES = {200, 301, 308}
+
+# Headers describing the transfer, not the (decoded) body that is stored
+_TRANSFER_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL
+)
+"""
+
+
+@dataclass
+class CachedResponse:
+    """A stored response."""
+
+    url: str
+    status: int
+    headers: List[Tuple[str, str]]
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+    def to_response(self, request: httpx.Request, source: str) -> httpx.Response:
+        """
+        Rebuild an httpx response for a request.
+
+        Args:
+            request: Request being answered.
+            source: Value of the "http_cache" response extension.
+
+        Returns:
+            Response with the stored status, headers and body.
+        """
+        return httpx.Response(
+            self.status,
+            headers=self.headers,
+            content=self.body,
+            request=request,
+            extensions={"http_cache": source},
+        )
+
+
+class HttpCache:
+    """SQLite response store, shared by threads and async tasks."""
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH, ttl: float = DEFAULT_TTL):
+        """
+        Open (or create) a cache file.
+
+        Args:
+            path: SQLite file.
+            ttl: Seconds a response is served without revalidation.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.stats: Dict[str, int] = {"hit": 0, "revalidated": 0, "miss": 0}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(_SCHEMA)
+        self._db.commit()
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """
+        Look up the stored response for a URL.
+
+        Args:
+            url: Request URL.
+
+        Returns:
+            CachedResponse or None.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT status, headers, body, etag, last_modified, stored_at "
+                "FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        status, headers, body, etag, last_modified, stored_at = row
+        return CachedResponse(
+            url=url,
+            status=status,
+            headers=[tuple(pair) for pair in json.loads(headers)],
+            body=zlib.decompress(body),
+            etag=etag,
+            last_modified=last_modified,
+            stored_at=stored_at,
+        )
+
+    def put(self, url: str, response: httpx.Response, body: bytes) -> CachedResponse:
+        """
+        Store a response.
+
+        Args:
+            url: Request URL.
+            response: Response (headers and status).
+            body: Decoded response body.
+
+        Returns:
+            The stored entry.
+        """
+        entry = CachedResponse(
+            url=url,
+            status=response.status_code,
+            headers=[
+                (name, value)
+                for name, value in response.headers.items()
+                if name.lower() not in _TRANSFER_HEADERS
+            ],
+            body=body,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            stored_at=time.time(),
+        )
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    entry.status,
+                    json.dumps(entry.headers),
+                    zlib.compress(body, 6),
+                    entry.etag,
+                    entry.last_modified,
+                    entry.stored_at,
+                ),
+            )
+            self._db.commit()
+        return entry
+
+    def touch(self, entry: CachedResponse) -> None:
+        """
+        Mark a stored response as fresh again (after a 304).
+
+        Args:
+            entry: Revalidated entry.
+        """
+        entry.stored_at = time.time()
+        with self._lock:
+            self._db.execute(
+                "UPDATE responses SET stored_at = ? WHERE url = ?",
+                (entry.stored_at, entry.url),
+            )
+            self._db.commit()
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """Whether an entry may be served without revalidation."""
+        return time.time() - entry.stored_at < self.ttl
+
+    def summary(self) -> str:
+        """Return a one-line summary of this run's cache use."""
+        return (
+            f"HTTP cache: {self.stats['hit']} hits, "
+            f"{self.stats['revalidated']} revalidated (304), "
+            f"{self.stats['miss']} downloaded"
+        )
+
+    def close(self) -> None:
+        """Close the cache file."""
+        with self._lock:
+            self._db.close()
+
+    def _lookup(self, request: httpx.Request) -> Tuple[Optional[CachedResponse], bool]:
+        """
+        Find the entry for a request and add its validators to the request.
+
+        Args:
+            request: Outgoing GET request.
+
+        Returns:
+            (entry or None, whether it is fresh).
+        """
+        entry = self.get(str(request.url))
+        if entry is None:
+            return None, False
+        if self.is_fresh(entry):
+            return entry, True
+        if entry.etag:
+            request.headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            request.headers["If-Modified-Since"] = entry.last_modified
+        return entry, False
+
+    def _count(self, source: str) -> None:
+        with self._lock:
+            self.stats[source] += 1
+
+
+def no_cache() -> Dict[str, str]:
+    """Return request extensions sending a request around the cache."""
+    return {"http_cache": "bypass"}
+
+
+def _bypasses_cache(request: httpx.Request) -> bool:
+    """Whether a request is sent without the cache."""
+    return request.method != "GET" or request.extensions.get("http_cache") == "bypass"
+
+
+class CachingTransport(httpx.BaseTransport):
+    """httpx transport answering GET requests from an HttpCache."""
+
+    def __init__(self, cache: HttpCache, transport: Optional[httpx.BaseTransport] = None):
+        """
+        Wrap a transport.
+
+        Args:
+            cache: Response cache.
+            transport: Transport sending the requests (default: httpx.HTTPTransport).
+        """
+        self.cache = cache
+        self._transport = transport or httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Serve a request from the cache or the network."""
+        if _bypasses_cache(request):
+            return self._transport.handle_request(request)
+        entry, fresh = self.cache._lookup(request)
+        if entry is not None and fresh:
+            self.cache._count("hit")
+            return entry.to_response(request, "hit")
+
+        response = self._transport.handle_request(request)
+        if response.status_code == 304 and entry is not None:
+            response.close()
+            self.cache.touch(entry)
+            self.cache._count("revalidated")
+            return entry.to_response(request, "revalidated")
+        self.cache._count("miss")
+        if response.status_code not in CACHEABLE_STATUSES:
+            return response
+        try:
+            body = response.read()
+        finally:
+            response.close()
+        return self.cache.put(str(request.url), response, body).to_response(request, "miss")
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self._transport.close()
+
+
+class AsyncCachingTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of CachingTransport."""
+
+    def __init__(
+        self, cache: HttpCache, transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Wrap a transport.
+
+        Args:
+            cache: Response cache.
+            transport: Transport sending the requests (default: httpx.AsyncHTTPTransport).
+        """
+        self.cache = cache
+        self._transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Serve a request from the cache or the network.
+
+        SQLite access and (de)compression run in a worker thread, so cache
+        work does not stall the other requests of the event loop.
+        """
+        if _bypasses_cache(request):
+            return await self._transport.handle_async_request(request)
+        entry, fresh = await asyncio.to_thread(self.cache._lookup, request)
+        if entry is not None and fresh:
+            self.cache._count("hit")
+            return entry.to_response(request, "hit")
+
+        response = await self._transport.handle_async_request(request)
+        if response.status_code == 304 and entry is not None:
+            await response.aclose()
+            await asyncio.to_thread(self.cache.touch, entry)
+            self.cache._count("revalidated")
+            return entry.to_response(request, "revalidated")
+        self.cache._count("miss")
+        if response.status_code not in CACHEABLE_STATUSES:
+            return response
+        try:
+            body = await response.aread()
+        finally:
+            await response.aclose()
+        entry = await asyncio.to_thread(
+            self.cache.put, str(request.url), response, body
+        )
+        return entry.to_response(request, "miss")
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self._transport.aclose()
+
+
+_shared_cache: Optional[HttpCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_cache() -> Optional[HttpCache]:
+    """
+    Return the cache shared by the audit scripts, configured from the environment.
+
+    Returns:
+        HttpCache, or None if HTTP_CACHE=off.
+    """
+    global _shared_cache
+    if os.getenv("HTTP_CACHE", "").lower() in ("0", "off", "false", "no"):
+        return None
+    with _shared_lock:
+        if _shared_cache is None:
+            path = os.getenv("HTTP_CACHE_PATH")
+            _shared_cache = HttpCache(
+                Path(path) if path else DEFAULT_CACHE_PATH,
+                ttl=float(os.getenv("HTTP_CACHE_TTL", DEFAULT_TTL)),
+            )
+        return _shared_cache
+
+
+def cached_client(cache: Optional[HttpCache] = None, **kwargs: Any) -> httpx.Client:
+    """
+    Build an httpx.Client whose GET requests go through the cache.
+
+    Args:
+        cache: Cache to use (default: get_cache(); none if disabled).
+        **kwargs: httpx.Client arguments.
+
+    Returns:
+        httpx.Client.
+    """
+    cache = cache or get_cache()
+    if cache is not None:
+        kwargs["transport"] = CachingTransport(cache, kwargs.get("transport"))
+    return httpx.Client(**kwargs)
+
+
+def cached_async_client(
+    cache: Optional[HttpCache] = None, **kwargs: Any
+) -> httpx.AsyncClient:
+    """
+    Build an httpx.AsyncClient whose GET requests go through the cache.
+
+    Args:
+        cache: Cache to use (default: get_cache(); none if disabled).
+        **kwargs: httpx.AsyncClient arguments.
+
+    Returns:
+        httpx.AsyncClient.
+    """
+    cache = cache or get_cache()
+    if cache is not None:
+        kwargs["transport"] = AsyncCachingTransport(cache, kwargs.get("transport"))
+    return httpx.AsyncClient(**kwargs)
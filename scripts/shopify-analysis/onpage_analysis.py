@@ -9,13 +9,15 @@ from urllib.parse import urlparse
 import httpx
 from bs4 import BeautifulSoup
 
+from http_cache import cached_client, get_cache
+
 
 class OnPageAnalyzer:
     """Analyzer for on-page technical elements."""
 
     def __init__(self):
         """Initialize analyzer."""
-        self.session = httpx.Client(
+        self.session = cached_client(
             timeout=30.0,
             follow_redirects=True,
             headers={
@@ -300,6 +302,9 @@ def main():
         json.dump(results, f, indent=2, ensure_ascii=False)
     
     print(f"✓ Results saved to: {output_path}")
+    cache = get_cache()
+    if cache is not None:
+        print(f"  {cache.summary()}")
     
     return results
 
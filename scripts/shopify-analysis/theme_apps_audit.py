@@ -5,8 +5,6 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional
 
-import httpx
-
 try:
     from bs4 import BeautifulSoup
     HAS_BS4 = True
@@ -14,6 +12,7 @@ except ImportError:
     HAS_BS4 = False
 
 from auth import create_graphql_client, execute_graphql_query
+from http_cache import cached_client
 from query_apps import query_installed_apps, format_apps_data
 from query_theme import query_theme_info, format_theme_data
 
@@ -40,7 +39,8 @@ def analyze_page_scripts(url: str) -> Dict:
         Dictionary containing script analysis.
     """
     try:
-        response = httpx.get(url, timeout=30.0, follow_redirects=True)
+        with cached_client(timeout=30.0, follow_redirects=True) as client:
+            response = client.get(url)
         response.raise_for_status()
         html_content = response.text
         
@@ -0,0 +1,10 @@
+"""Make the standalone scripts importable the way they import each other."""
+
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+
+for path in (SCRIPTS_DIR, SCRIPTS_DIR / "shopify-analysis"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
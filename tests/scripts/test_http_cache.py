@@ -0,0 +1,98 @@
+"""Tests for the HTTP response cache (scripts/shopify-analysis/http_cache.py)."""
+
+import asyncio
+from pathlib import Path
+
+import httpx
+from http_cache import HttpCache, cached_async_client, cached_client, no_cache
+
+URL = "https://shop.example.com/page"
+
+
+class Origin:
+    """Mock origin answering with an ETag and honouring If-None-Match."""
+
+    def __init__(self, status: int = 200):
+        self.status = status
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            self.status, headers={"ETag": '"v1"'}, text=f"body {len(self.requests)}"
+        )
+
+
+def _client(cache: HttpCache, origin: Origin) -> httpx.Client:
+    return cached_client(cache, transport=httpx.MockTransport(origin))
+
+
+def test_hit_within_ttl(tmp_path: Path) -> None:
+    cache = HttpCache(tmp_path / "cache.sqlite")
+    origin = Origin()
+    with _client(cache, origin) as client:
+        first = client.get(URL)
+        second = client.get(URL)
+
+    assert first.extensions["http_cache"] == "miss"
+    assert second.extensions["http_cache"] == "hit"
+    assert second.text == first.text == "body 1"
+    assert len(origin.requests) == 1
+    assert cache.stats == {"hit": 1, "revalidated": 0, "miss": 1}
+
+
+def test_expired_entry_is_revalidated_with_its_etag(tmp_path: Path) -> None:
+    cache = HttpCache(tmp_path / "cache.sqlite", ttl=0)
+    origin = Origin()
+    with _client(cache, origin) as client:
+        client.get(URL)
+        response = client.get(URL)
+
+    assert response.extensions["http_cache"] == "revalidated"
+    assert response.status_code == 200
+    assert response.text == "body 1"
+    assert origin.requests[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_uncacheable_status_passes_through(tmp_path: Path) -> None:
+    cache = HttpCache(tmp_path / "cache.sqlite")
+    origin = Origin(status=404)
+    with _client(cache, origin) as client:
+        first = client.get(URL)
+        second = client.get(URL)
+
+    assert first.status_code == second.status_code == 404
+    assert second.text == "body 2"
+    assert len(origin.requests) == 2
+    assert "If-None-Match" not in origin.requests[1].headers
+    assert cache.get(URL) is None
+
+
+def test_no_cache_bypasses_the_store(tmp_path: Path) -> None:
+    cache = HttpCache(tmp_path / "cache.sqlite")
+    origin = Origin()
+    with _client(cache, origin) as client:
+        response = client.get(URL, extensions=no_cache())
+
+    assert "http_cache" not in response.extensions
+    assert cache.get(URL) is None
+
+
+def test_async_client_shares_the_store(tmp_path: Path) -> None:
+    cache = HttpCache(tmp_path / "cache.sqlite")
+    origin = Origin()
+
+    async def fetch_twice() -> list[httpx.Response]:
+        transport = httpx.MockTransport(origin)
+        async with cached_async_client(cache, transport=transport) as client:
+            return [await client.get(URL), await client.get(URL)]
+
+    first, second = asyncio.run(fetch_twice())
+
+    assert [first.extensions["http_cache"], second.extensions["http_cache"]] == [
+        "miss",
+        "hit",
+    ]
+    assert len(origin.requests) == 1
@@ -0,0 +1,128 @@
+"""Tests for the bulk importer (scripts/import_to_jira.py) against the stub."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from import_to_jira import (
+    BulkImporter,
+    FieldConfig,
+    KeyMap,
+    PlannedIssue,
+    recover_in_doubt,
+)
+from jira_client import JiraClient
+from jira_import_journal import ImportJournal
+from jira_stub_server import StubServer, start_stub_server
+
+PLAN = [
+    PlannedIssue("E-1", "epic", "Epic one"),
+    PlannedIssue("E-2", "epic", "Epic two"),
+    *(PlannedIssue(f"S-{i}", "story", f"Story {i}", parent="E-1") for i in range(6)),
+    *(PlannedIssue(f"T-{i}", "task", f"Task {i}", parent="S-0") for i in range(3)),
+]
+
+
+@pytest.fixture
+def stub() -> Iterator[StubServer]:
+    server = start_stub_server()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def rate_limited_stub() -> Iterator[StubServer]:
+    server = start_stub_server(rate_limit_every=2)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _client(server: StubServer) -> JiraClient:
+    return JiraClient(server.url, personal_token="test", rate=0)
+
+
+def test_children_of_an_orphan_fail_too(stub: StubServer, tmp_path: Path) -> None:
+    plan = [
+        PlannedIssue("E-1", "epic", "Epic"),
+        PlannedIssue("X-1", "story", "Orphan story", parent="E-9"),
+        PlannedIssue("X-1-1", "task", "Task of the orphan", parent="X-1"),
+        PlannedIssue("X-1-1-1", "task", "Below the task", parent="X-1-1"),
+    ]
+    importer = BulkImporter(_client(stub), KeyMap(tmp_path / "keys.json"), "SD")
+
+    report = importer.run(plan)
+
+    assert list(report.created) == ["E-1"]
+    assert report.failed == {
+        "X-1": "parent E-9 is not in the plan",
+        "X-1-1": "parent X-1 was not created",
+        "X-1-1-1": "parent X-1-1 was not created",
+    }
+
+
+def test_import_retries_rate_limits_and_reruns_skip_everything(
+    rate_limited_stub: StubServer, tmp_path: Path
+) -> None:
+    client = _client(rate_limited_stub)
+    key_map = KeyMap(tmp_path / "keys.json")
+
+    report = BulkImporter(client, key_map, "SD", batch_size=3).run(PLAN)
+    key_map.save()
+
+    state = rate_limited_stub.stub.state()
+    assert report.failed == {}
+    assert set(report.created) == {issue.key for issue in PLAN}
+    assert len(state["issues"]) == len(PLAN)
+    assert state["counters"]["rate_limited"] > 0
+    by_key = {issue["key"]: issue["fields"] for issue in state["issues"]}
+    for planned in PLAN:
+        fields = by_key[report.created[planned.key]]
+        assert fields["summary"] == planned.summary
+        if planned.parent:
+            assert fields["parent"] == {"key": report.created[planned.parent]}
+
+    rerun = BulkImporter(client, KeyMap(tmp_path / "keys.json"), "SD").run(PLAN)
+
+    assert rerun.skipped == len(PLAN)
+    assert rerun.created == {}
+    assert rerun.requests == 0
+    assert len(rate_limited_stub.stub.state()["issues"]) == len(PLAN)
+
+
+def test_resume_after_crash_creates_nothing_twice(
+    stub: StubServer, tmp_path: Path
+) -> None:
+    client = _client(stub)
+    journal_path = tmp_path / "journal.jsonl"
+    with ImportJournal(journal_path) as journal:
+        BulkImporter(client, KeyMap(tmp_path / "keys.json", journal), "SD").run(PLAN)
+        # A request for E-3 was journaled but the process died before sending it
+        journal.request(["E-3"])
+
+    # Crash: no key map snapshot, the answers to all but the first request are
+    # lost and the last record is torn mid-line
+    lines = journal_path.read_text(encoding="utf-8").splitlines(keepends=True)
+    created = [line for line in lines if '"created"' in line]
+    kept = [line for line in lines if '"created"' not in line or line == created[0]]
+    journal_path.write_text(
+        "".join(kept) + created[-1][: len(created[-1]) // 2], encoding="utf-8"
+    )
+    plan = [*PLAN, PlannedIssue("E-3", "epic", "Epic three")]
+
+    with ImportJournal(journal_path) as journal:
+        key_map = KeyMap(tmp_path / "keys.json", journal)
+        in_doubt = set(key_map.in_doubt)
+        assert in_doubt == {i.key for i in plan if i.key not in key_map}
+        found, retry = recover_in_doubt(client, key_map, plan, "SD", FieldConfig())
+        report = BulkImporter(client, key_map, "SD").run(plan)
+
+    assert (found, retry) == (len(in_doubt) - 1, 1)
+    assert found > 1
+    assert list(report.created) == ["E-3"]
+    assert len(stub.stub.state()["issues"]) == len(plan)
+    # Records appended after the torn line replay whole
+    state = ImportJournal(journal_path).replay()
+    assert set(state.created) == {issue.key for issue in plan}
+    assert state.in_doubt == {}
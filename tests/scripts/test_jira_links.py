@@ -0,0 +1,26 @@
+"""Tests for link collection against an export (scripts/jira_links.py)."""
+
+from pathlib import Path
+
+from import_to_jira import KeyMap
+from jira_links import ExistingLinks, PlannedLink, resolve_links
+from parse_jira_xml import Issue
+
+
+def test_epic_link_by_name_counts_as_existing(tmp_path: Path) -> None:
+    key_map = KeyMap(tmp_path / "key_map.json")
+    key_map.update({"E-1": "SD-42", "S-1": "SD-43", "S-2": "SD-44"})
+    # The story comes before its epic, as in a key-ordered export
+    existing = ExistingLinks(
+        [
+            Issue(key="SD-43", issue_type="Story", epic_link="Dominar n8n"),
+            Issue(key="SD-44", issue_type="Story"),
+            Issue(key="SD-42", summary="Dominar n8n", issue_type="Epic"),
+        ]
+    )
+    links = [PlannedLink("epic", "S-1", "E-1"), PlannedLink("epic", "S-2", "E-1")]
+
+    pending, report = resolve_links(links, key_map, existing)
+
+    assert report.existing == 1
+    assert pending == [(links[1], "SD-44", "SD-42")]
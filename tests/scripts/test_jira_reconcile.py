@@ -0,0 +1,48 @@
+"""Tests for plan/export reconciliation (scripts/jira_reconcile.py)."""
+
+from pathlib import Path
+
+from import_to_jira import KeyMap, PlannedIssue
+from jira_reconcile import reconcile
+from parse_jira_xml import Issue
+
+EPIC_NAME = "Dominar n8n + AI Workflows"
+
+PLAN = [
+    PlannedIssue("E-1", "epic", EPIC_NAME),
+    PlannedIssue("E-2", "epic", "Other epic"),
+    PlannedIssue("S-1", "story", "Build the workflow", parent="E-1"),
+]
+
+
+def _key_map(tmp_path: Path) -> KeyMap:
+    key_map = KeyMap(tmp_path / "key_map.json")
+    key_map.update({"E-1": "SD-42", "E-2": "SD-50", "S-1": "SD-43"})
+    return key_map
+
+
+def _export(story_epic_link: str) -> list[Issue]:
+    return [
+        Issue(key="SD-42", summary=EPIC_NAME, issue_type="Epic"),
+        Issue(key="SD-50", summary="Other epic", issue_type="Epic"),
+        Issue(
+            key="SD-43",
+            summary="Build the workflow",
+            issue_type="Story",
+            epic_link=story_epic_link,
+        ),
+    ]
+
+
+def test_epic_link_by_name_matches_planned_epic(tmp_path: Path) -> None:
+    result = reconcile(PLAN, _export(EPIC_NAME), _key_map(tmp_path))
+
+    assert result.operations == []
+
+
+def test_move_reports_old_epic_by_key(tmp_path: Path) -> None:
+    result = reconcile(PLAN, _export("Other epic"), _key_map(tmp_path))
+
+    [move] = result.operations
+    assert move.op == "move"
+    assert move.changes == {"parent": ["SD-50", "SD-42"]}
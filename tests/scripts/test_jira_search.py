@@ -0,0 +1,43 @@
+"""Tests for the search index tokenizer (scripts/jira_search.py)."""
+
+import pytest
+from jira_search import analyze, stem
+
+
+@pytest.mark.parametrize(
+    ("singular", "plural"),
+    [
+        ("tienda", "tiendas"),
+        ("producto", "productos"),
+        ("status", "statuses"),
+        ("class", "classes"),
+        ("process", "processes"),
+        ("accion", "acciones"),
+        ("cliente", "clientes"),
+        ("story", "stories"),
+        ("code", "codes"),
+    ],
+)
+def test_singular_and_plural_share_a_stem(singular: str, plural: str) -> None:
+    assert stem(singular) == stem(plural)
+
+
+@pytest.mark.parametrize(
+    ("word", "inflection"),
+    [
+        ("process", "processing"),
+        ("plan", "planned"),
+        ("optimizacion", "optimizaciones"),
+    ],
+)
+def test_inflections_share_a_stem(word: str, inflection: str) -> None:
+    assert stem(word) == stem(inflection)
+
+
+def test_words_ending_in_ss_keep_their_ending() -> None:
+    assert stem("process") == "process"
+    assert stem("class") == "class"
+
+
+def test_analyze_folds_accents_and_drops_stop_words() -> None:
+    assert analyze("Optimización de las Tiendas") == ["optimiz", "tienda"]
@@ -0,0 +1,50 @@
+"""Tests for the Jira XML export parser (scripts/parse_jira_xml.py)."""
+
+from pathlib import Path
+
+import pytest
+from parse_jira_xml import (
+    iter_jira_xml,
+    organize_issues,
+    write_epics_markdown,
+    write_epics_markdown_split,
+)
+
+EXPORT = Path(__file__).resolve().parents[2] / "Jira (1).xml"
+
+
+def _render(
+    export: Path, output_dir: Path, *, workers: int, split: bool, full: bool
+) -> None:
+    organized = organize_issues(iter_jira_xml(export, full=full))
+    output_dir.mkdir()
+    if split:
+        write_epics_markdown_split(
+            organized, output_dir, "epics.md", "SD", "SUPP-DIGITAL", workers=workers
+        )
+    else:
+        with (output_dir / "epics.md").open("w", encoding="utf-8") as out:
+            write_epics_markdown(organized, out, "SD", "SUPP-DIGITAL", workers=workers)
+
+
+def _read_tree(root: Path) -> dict[str, bytes]:
+    return {
+        str(path.relative_to(root)): path.read_bytes()
+        for path in sorted(root.rglob("*"))
+        if path.is_file()
+    }
+
+
+@pytest.mark.skipif(not EXPORT.exists(), reason="bundled export not present")
+@pytest.mark.parametrize("full", [False, True])
+@pytest.mark.parametrize("split", [False, True])
+def test_parallel_rendering_matches_serial(
+    tmp_path: Path, *, split: bool, full: bool
+) -> None:
+    _render(EXPORT, tmp_path / "serial", workers=1, split=split, full=full)
+    _render(EXPORT, tmp_path / "parallel", workers=2, split=split, full=full)
+
+    serial = _read_tree(tmp_path / "serial")
+    parallel = _read_tree(tmp_path / "parallel")
+    assert len(serial) > (1 if split else 0)
+    assert parallel == serial
@@ -0,0 +1,158 @@
+"""Tests for the storefront crawler (scripts/shopify-analysis/url_crawler.py)."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+import url_crawler
+from bs4 import BeautifulSoup
+from url_crawler import SiteCrawler, UrlFingerprintSet, extract_hrefs
+
+BASE_URL = "https://shop.example.com"
+
+PAGES = {
+    "/": '<a href="/pages/bad">Bad</a> <a href="/collections/all">All</a>',
+    # urljoin() raises "Invalid IPv6 URL" on this href
+    "/pages/bad": '<a href="http://[x/">Broken</a>',
+    "/collections/all": '<a href="/products/a">A</a>',
+    "/products/a": "<p>Product</p>",
+}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/robots.txt":
+        return httpx.Response(200, text="User-agent: *\nAllow: /\n")
+    html = PAGES.get(request.url.path)
+    if html is None:
+        return httpx.Response(404)
+    return httpx.Response(200, html=f"<html><body>{html}</body></html>")
+
+
+@pytest.fixture
+def mock_site(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Serve PAGES to the async crawl engine without network or cache."""
+    monkeypatch.setenv("HTTP_CACHE", "off")
+    monkeypatch.setattr(
+        url_crawler,
+        "cached_async_client",
+        lambda **kwargs: httpx.AsyncClient(
+            transport=httpx.MockTransport(_handler), **kwargs
+        ),
+    )
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_crawl_async_survives_malformed_href(mock_site: None, concurrency: int) -> None:
+    crawler = SiteCrawler(BASE_URL, concurrency=concurrency, requests_per_second=0)
+
+    results = asyncio.run(asyncio.wait_for(crawler.crawl_async(), timeout=10))
+
+    assert f"{BASE_URL}/pages/bad" in crawler.visited_urls
+    assert results["category"] == [f"{BASE_URL}/collections/all"]
+    assert results["product"] == [f"{BASE_URL}/products/a"]
+
+
+def test_sitemaps_stay_on_crawled_host(monkeypatch: pytest.MonkeyPatch) -> None:
+    ns = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+    documents = {
+        "/robots.txt": f"User-agent: *\nAllow: /\nSitemap: {BASE_URL}/sitemap.xml\n",
+        "/sitemap.xml": (
+            f"<sitemapindex {ns}>"
+            f"<sitemap><loc>{BASE_URL}/sitemap_products_1.xml</loc></sitemap>"
+            "<sitemap><loc>https://other.example.com/sitemap.xml</loc></sitemap>"
+            "</sitemapindex>"
+        ),
+        "/sitemap_products_1.xml": (
+            f"<urlset {ns}><url><loc>{BASE_URL}/products/a</loc></url></urlset>"
+        ),
+    }
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        if request.url.host != "shop.example.com":
+            return httpx.Response(
+                200,
+                text=f"<urlset {ns}><url><loc>https://other.example.com/x</loc>"
+                "</url></urlset>",
+            )
+        text = documents.get(request.url.path)
+        return httpx.Response(404) if text is None else httpx.Response(200, text=text)
+
+    monkeypatch.setenv("HTTP_CACHE", "off")
+    monkeypatch.setattr(
+        url_crawler,
+        "cached_async_client",
+        lambda **kwargs: httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), **kwargs
+        ),
+    )
+    crawler = SiteCrawler(BASE_URL, requests_per_second=0, use_sitemaps=True)
+
+    results = asyncio.run(asyncio.wait_for(crawler.crawl_async(), timeout=10))
+
+    assert not [url for url in requested if "other.example.com" in url]
+    assert results["product"] == [f"{BASE_URL}/products/a"]
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        "<a href=\"/a\">A</a> <A HREF=/b>B</A> <a href='/c'>C</a>",
+        '<a href>Empty</a> <a href=>Empty</a> <a href="">Empty</a>',
+        '<a href="/first" href="/last">Duplicate</a>',
+        '<a href="/first"HREF="/last">Duplicate</a>',
+        '<a data-x=foo/href="/weird">Inside a bare value</a>',
+        '<a data-x=foo/href="/weird" href="/ok">Inside a bare value</a>',
+        '<a title="x href=/no">Inside a quoted value</a>',
+        '<a data-href="/no" x-href="/no" hrefx="/no">Other names</a>',
+        '<a/href="/slash"> <a\thref=/tab> <a href = "/spaced">',
+        '<a href=="/equals"> <a href="/trailing" / > <a href=/bare/>',
+        '<a title=\'say "hi" > there\' href="/quotes">',
+        '<a href="/q?a=1&amp;b=2">Entities</a>',
+        '<!-- <a href="/comment"> --> <script>"<a href=\'/js\'>"</script>',
+        '<abbr href="/no"> <a href="/after">',
+    ],
+)
+def test_extract_hrefs_matches_beautifulsoup(html: str) -> None:
+    soup = BeautifulSoup(html, "html.parser")
+    expected = [tag["href"] for tag in soup.find_all("a", href=True)]
+
+    assert extract_hrefs(html) == expected
+
+
+def test_fingerprint_set_grows_and_keeps_members() -> None:
+    urls = [f"{BASE_URL}/products/{i}" for i in range(200)]
+    fingerprints = UrlFingerprintSet(capacity=4)
+    initial_slots = len(fingerprints._slots)
+
+    for url in urls + urls[:50]:
+        fingerprints.add(url)
+
+    assert len(fingerprints) == len(urls)
+    assert len(fingerprints._slots) > initial_slots
+    assert len(fingerprints._slots) >= 2 * len(urls)
+    assert all(url in fingerprints for url in urls)
+    assert f"{BASE_URL}/products/200" not in fingerprints
+    assert None not in fingerprints
+
+
+# With max_urls=2 the crawl stops with discovered URLs left in the frontier
+@pytest.mark.parametrize("max_urls", [2, 120])
+def test_compact_crawl_matches_exact_crawl(
+    mock_site: None, tmp_path: Path, max_urls: int
+) -> None:
+    saved = {}
+    for compact in (False, True):
+        crawler = SiteCrawler(
+            BASE_URL, max_urls=max_urls, requests_per_second=0, compact=compact
+        )
+        results = asyncio.run(asyncio.wait_for(crawler.crawl_async(), timeout=10))
+        output = tmp_path / f"compact-{compact}.json"
+        crawler.save_results(output, results)
+        saved[compact] = json.loads(output.read_text(encoding="utf-8"))
+
+    assert isinstance(crawler.visited_urls, UrlFingerprintSet)
+    assert saved[True] == saved[False]